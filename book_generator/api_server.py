@@ -8,6 +8,7 @@ This module provides HTTP endpoints for the frontend to:
 """
 
 import asyncio
+import json
 import os
 import uuid
 import logging
@@ -16,14 +17,19 @@ from enum import Enum
 from typing import Optional
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 
 from .config import Config
 from .pipeline import generate_book
 from .job_store import JobStore
+from .job_events import JobEventBroker
+from .rate_limit import load_rate_limits_from_env, set_rate_limit_job
+from .job_executor import JobExecutor
+from .cancellation import JobCancelledError
+from .credentials import set_gemini_api_key
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -107,6 +113,7 @@ class GenerateRequest(BaseModel):
     tier: Tier = Field(Tier.DEEP_DIVE, description="Pricing tier: primer, deep_dive, or masterwork")
     writing_style: Optional[str] = Field(None, description="Writing style key: waitbutwhy, for_dummies, oreilly, textbook, practical")
     api_key: Optional[str] = Field(None, min_length=1, max_length=256, description="User-provided Gemini API key")
+    priority: int = Field(0, ge=0, le=10, description="Queue priority: higher runs first, FIFO within a priority")
 
     @field_validator("topic", "domain", "goal", "background", "focus", mode="before")
     @classmethod
@@ -160,7 +167,19 @@ class OutlineApprovalRequest(BaseModel):
 # =============================================================================
 
 DB_PATH = os.environ.get("JOB_STORE_DB", "data/jobs.db")
-job_store = JobStore(DB_PATH)
+job_events = JobEventBroker()
+job_store = JobStore(DB_PATH, events=job_events)
+
+# Seconds between SSE keep-alives; each one also re-checks SQLite for missed updates
+SSE_HEARTBEAT_SECONDS = 15
+
+_TERMINAL_STATUSES = {"completed", "failed"}
+
+# Job fields carried by progress events, used to detect updates the stream missed
+_EVENT_FIELDS = ("status", "progress", "current_stage", "message", "book_name", "pdf_path", "error")
+
+# Per-model quotas shared by all jobs, e.g. RATE_LIMITS='{"gemini-3-flash-preview": {"rpm": 1000}}'
+load_rate_limits_from_env()
 
 
 def _job_to_response(job: dict) -> JobStatusResponse:
@@ -189,8 +208,8 @@ async def run_generation(job_id: str):
     Run the book generation pipeline in the background.
     Updates job status in the SQLite store as it progresses.
     """
-    user_api_key = None
-    original_api_key = os.environ.get("GEMINI_API_KEY")
+    # Model calls made by this job share the process-wide quotas fairly with other jobs
+    set_rate_limit_job(job_id)
 
     try:
         job = job_store.get(job_id)
@@ -200,10 +219,10 @@ async def run_generation(job_id: str):
 
         request = job["request"]
 
-        # Set user-provided Gemini API key for this job
+        # Bind the user-provided Gemini key to this job only (concurrent jobs keep their own)
         user_api_key = request.get("api_key")
         if user_api_key:
-            os.environ["GEMINI_API_KEY"] = user_api_key
+            set_gemini_api_key(user_api_key)
 
         num_chapters = request.get("num_chapters") or 4
         writing_style = request.get("writing_style") or "waitbutwhy"
@@ -260,8 +279,9 @@ The book should speak the professional language of this domain.
         )
 
         # Progress callback: pipeline calls this at each stage transition
+        # Coalesced: bursts of stage updates become one write per interval
         async def on_progress(stage: str, progress: int, message: str):
-            job_store.update(
+            await job_store.update_progress(
                 job_id,
                 status=stage,
                 progress=progress,
@@ -271,15 +291,7 @@ The book should speak the professional language of this domain.
             logger.info(f"Job {job_id} progress: {stage} ({progress}%) - {message}")
 
         # Run the generation pipeline with progress reporting
-        try:
-            pdf_path = await generate_book(config, progress_callback=on_progress)
-        finally:
-            # Restore original API key (or remove if there wasn't one)
-            if user_api_key:
-                if original_api_key is not None:
-                    os.environ["GEMINI_API_KEY"] = original_api_key
-                else:
-                    os.environ.pop("GEMINI_API_KEY", None)
+        pdf_path = await generate_book(config, progress_callback=on_progress)
 
         if pdf_path:
             job_store.update(
@@ -301,14 +313,19 @@ The book should speak the professional language of this domain.
                 error="Pipeline returned None",
             )
 
+    except (JobCancelledError, asyncio.CancelledError) as e:
+        logger.info(f"Job {job_id} stopped after cancellation")
+        job_store.update(
+            job_id,
+            status=JobStatus.FAILED.value,
+            message="Cancelled by user",
+            error="Job cancelled",
+        )
+        if isinstance(e, asyncio.CancelledError):
+            raise
+
     except Exception as e:
         logger.exception(f"Job {job_id} failed with error: {e}")
-        # Restore original API key on failure
-        if user_api_key:
-            if original_api_key is not None:
-                os.environ["GEMINI_API_KEY"] = original_api_key
-            else:
-                os.environ.pop("GEMINI_API_KEY", None)
         job_store.update(
             job_id,
             status=JobStatus.FAILED.value,
@@ -317,6 +334,25 @@ The book should speak the professional language of this domain.
         )
 
 
+# Worker slots run jobs on their own event loop, away from the request loop
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "2"))
+job_executor = JobExecutor(run_generation, workers=JOB_WORKERS)
+
+
+@app.on_event("startup")
+async def resume_pending_jobs():
+    """Re-queue jobs that were accepted but never started before a restart."""
+    for job in job_store.list_by_status(JobStatus.PENDING.value):
+        job_executor.submit(job["job_id"], priority=job["request"].get("priority", 0))
+        logger.info(f"Re-queued pending job {job['job_id']}")
+
+
+@app.on_event("shutdown")
+def flush_job_progress():
+    """Write any coalesced progress updates that are still pending."""
+    job_store.flush()
+
+
 # =============================================================================
 # API Endpoints
 # =============================================================================
@@ -333,6 +369,8 @@ async def health():
     return {
         "status": "healthy",
         "total_jobs": job_store.count(),
+        "executor": job_executor.stats(),
+        "event_subscribers": job_events.subscriber_count(),
         "timestamp": datetime.utcnow().isoformat(),
     }
 
@@ -340,7 +378,6 @@ async def health():
 @app.post("/api/generate", response_model=GenerateResponse)
 async def create_generation_job(
     request: GenerateRequest,
-    background_tasks: BackgroundTasks,
     raw_request: Request,
 ):
     """
@@ -356,13 +393,17 @@ async def create_generation_job(
 
     logger.info(f"Created job {job_id} for topic: {request.topic}")
 
-    # Start generation in background
-    background_tasks.add_task(run_generation, job_id)
+    # Queue for the next free worker slot
+    ahead = job_executor.submit(job_id, priority=request.priority)
+
+    message = "Generation job created. Use the job ID to check progress."
+    if ahead:
+        message = f"Generation job queued behind {ahead} other job(s). Use the job ID to check progress."
 
     return GenerateResponse(
         job_id=job_id,
         status=JobStatus.PENDING,
-        message="Generation job created. Use the job ID to check progress."
+        message=message,
     )
 
 
@@ -380,6 +421,66 @@ async def get_job_status(job_id: str):
     return _job_to_response(job)
 
 
+def _sse(event: str, data: dict, event_id: int) -> str:
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@app.get("/api/generate/{job_id}/events")
+async def stream_job_events(job_id: str, raw_request: Request):
+    """
+    Stream job progress as server-sent events.
+
+    Sends a `snapshot` event with the full job status, then a `progress`
+    event with the changed fields and new log entries each time the job
+    reports progress. The stream ends after the job completes or fails.
+    If live events are missed, the job is re-read from the store and a
+    fresh snapshot is sent.
+    """
+    job = job_store.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def event_stream():
+        sub = job_events.subscribe(job_id)
+        try:
+            # Subscribe before reading, so nothing between the two is lost
+            snapshot = job_store.get(job_id)
+            event_id = 0
+            yield _sse("snapshot", _job_to_response(snapshot).model_dump(mode="json"), event_id)
+            seen = {k: snapshot.get(k) for k in _EVENT_FIELDS}
+
+            while seen["status"] not in _TERMINAL_STATUSES:
+                if await raw_request.is_disconnected():
+                    return
+                event = await sub.get(timeout=SSE_HEARTBEAT_SECONDS)
+                event_id += 1
+                if event is not None and not sub.overflowed:
+                    seen.update({k: v for k, v in event.items() if k in seen})
+                    yield _sse("progress", event, event_id)
+                    continue
+
+                # Idle or fell behind: fall back to the durable copy
+                current = job_store.get(job_id)
+                if current is None:
+                    return
+                if sub.overflowed or any(current.get(k) != v for k, v in seen.items()):
+                    sub.close()
+                    sub = job_events.subscribe(job_id)
+                    current = job_store.get(job_id)
+                    yield _sse("snapshot", _job_to_response(current).model_dump(mode="json"), event_id)
+                else:
+                    yield ": keep-alive\n\n"
+                seen = {k: current.get(k) for k in _EVENT_FIELDS}
+        finally:
+            sub.close()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/api/generate/{job_id}/download")
 async def download_book(job_id: str):
     """
@@ -460,8 +561,8 @@ async def cancel_job(job_id: str, raw_request: Request):
     """
     Cancel a pending or running job.
 
-    Note: This doesn't stop an already-running generation,
-    but marks it as cancelled.
+    Queued jobs are dropped before they start. Running jobs stop at the next
+    stage boundary or model call, so no further quota is spent on them.
     """
     _verify_secret(raw_request)
 
@@ -472,6 +573,9 @@ async def cancel_job(job_id: str, raw_request: Request):
     if job["status"] == JobStatus.COMPLETED.value:
         raise HTTPException(status_code=400, detail="Cannot cancel completed job")
 
+    state = job_executor.cancel(job_id)
+    logger.info(f"Cancelling job {job_id} ({state or 'not active'})")
+
     job_store.update(
         job_id,
         status=JobStatus.FAILED.value,
@@ -0,0 +1,51 @@
+"""
+Cooperative cancellation for book generation jobs.
+
+The job executor gives each job a CancellationToken and binds it to the
+job's context. The pipeline calls check_cancelled() between stages and
+before every model call, so a cancelled job stops spending quota at the
+next checkpoint.
+"""
+
+import threading
+import contextvars
+from typing import Optional
+
+
+class JobCancelledError(Exception):
+    """Raised at a checkpoint when the current job has been cancelled."""
+
+
+class CancellationToken:
+    """Thread-safe cancellation flag shared between the API and a running job."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise JobCancelledError("Job cancelled")
+
+
+_current_token: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    "cancellation_token", default=None
+)
+
+
+def set_cancellation_token(token: Optional[CancellationToken]) -> contextvars.Token:
+    """Bind token to the current context (and tasks spawned from it)."""
+    return _current_token.set(token)
+
+
+def check_cancelled() -> None:
+    """Raise JobCancelledError if the current job was cancelled. No-op outside jobs."""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
@@ -17,6 +17,7 @@ import urllib.error
 
 import synalinks
 
+from ..concurrency import AdaptiveLimiter, OVERLOAD_STATUS_CODES, is_overload_error
 from .models import (
     Claim,
     Source,
@@ -27,13 +28,19 @@ from .models import (
 logger = logging.getLogger(__name__)
 
 
-async def perplexity_search(query: str, max_results: int = 5) -> List[dict]:
+async def perplexity_search(
+    query: str,
+    max_results: int = 5,
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> List[dict]:
     """
     Search using Perplexity API.
 
     Args:
         query: Search query
         max_results: Maximum results to return
+        limiter: Optional limiter told about 429/5xx responses (which are
+            otherwise swallowed here and returned as no results)
 
     Returns:
         List of search result dicts with url, title, snippet
@@ -115,9 +122,13 @@ async def perplexity_search(query: str, max_results: int = 5) -> List[dict]:
 
     except urllib.error.HTTPError as e:
         logger.warning(f"Perplexity API error: {e.code} - {e.reason}")
+        if limiter is not None and e.code in OVERLOAD_STATUS_CODES:
+            limiter.record_overload()
         return []
     except Exception as e:
         logger.warning(f"Perplexity search failed: {e}")
+        if limiter is not None and is_overload_error(e):
+            limiter.record_overload()
         return []
 
 
@@ -177,6 +188,7 @@ Generate 2-3 queries per category. Make them specific enough to find the exact c
 async def search_for_sources(
     queries: SearchQueries,
     max_results_per_query: int = 5,
+    limiter: Optional[AdaptiveLimiter] = None,
 ) -> List[dict]:
     """
     Execute search queries to find potential sources using Perplexity API.
@@ -184,6 +196,7 @@ async def search_for_sources(
     Args:
         queries: SearchQueries object with query lists
         max_results_per_query: Max results per query
+        limiter: Optional limiter to report rate limiting to
 
     Returns:
         List of raw search result dicts
@@ -202,7 +215,7 @@ async def search_for_sources(
     for query in all_queries[:4]:
         try:
             logger.info(f"Searching: {query[:60]}...")
-            results = await perplexity_search(query, max_results_per_query)
+            results = await perplexity_search(query, max_results_per_query, limiter=limiter)
             all_results.extend(results)
 
             # Small delay between queries to avoid rate limiting
@@ -286,6 +299,7 @@ async def find_sources_for_claim(
     topic_context: str,
     language_model,
     search_func=None,
+    limiter: Optional[AdaptiveLimiter] = None,
 ) -> List[Source]:
     """
     Find potential sources for a single claim.
@@ -295,6 +309,7 @@ async def find_sources_for_claim(
         topic_context: Book topic for context
         language_model: Synalinks language model
         search_func: Optional custom search function
+        limiter: Optional limiter to report rate limiting to
 
     Returns:
         List of potential Source objects
@@ -312,7 +327,7 @@ async def find_sources_for_claim(
     if search_func:
         raw_results = await search_func(queries)
     else:
-        raw_results = await search_for_sources(queries)
+        raw_results = await search_for_sources(queries, limiter=limiter)
 
     # Parse results to Source objects
     sources = []
@@ -343,7 +358,7 @@ async def find_sources_for_claims(
         topic_context: Book topic
         language_model: Synalinks language model
         search_func: Optional custom search function
-        max_concurrent: Max concurrent search operations
+        max_concurrent: Initial concurrency window (adapts to 429/5xx and latency)
 
     Returns:
         Tuple of (claim_id -> source_ids mapping, all unique sources)
@@ -351,16 +366,17 @@ async def find_sources_for_claims(
     claim_to_sources = {}
     all_sources = []
 
-    # Process in batches to avoid rate limiting
-    semaphore = asyncio.Semaphore(max_concurrent)
+    # Adaptive window: grows while searches stay fast, halves on rate limiting
+    limiter = AdaptiveLimiter("sources", initial=max_concurrent, max_limit=max_concurrent * 4)
 
     async def find_with_limit(claim):
-        async with semaphore:
+        async with limiter.slot():
             sources = await find_sources_for_claim(
                 claim=claim,
                 topic_context=topic_context,
                 language_model=language_model,
                 search_func=search_func,
+                limiter=limiter,
             )
             return claim.id, sources
 
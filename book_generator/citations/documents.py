@@ -2,7 +2,8 @@
 Document downloading and processing for citation verification.
 
 Handles downloading PDFs/web pages and chunking them into
-passages for semantic search and verification.
+passages for semantic search and verification. PDF text is extracted
+page by page in the shared PDF worker processes (see pdf_text.py).
 """
 
 import logging
@@ -13,6 +14,7 @@ from typing import List, Optional
 import urllib.request
 import urllib.error
 
+from ..pdf_text import extract_page_batch, iter_pdf_pages
 from .models import Source, Passage
 
 logger = logging.getLogger(__name__)
@@ -84,7 +86,10 @@ async def download_source(source: Source, output_dir: str) -> Optional[str]:
 
 def extract_text_from_pdf(pdf_path: str) -> List[dict]:
     """
-    Extract text from a PDF file with page numbers.
+    Extract text from a PDF file with page numbers (blocking).
+
+    Async callers should stream pages with iter_pdf_pages() instead,
+    which runs the extraction in worker processes.
 
     Args:
         pdf_path: Path to PDF file
@@ -93,26 +98,13 @@ def extract_text_from_pdf(pdf_path: str) -> List[dict]:
         List of dicts with 'text' and 'page' keys
     """
     try:
-        import fitz  # PyMuPDF
+        pages, _ = extract_page_batch(pdf_path, 0, max_pages=None)
+        return pages
     except ImportError:
-        logger.warning("PyMuPDF not installed. Cannot extract PDF text.")
-        return []
-
-    pages = []
-    try:
-        doc = fitz.open(pdf_path)
-        for page_num, page in enumerate(doc, start=1):
-            text = page.get_text()
-            if text.strip():
-                pages.append({
-                    "text": text.strip(),
-                    "page": page_num
-                })
-        doc.close()
+        logger.warning("Neither PyMuPDF nor pdfminer.six installed. Cannot extract PDF text.")
     except Exception as e:
         logger.warning(f"Failed to extract PDF text: {e}")
-
-    return pages
+    return []
 
 
 def extract_text_from_html(html_path: str) -> List[dict]:
@@ -246,40 +238,49 @@ async def process_source_to_passages(
     # Update source with path
     source.pdf_path = file_path
 
-    # Extract text based on file type
-    if file_path.endswith('.pdf'):
-        pages = extract_text_from_pdf(file_path)
-    else:
-        pages = extract_text_from_html(file_path)
-
-    if not pages:
-        logger.warning(f"No text extracted from source: {source.id}")
-        return []
-
-    # Chunk each page
+    # Chunk each page as it is extracted
     passages = []
     chunk_index = 0
 
-    for page_data in pages:
-        chunks = chunk_text(
-            text=page_data["text"],
-            page_number=page_data["page"],
-        )
-
-        for chunk in chunks:
-            passage = Passage(
-                id=f"{source.id}_c{chunk_index}",
-                content=chunk["text"],
-                source_id=source.id,
-                page_number=chunk["page"],
+    try:
+        async for page_data in _iter_source_pages(file_path):
+            chunks = chunk_text(
+                text=page_data["text"],
+                page_number=page_data["page"],
             )
-            passages.append(passage)
-            chunk_index += 1
+
+            for chunk in chunks:
+                passage = Passage(
+                    id=f"{source.id}_c{chunk_index}",
+                    content=chunk["text"],
+                    source_id=source.id,
+                    page_number=chunk["page"],
+                )
+                passages.append(passage)
+                chunk_index += 1
+    except ImportError:
+        logger.warning("Neither PyMuPDF nor pdfminer.six installed. Cannot extract PDF text.")
+    except Exception as e:
+        logger.warning(f"Failed to extract text from source {source.id}: {e}")
+
+    if not passages:
+        logger.warning(f"No text extracted from source: {source.id}")
+        return []
 
     logger.info(f"Created {len(passages)} passages from source {source.id}")
     return passages
 
 
+async def _iter_source_pages(file_path: str):
+    """Pages of a downloaded source; PDFs are streamed from the extraction workers."""
+    if file_path.endswith('.pdf'):
+        async for page in iter_pdf_pages(file_path):
+            yield page
+    else:
+        for page in extract_text_from_html(file_path):
+            yield page
+
+
 def compute_content_hash(text: str) -> str:
     """Compute hash of text content for deduplication."""
     normalized = re.sub(r'\s+', ' ', text.lower().strip())
@@ -17,7 +17,11 @@ import asyncio
 
 from .models import Claim, VerifiedCitation
 from .claim_planning import plan_all_subsection_claims, SubsectionClaimPlan
-from .verification import verify_all_claims
+from .verification import (
+    verify_all_claims,
+    read_verification_journal,
+    compact_verification_results,
+)
 from .injection import remove_unverified_claims_from_outline
 from ..utils import save_json_to_file, save_to_file, load_json_from_file, output_exists
 
@@ -395,6 +399,20 @@ async def run_citation_pipeline(
         cached_unverified = load_json_from_file(citations_dir, "03_unverified_claims.json")
         logger.info(f"Found cached unverified claims: {len(cached_unverified)} claims")
 
+    # Claims finished by an interrupted verification run are only in the journal
+    journal_verified, journal_unverified = read_verification_journal(citations_dir)
+    if journal_verified or journal_unverified:
+        logger.info(f"Found verification journal: {len(journal_verified)} verified, "
+                    f"{len(journal_unverified)} unverified")
+        known_ids = {vc["claim_id"] for vc in cached_verified or []}
+        known_ids.update(c["id"] for c in cached_unverified or [])
+        cached_verified = (cached_verified or []) + [
+            vc for vc in journal_verified if vc["claim_id"] not in known_ids
+        ]
+        cached_unverified = (cached_unverified or []) + [
+            c for c in journal_unverified if c["id"] not in known_ids
+        ]
+
     # =========================================================================
     # PHASE 1: Plan Claims for All Subsections (or load from cache)
     # =========================================================================
@@ -508,6 +526,13 @@ async def run_citation_pipeline(
     if not remaining_claims:
         if verified_citations or unverified_claims:
             logger.info("\n[PHASE 2] All claims already verified (loaded from cache)")
+            if journal_verified or journal_unverified:
+                compact_verification_results(
+                    citations_dir,
+                    verified_citations,
+                    unverified_claims,
+                    {c.id: c for c in all_claims},
+                )
         else:
             logger.info("No claims to verify")
             return CitationManager(all_claims, [], [], subsection_plans)
@@ -527,38 +552,10 @@ async def run_citation_pipeline(
             existing_unverified=unverified_claims,
         )
 
-        # Merge with cached results
+        # Merge with cached results (verify_all_claims already compacted them to disk)
         verified_citations.extend(new_verified)
         unverified_claims.extend(new_unverified)
 
-        # Save verification results
-        verified_data = [
-            {
-                "claim_id": vc.claim_id,
-                "claim_content": next((c.content for c in all_claims if c.id == vc.claim_id), ""),
-                "citation": vc.citation_text,
-                "confidence": vc.confidence,
-                "source_url": vc.source_id,
-                "quote": vc.supporting_quote[:300] if vc.supporting_quote else "",
-                "full_reference": vc.full_reference,
-            }
-            for vc in verified_citations
-        ]
-        save_json_to_file(citations_dir, "02_verified_citations.json", verified_data)
-
-        unverified_data = [
-            {
-                "id": c.id,
-                "content": c.content,
-                "chapter": c.chapter,
-                "section": c.section,
-                "subsection": c.subsection,
-                "importance": c.importance,
-            }
-            for c in unverified_claims
-        ]
-        save_json_to_file(citations_dir, "03_unverified_claims.json", unverified_data)
-
     # =========================================================================
     # PHASE 3: Build Citation Manager
     # =========================================================================
@@ -11,34 +11,35 @@ import logging
 import json
 import re
 import os
-from typing import List, Optional, Tuple
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple
 import asyncio
 
-from google import genai
 from google.genai import types
 
 from .models import Claim, VerifiedCitation
+from ..concurrency import AdaptiveLimiter
+from ..rate_limit import acquire_quota, estimate_tokens
+from ..credentials import get_genai_client
 
 logger = logging.getLogger(__name__)
 
-# Initialize client globally
-_client = None
+# Append-only record of every claim verified so far (one JSON object per line).
+# Compacted into 02_verified_citations.json / 03_unverified_claims.json at the end.
+VERIFICATION_JOURNAL = "02_verification_journal.jsonl"
+
+VERIFICATION_MODEL = "gemini-3-flash-preview"
 
 def _get_client():
-    """Get or create the GenAI client."""
-    global _client
-    if _client is None:
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY not configured")
-        _client = genai.Client(api_key=api_key)
-    return _client
+    """Get the GenAI client for the current job's key (shared per key)."""
+    return get_genai_client()
 
 
 async def verify_claim_with_gemini(
     claim: Claim,
     topic_context: str,
     confidence_threshold: float = 0.75,
+    limiter: Optional[AdaptiveLimiter] = None,
 ) -> Optional[VerifiedCitation]:
     """
     Verify a claim using Gemini with Google Search grounding.
@@ -50,6 +51,7 @@ async def verify_claim_with_gemini(
         claim: The claim to verify
         topic_context: Book topic for context
         confidence_threshold: Minimum confidence to accept
+        limiter: Optional adaptive limiter that the Gemini call runs under
 
     Returns:
         VerifiedCitation if verified, None otherwise
@@ -115,16 +117,25 @@ ONLY output valid JSON, nothing else."""
     )
 
     try:
-        # Run in executor to not block async loop
+        # Wait for quota before taking a concurrency slot
+        estimated_tokens = estimate_tokens(verification_prompt) + config.max_output_tokens
+        quota = await acquire_quota(VERIFICATION_MODEL, estimated_tokens, search_grounding=True)
+
+        # Run in executor to not block async loop; only the API call holds a slot
         loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: client.models.generate_content(
-                model="gemini-3-flash-preview",
-                contents=verification_prompt,
-                config=config,
+        async with (limiter.slot() if limiter else nullcontext()):
+            response = await loop.run_in_executor(
+                None,
+                lambda: client.models.generate_content(
+                    model=VERIFICATION_MODEL,
+                    contents=verification_prompt,
+                    config=config,
+                )
             )
-        )
+
+        usage = getattr(response, "usage_metadata", None)
+        if usage and getattr(usage, "total_token_count", None):
+            quota.adjust_tokens(usage.total_token_count - estimated_tokens)
 
         content = response.text
 
@@ -242,6 +253,100 @@ ONLY output valid JSON, nothing else."""
         return None
 
 
+def verified_citation_record(vc: VerifiedCitation, claims_lookup: Dict[str, Claim]) -> dict:
+    """Serialize a verified citation the way 02_verified_citations.json stores it."""
+    return {
+        "claim_id": vc.claim_id,
+        "claim_content": claims_lookup[vc.claim_id].content if vc.claim_id in claims_lookup else "",
+        "citation": vc.citation_text,
+        "confidence": vc.confidence,
+        "source_url": vc.source_id,
+        "quote": vc.supporting_quote[:300] if vc.supporting_quote else "",
+        "full_reference": vc.full_reference,
+    }
+
+
+def unverified_claim_record(claim: Claim) -> dict:
+    """Serialize an unverified claim the way 03_unverified_claims.json stores it."""
+    return {
+        "id": claim.id,
+        "content": claim.content,
+        "chapter": claim.chapter,
+        "section": claim.section,
+        "subsection": claim.subsection,
+        "importance": claim.importance,
+    }
+
+
+def read_verification_journal(citations_dir: str) -> Tuple[List[dict], List[dict]]:
+    """
+    Read the verification journal left behind by an interrupted run.
+
+    A torn final line (crash mid-write) is skipped; every complete line is
+    one claim that does not need to be verified again.
+
+    Returns:
+        Tuple of (verified records, unverified records) in the JSON file formats
+    """
+    verified, unverified = [], []
+    path = os.path.join(citations_dir, VERIFICATION_JOURNAL)
+    if not os.path.exists(path):
+        return verified, unverified
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("Skipping incomplete verification journal line")
+                continue
+            if entry.get("status") == "verified":
+                verified.append(entry["record"])
+            else:
+                unverified.append(entry["record"])
+    return verified, unverified
+
+
+def open_verification_journal(citations_dir: str):
+    """
+    Open the verification journal for appending.
+
+    If a crash left a torn final line, it is terminated first, so the
+    first new record starts on its own line instead of being glued onto
+    the torn one (and then skipped with it on the next resume).
+    """
+    path = os.path.join(citations_dir, VERIFICATION_JOURNAL)
+    journal = open(path, "a", encoding="utf-8")
+    if journal.tell() > 0:
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                journal.write("\n")
+    return journal
+
+
+def compact_verification_results(
+    citations_dir: str,
+    verified_citations: List[VerifiedCitation],
+    unverified_claims: List[Claim],
+    claims_lookup: Dict[str, Claim],
+) -> None:
+    """Write the full verified/unverified JSON files and drop the journal they supersede."""
+    verified_data = [verified_citation_record(vc, claims_lookup) for vc in verified_citations]
+    with open(os.path.join(citations_dir, "02_verified_citations.json"), "w") as f:
+        json.dump(verified_data, f, indent=2)
+
+    unverified_data = [unverified_claim_record(c) for c in unverified_claims]
+    with open(os.path.join(citations_dir, "03_unverified_claims.json"), "w") as f:
+        json.dump(unverified_data, f, indent=2)
+
+    journal_path = os.path.join(citations_dir, VERIFICATION_JOURNAL)
+    if os.path.exists(journal_path):
+        os.remove(journal_path)
+
+    logger.info(f"Saved {len(verified_data)} verified, {len(unverified_data)} unverified")
+
+
 async def verify_all_claims(
     claims: List[Claim],
     topic_context: str,
@@ -260,25 +365,18 @@ async def verify_all_claims(
         claims: List of claims to verify
         topic_context: Book topic for context
         confidence_threshold: Minimum confidence to accept
-        max_concurrent: Max concurrent API calls
-        delay_between_requests: Delay between requests (rate limiting)
-        citations_dir: Directory to save incremental results (optional)
+        max_concurrent: Initial concurrency window (adapts to 429/5xx and latency)
+        delay_between_requests: Minimum spacing between request starts (rate limiting)
+        citations_dir: Directory for the verification journal and final results (optional)
         all_claims: Full list of claims for looking up content (optional)
-        existing_verified: Already verified citations to include in saves
-        existing_unverified: Already unverified claims to include in saves
+        existing_verified: Already verified citations to include in the final save
+        existing_unverified: Already unverified claims to include in the final save
 
     Returns:
         Tuple of (verified_citations, unverified_claims) - only NEW results
     """
-    import threading
-
     verified_citations = []
     unverified_claims = []
-    save_lock = threading.Lock()
-
-    # Include existing results in incremental saves
-    cached_verified = list(existing_verified) if existing_verified else []
-    cached_unverified = list(existing_unverified) if existing_unverified else []
 
     # For looking up claim content when saving
     claims_lookup = {c.id: c for c in (all_claims or claims)}
@@ -286,84 +384,73 @@ async def verify_all_claims(
     total = len(claims)
     logger.info(f"Starting verification of {total} claims with Gemini Search Grounding...")
 
-    def save_incremental():
-        """Save current results to disk (thread-safe), including cached results."""
-        if not citations_dir:
+    # One appended line per finished claim instead of rewriting both JSON files
+    journal = None
+    if citations_dir:
+        journal = open_verification_journal(citations_dir)
+
+    def journal_result(claim: Claim, result: Optional[VerifiedCitation]):
+        """Append one claim's outcome to the journal."""
+        if journal is None:
             return
+        if result:
+            entry = {"status": "verified", "record": verified_citation_record(result, claims_lookup)}
+        else:
+            entry = {"status": "unverified", "record": unverified_claim_record(claim)}
         try:
-            with save_lock:
-                # Combine cached + new verified
-                all_verified = cached_verified + verified_citations
-                verified_data = [
-                    {
-                        "claim_id": vc.claim_id,
-                        "claim_content": claims_lookup[vc.claim_id].content if vc.claim_id in claims_lookup else "",
-                        "citation": vc.citation_text,
-                        "confidence": vc.confidence,
-                        "source_url": vc.source_id,
-                        "quote": vc.supporting_quote[:300] if vc.supporting_quote else "",
-                        "full_reference": vc.full_reference,
-                    }
-                    for vc in all_verified
-                ]
-                with open(f"{citations_dir}/02_verified_citations.json", "w") as f:
-                    import json
-                    json.dump(verified_data, f, indent=2)
-
-                # Combine cached + new unverified
-                all_unverified = cached_unverified + unverified_claims
-                unverified_data = [
-                    {
-                        "id": c.id,
-                        "content": c.content,
-                        "chapter": c.chapter,
-                        "section": c.section,
-                        "subsection": c.subsection,
-                        "importance": c.importance,
-                    }
-                    for c in all_unverified
-                ]
-                with open(f"{citations_dir}/03_unverified_claims.json", "w") as f:
-                    import json
-                    json.dump(unverified_data, f, indent=2)
-
-                logger.info(f"Saved incremental: {len(all_verified)} verified, {len(all_unverified)} unverified")
+            journal.write(json.dumps(entry) + "\n")
+            journal.flush()
         except Exception as e:
-            logger.warning(f"Failed to save incremental results: {e}")
-
-    # Process with rate limiting
-    semaphore = asyncio.Semaphore(max_concurrent)
+            logger.warning(f"Failed to journal result for claim {claim.id}: {e}")
+
+    # Adaptive window: grows while Gemini keeps up, halves on 429/5xx
+    limiter = AdaptiveLimiter(
+        "verify",
+        initial=max_concurrent,
+        max_limit=max_concurrent * 4,
+        min_interval=delay_between_requests,
+    )
     processed_count = [0]  # Use list for mutable counter in closure
 
     async def verify_with_limit(claim: Claim, index: int):
-        async with semaphore:
-            logger.info(f"Verifying claim {index + 1}/{total}: {claim.content[:40]}...")
-            result = await verify_claim_with_gemini(
-                claim=claim,
-                topic_context=topic_context,
-                confidence_threshold=confidence_threshold,
-            )
-            # Rate limiting delay
-            await asyncio.sleep(delay_between_requests)
+        logger.info(f"Verifying claim {index + 1}/{total} (window {limiter.limit}): {claim.content[:40]}...")
+        result = await verify_claim_with_gemini(
+            claim=claim,
+            topic_context=topic_context,
+            confidence_threshold=confidence_threshold,
+            limiter=limiter,
+        )
 
-            # Process result immediately and save
-            if result:
-                verified_citations.append(result)
-            else:
-                unverified_claims.append(claim)
+        # Process result immediately and save
+        if result:
+            verified_citations.append(result)
+        else:
+            unverified_claims.append(claim)
 
-            processed_count[0] += 1
-            if citations_dir:
-                save_incremental()
+        processed_count[0] += 1
+        journal_result(claim, result)
 
-            return claim, result
+        return claim, result
 
-    # Run verifications - results are saved incrementally inside verify_with_limit
+    # Run verifications - results are journaled as they finish inside verify_with_limit
     tasks = [verify_with_limit(claim, i) for i, claim in enumerate(claims)]
-    await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        if journal is not None:
+            journal.close()
 
-    # Final save to ensure everything is persisted
-    save_incremental()
+    # Compact existing + new results into the JSON files
+    if citations_dir:
+        try:
+            compact_verification_results(
+                citations_dir,
+                list(existing_verified or []) + verified_citations,
+                list(existing_unverified or []) + unverified_claims,
+                claims_lookup,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save verification results: {e}")
 
     # Summary
     verified_count = len(verified_citations)
@@ -375,6 +462,7 @@ async def verify_all_claims(
     logger.info(f"Total claims: {total}")
     logger.info(f"Verified: {verified_count} ({rate:.1f}%)")
     logger.info(f"Unverified: {unverified_count}")
+    logger.info(f"Final concurrency window: {limiter.limit} ({limiter.overloads} rate-limit responses)")
     logger.info("="*50)
 
     # Log unverified critical/high importance claims
@@ -0,0 +1,212 @@
+"""
+Adaptive concurrency control for rate-limited API calls.
+
+AdaptiveLimiter replaces a fixed asyncio.Semaphore with an AIMD window
+(additive increase, multiplicative decrease): the number of in-flight
+calls grows while calls succeed at a healthy latency and is cut when the
+provider answers with 429 / 5xx. Throughput then follows the real quota
+instead of a hand-tuned constant.
+"""
+
+import re
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# HTTP status codes that mean "slow down" rather than "bad request"
+OVERLOAD_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_OVERLOAD_MARKERS = (
+    "resource_exhausted", "resource exhausted", "rate limit", "ratelimit",
+    "quota", "too many requests", "unavailable", "overloaded",
+    "internal error", "deadline exceeded",
+)
+
+_OVERLOAD_CODE_RE = re.compile(r"\b(?:429|50[0234])\b")
+
+# Latency above this multiple of the best observed latency counts as congestion
+_LATENCY_TOLERANCE = 2.0
+
+# Smoothing factor for the latency and error-rate moving averages
+_EWMA_ALPHA = 0.2
+
+# Error rate above which the window stops growing
+_MAX_HEALTHY_ERROR_RATE = 0.1
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """True if the error is a rate-limit or server-side overload (429 / 5xx)."""
+    for attr in ("status_code", "code", "status"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int) and value in OVERLOAD_STATUS_CODES:
+            return True
+    message = f"{type(error).__name__} {error}".lower()
+    if _OVERLOAD_CODE_RE.search(message):
+        return True
+    return any(marker in message for marker in _OVERLOAD_MARKERS)
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency window for one API.
+
+    Usage:
+        limiter = AdaptiveLimiter("verify", initial=10)
+        async with limiter.slot():
+            await call_api()
+
+    Exceptions raised inside slot() are inspected: 429 / 5xx shrink the
+    window (at most once per observed latency, so one burst of rejections
+    counts once), other errors hold it steady. Each success with latency
+    within _LATENCY_TOLERANCE of the best seen grows the window by
+    `increase` per full window of successes.
+
+    Args:
+        name: Label used in log lines
+        initial: Starting window (the old fixed max_concurrent)
+        min_limit: Window never shrinks below this
+        max_limit: Window never grows beyond this
+        increase: Additive increase per window of healthy successes
+        decrease: Multiplicative factor applied on overload
+        min_interval: Minimum seconds between call starts (pacing, not holding a slot)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        min_interval: float = 0.0,
+    ):
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.increase = increase
+        self.decrease = decrease
+        self.min_interval = min_interval
+
+        self._limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._pace_lock = asyncio.Lock()
+        self._next_start = 0.0
+
+        self._best_latency: Optional[float] = None
+        self._avg_latency: Optional[float] = None
+        self._error_rate = 0.0
+        self._last_decrease = 0.0
+
+        self.successes = 0
+        self.errors = 0
+        self.overloads = 0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency window."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one concurrency slot for the duration of a call."""
+        await self._pace()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+        start = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self._record_failure(e, time.monotonic() - start)
+            raise
+        else:
+            self._record_success(time.monotonic() - start)
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def record_overload(self) -> None:
+        """
+        Report a rate-limit response that was handled without raising.
+
+        Counts like an overload error raised inside slot(), so the
+        surrounding slot's "success" does not grow the window.
+        """
+        self.overloads += 1
+        self._error_rate = (1 - _EWMA_ALPHA) * self._error_rate + _EWMA_ALPHA
+        self._shrink("reported overload")
+
+    async def _pace(self) -> None:
+        """Space call starts min_interval apart without occupying a slot."""
+        if self.min_interval <= 0:
+            return
+        async with self._pace_lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.min_interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _record_success(self, latency: float) -> None:
+        self.successes += 1
+        self._error_rate *= 1 - _EWMA_ALPHA
+        if self._best_latency is None or latency < self._best_latency:
+            self._best_latency = latency
+        self._avg_latency = latency if self._avg_latency is None else (
+            (1 - _EWMA_ALPHA) * self._avg_latency + _EWMA_ALPHA * latency
+        )
+
+        congested = self._avg_latency > _LATENCY_TOLERANCE * self._best_latency
+        if congested or self._error_rate > _MAX_HEALTHY_ERROR_RATE:
+            return
+        # Only grow when the window is actually in use
+        if self._in_flight >= self.limit - 1:
+            self._set_limit(self._limit + self.increase / self._limit, "healthy")
+
+    def _record_failure(self, error: BaseException, latency: float) -> None:
+        self.errors += 1
+        self._error_rate = (1 - _EWMA_ALPHA) * self._error_rate + _EWMA_ALPHA
+        if is_overload_error(error):
+            self.overloads += 1
+            self._shrink(type(error).__name__)
+
+    def _shrink(self, reason: str) -> None:
+        # One decrease per round trip: rejections from the same burst count once
+        now = time.monotonic()
+        if now - self._last_decrease < (self._avg_latency or 1.0):
+            return
+        self._last_decrease = now
+        self._set_limit(self._limit * self.decrease, reason)
+
+    def _set_limit(self, value: float, reason: str) -> None:
+        old = self.limit
+        self._limit = min(max(value, float(self.min_limit)), float(self.max_limit))
+        if self.limit != old:
+            avg = f"{self._avg_latency:.1f}s" if self._avg_latency is not None else "n/a"
+            logger.info(
+                f"[{self.name}] concurrency {old} -> {self.limit} ({reason}; "
+                f"avg latency {avg}, error rate {self._error_rate:.0%})"
+            )
+
+    def stats(self) -> dict:
+        """Counters and the current window."""
+        return {
+            "limit": self.limit,
+            "successes": self.successes,
+            "errors": self.errors,
+            "overloads": self.overloads,
+            "avg_latency": self._avg_latency,
+        }
@@ -7,7 +7,7 @@ import random
 import logging
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 from dotenv import load_dotenv
 
@@ -41,12 +41,17 @@ class Config:
     # Resume settings
     resume_from_dir: Optional[str] = None
 
+    # Content generation concurrency
+    content_max_parallel_chapters: int = 1  # Chapters written concurrently (1 = sequential)
+    content_parallel_subsections: bool = False  # Write subsections concurrently from planned contracts
+
     # Interactive approval
     interactive_outline_approval: bool = True  # Prompt user to approve outline before continuing
 
     # Plan quality control
     plan_critique_enabled: bool = True  # Enable self-critique loop for plan generation
     plan_critique_max_attempts: int = 5  # Max revision attempts per plan
+    planning_max_parallel_chapters: int = 4  # Chapter/section plans generated concurrently (1 = sequential)
 
     # Default outline (optional) - if provided and enabled, skip outline generation
     default_outline: Optional[dict] = None
@@ -64,6 +69,12 @@ class Config:
     # Model settings
     model_name: str = "gemini/gemini-3-flash-preview"
 
+    # LLM response cache (shared across runs and jobs, keyed by model + kwargs + prompt + schema)
+    llm_cache: bool = False  # Serve byte-identical LLM calls from the persistent cache
+    llm_cache_path: str = "data/llm_cache.db"  # SQLite file, relative to project root
+    llm_cache_max_mb: int = 512  # Size budget before least-recently-used entries are evicted
+    rate_limits: Dict[str, dict] = field(default_factory=dict)  # Per-model {"rpm": .., "tpm": ..} shared by all jobs
+
     # Author settings
     author_key: Optional[str] = None  # Key from authors.AUTHOR_PROFILES, None for no styling
 
@@ -71,6 +82,7 @@ class Config:
     enable_illustrations: bool = False  # Whether to add illustrations to chapters
     enable_generated_images: bool = True  # Whether to generate AI images (vs just Mermaid)
     image_model: str = "gemini/gemini-3-pro-image-preview"  # Model for image generation
+    illustrations_max_parallel_chapters: int = 3  # Chapters illustrated concurrently (1 = sequential)
 
     # Cover settings
     # Available styles: humorous, abstract, cyberpunk, minimalist, watercolor,
@@ -87,8 +99,12 @@ class Config:
     # Deep research settings
     enable_research: bool = False  # Enable Gemini Deep Research for cutting-edge content
     research_max_queries: int = 5  # Maximum research queries to run
+    research_max_concurrent: int = 3  # Deep research queries run in parallel (1 = sequential)
     research_cache: bool = True  # Cache research results for reuse
+    research_streaming_parse: bool = False  # Parse each query as it completes, merge at the end
     skip_draft_outline: bool = True  # Skip draft outline when research enabled (saves 2-6 LLM calls)
+    research_embedding_model: Optional[str] = None  # sentence-transformers model blended into BM25 retrieval
+    research_llm_rerank: bool = False  # One LLM rerank call per paper/framework retrieval
 
     # Stage 2 research settings (requires mcp-graphiti Docker container running)
     enable_stage2_research: bool = False  # Enable Stage 2 with knowledge graph
@@ -182,12 +198,27 @@ class Config:
         if self.plan_critique_max_attempts < 1:
             raise ValueError("plan_critique_max_attempts must be >= 1")
 
+        if self.planning_max_parallel_chapters < 1:
+            raise ValueError("planning_max_parallel_chapters must be >= 1")
+
         if self.research_max_queries < 1:
             raise ValueError("research_max_queries must be >= 1")
 
+        if self.research_max_concurrent < 1:
+            raise ValueError("research_max_concurrent must be >= 1")
+
         if self.num_chapters is not None and self.num_chapters < 1:
             raise ValueError("num_chapters must be >= 1")
 
+        if self.llm_cache_max_mb < 1:
+            raise ValueError("llm_cache_max_mb must be >= 1")
+
+        if self.content_max_parallel_chapters < 1:
+            raise ValueError("content_max_parallel_chapters must be >= 1")
+
+        if self.illustrations_max_parallel_chapters < 1:
+            raise ValueError("illustrations_max_parallel_chapters must be >= 1")
+
     def setup_output_dir(self, base_path: str = ".") -> str:
         """Create or use output directory for this run."""
         if self.resume_from_dir:
@@ -235,18 +266,26 @@ class Config:
             test_mode=data.get("test_mode", False),
             test_max_chapters=data.get("test_max_chapters", 2),
             resume_from_dir=data.get("resume_from_dir"),
+            content_max_parallel_chapters=data.get("content_max_parallel_chapters", 1),
+            content_parallel_subsections=data.get("content_parallel_subsections", False),
             interactive_outline_approval=data.get("interactive_outline_approval", True),
             plan_critique_enabled=data.get("plan_critique_enabled", True),
             plan_critique_max_attempts=data.get("plan_critique_max_attempts", 5),
+            planning_max_parallel_chapters=data.get("planning_max_parallel_chapters", 4),
             default_outline=default_outline,
             use_default_outline=use_default_outline,
             num_chapters=data.get("num_chapters"),
             focus=data.get("focus"),
             model_name=data.get("model_name", "gemini/gemini-3-flash-preview"),
+            llm_cache=data.get("llm_cache", False),
+            llm_cache_path=data.get("llm_cache_path", "data/llm_cache.db"),
+            llm_cache_max_mb=data.get("llm_cache_max_mb", 512),
+            rate_limits=data.get("rate_limits") or {},
             author_key=data.get("author_key"),
             enable_illustrations=data.get("enable_illustrations", False),
             enable_generated_images=data.get("enable_generated_images", True),
             image_model=data.get("image_model", "gemini/gemini-3-pro-image-preview"),
+            illustrations_max_parallel_chapters=data.get("illustrations_max_parallel_chapters", 3),
             cover_style=data.get("cover_style", "humorous"),
             enable_citations=data.get("enable_citations", False),
             enable_chapter_references=data.get("enable_chapter_references", False),
@@ -254,8 +293,12 @@ class Config:
             skip_low_importance_claims=data.get("skip_low_importance_claims", True),
             enable_research=data.get("enable_research", False),
             research_max_queries=data.get("research_max_queries", 5),
+            research_max_concurrent=data.get("research_max_concurrent", 3),
             research_cache=data.get("research_cache", True),
+            research_streaming_parse=data.get("research_streaming_parse", False),
             skip_draft_outline=data.get("skip_draft_outline", True),
+            research_embedding_model=data.get("research_embedding_model"),
+            research_llm_rerank=data.get("research_llm_rerank", False),
             enable_stage2_research=data.get("enable_stage2_research", False),
             graphiti_mcp_url=data.get("graphiti_mcp_url", "http://localhost:8000/mcp/"),
             graphiti_group_id=data.get("graphiti_group_id", "book_research"),
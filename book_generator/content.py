@@ -14,7 +14,9 @@ citation context provides a list of "allowed claims" that can be made
 and must be cited properly.
 """
 
+import asyncio
 import logging
+import re
 from typing import List, Optional, Dict
 
 import synalinks
@@ -26,6 +28,7 @@ from .models import (
     PartConclusionInput, PartConclusion,
     SectionQualityInput, QualityAssessment,
     ResearchDistributionInput, ResearchDistributionPlan,
+    SubsectionContractsInput, SubsectionContracts,
 )
 from .utils import (
     sanitize_filename,
@@ -56,21 +59,37 @@ logger = logging.getLogger(__name__)
 # QUALITY CONTROL
 # =============================================================================
 
+def _normalize_name(name: str) -> str:
+    """Normalize a subsection name for matching: drop numbering, case and punctuation."""
+    name = re.sub(r'^\s*[\d.]+\s*', '', name or "")
+    return re.sub(r'[^a-z0-9]+', ' ', name.lower()).strip()
+
+
 async def check_section_quality(
     section_content: str,
     section_name: str,
     section_plan: str,
     audience: str,
     language_model,
+    subsection_names: Optional[List[str]] = None,
 ) -> tuple:
     """
-    Check quality of a section and return (passed: bool, feedback: str).
+    Check quality of a section.
+
+    Returns:
+        Tuple of (passed: bool, feedback: str, subsection_feedback: Dict[int, str]).
+        subsection_feedback maps the index (into subsection_names) of each
+        subsection judged 'needs_rewrite' to its specific issues. It is empty
+        when the section passes or when no subsection could be singled out.
     """
+    subsection_names = subsection_names or []
+
     quality_input = SectionQualityInput(
         section_name=section_name,
         section_content=section_content,
         section_plan=section_plan,
-        audience=audience
+        audience=audience,
+        subsection_names="\n".join(f"{i+1}. {name}" for i, name in enumerate(subsection_names)),
     )
 
     generator = synalinks.Generator(
@@ -84,12 +103,16 @@ async def check_section_quality(
 3. STYLE ISSUES: Is there forced humor, patronizing tone, or overused phrases like "Imagine..."?
 4. COVERAGE GAPS: Are important topics from the plan not adequately covered?
 
+Then give a verdict for EACH subsection (the ### headers). Mark a subsection 'needs_rewrite'
+only if the issue lives in that subsection - for a repetition, flag the later occurrence,
+not the subsection that introduced it. Subsections marked 'pass' will be kept as-is.
+
 Be specific about issues. Set verdict to 'pass' if acceptable, 'needs_rewrite' if significant issues."""
     )
 
     result = await generator(quality_input)
     if result is None:
-        return (True, "")
+        return (True, "", {})
 
     data = result.get_json()
     verdict = data.get("verdict", "pass")
@@ -107,7 +130,25 @@ Be specific about issues. Set verdict to 'pass' if acceptable, 'needs_rewrite' i
         feedback_parts.append(f"Coverage gaps: {', '.join(data['coverage_gaps'])}")
 
     feedback = "; ".join(feedback_parts)
-    return (passed, feedback)
+
+    # Map per-subsection verdicts back to subsection indices
+    subsection_feedback = {}
+    if not passed:
+        normalized_names = [_normalize_name(name) for name in subsection_names]
+        for sub_verdict in data.get("subsection_verdicts", []):
+            if sub_verdict.get("verdict", "pass") == "pass":
+                continue
+            name = sub_verdict.get("subsection_name", "")
+            if name in subsection_names:
+                idx = subsection_names.index(name)
+            elif _normalize_name(name) in normalized_names:
+                idx = normalized_names.index(_normalize_name(name))
+            else:
+                logger.debug(f"    Unmatched subsection verdict: '{name[:40]}'")
+                continue
+            subsection_feedback[idx] = "; ".join(sub_verdict.get("issues", [])) or feedback
+
+    return (passed, feedback, subsection_feedback)
 
 
 # =============================================================================
@@ -127,9 +168,12 @@ async def match_subsection_to_assignment(
     """
     Use synalinks.Decision to match a subsection to its research assignment.
 
+    Last-resort fallback for plan_research_distribution, used only when an
+    assignment could not be aligned by subsection number or name.
+
     Args:
         subsection_name: The actual subsection name we're generating
-        assignments: List of assignment dicts from plan_research_distribution
+        assignments: List of candidate (unaligned) assignment dicts
         language_model: Synalinks language model
 
     Returns:
@@ -187,28 +231,63 @@ Select the assignment whose topic best matches this subsection.""",
     return None
 
 
+def _align_assignments(assignments: List[dict], subsection_names: List[str]) -> tuple:
+    """
+    Align planned assignments to subsections without any LLM calls.
+
+    Tries the subsection number the planner echoed back first, then a
+    normalized-string match on the name.
+
+    Returns:
+        Tuple of (by_index: Dict[int, dict], unresolved: List[dict])
+    """
+    by_index = {}
+    unresolved = []
+    normalized_names = [_normalize_name(name) for name in subsection_names]
+
+    for assignment in assignments:
+        number = assignment.get("subsection_number")
+        idx = number - 1 if isinstance(number, int) else -1
+        if not (0 <= idx < len(subsection_names)) or idx in by_index:
+            name = _normalize_name(assignment.get("subsection_name", ""))
+            idx = next(
+                (i for i, n in enumerate(normalized_names) if n == name and i not in by_index),
+                -1,
+            )
+        if idx >= 0:
+            by_index[idx] = assignment
+        else:
+            unresolved.append(assignment)
+
+    return by_index, unresolved
+
+
 async def plan_research_distribution(
     section_name: str,
     section_plan: str,
     subsection_names: List[str],
     research_context: str,
     language_model,
-) -> List[dict]:
+) -> tuple:
     """
     Plan how to distribute research findings across subsections.
 
-    Returns a LIST of assignments (not a dict). Each subsection will use
-    synalinks.Decision to match itself to the appropriate assignment.
+    Assignments are aligned to subsections by the number the planner echoes
+    back, then by normalized name. Only subsections left over after both are
+    matched with a synalinks.Decision call (against the leftover assignments).
 
     Returns:
-        List of assignment dicts, each with:
+        Tuple of (by_index, all_assignments): by_index maps subsection index
+        (into subsection_names) to an assignment dict, and all_assignments
+        lists every planned assignment, including ones no subsection matched.
+        Each assignment dict has:
             "subsection_name": str (LLM's name for this assignment)
             "concepts": [...]
             "example_domain": str
             "focus_area": str
     """
     if not research_context or not subsection_names:
-        return []
+        return {}, []
 
     logger.info(f"  Planning research distribution for {len(subsection_names)} subsections...")
 
@@ -254,7 +333,8 @@ Each subsection gets a UNIQUE example_domain:
 === OUTPUT ===
 
 Create one assignment per subsection with:
-- subsection_name: the subsection this is for
+- subsection_number: the subsection's number in the list above
+- subsection_name: the subsection this is for (copied exactly)
 - assigned_concepts: list of concepts EXCLUSIVE to this subsection
 - example_domain: domain UNIQUE to this subsection
 - focus_area: what this subsection emphasizes"""
@@ -263,7 +343,7 @@ Create one assignment per subsection with:
     result = await generator(distribution_input)
     if result is None:
         logger.warning("  Research distribution planning failed")
-        return []
+        return {}, []
 
     data = result.get_json()
     assignments = data.get("assignments", [])
@@ -272,6 +352,7 @@ Create one assignment per subsection with:
     distribution_list = []
     for assignment in assignments:
         distribution_list.append({
+            "subsection_number": assignment.get("subsection_number"),
             "subsection_name": assignment.get("subsection_name", ""),
             "concepts": assignment.get("assigned_concepts", []),
             "example_domain": assignment.get("example_domain", ""),
@@ -279,12 +360,30 @@ Create one assignment per subsection with:
         })
         logger.info(f"    {assignment.get('subsection_name', '')[:40]}: {len(assignment.get('assigned_concepts', []))} concepts, domain={assignment.get('example_domain', '')}")
 
+    distribution, unresolved = _align_assignments(distribution_list, subsection_names)
+
+    # LLM fallback only for subsections that neither number nor name could place
+    for i, subsection_name in enumerate(subsection_names):
+        if i in distribution or not unresolved:
+            continue
+        assignment = await match_subsection_to_assignment(
+            subsection_name=subsection_name,
+            assignments=unresolved,
+            language_model=language_model,
+        )
+        if assignment:
+            distribution[i] = assignment
+            unresolved.remove(assignment)
+
     all_concepts = []
     for a in distribution_list:
         all_concepts.extend(a.get("concepts", []))
-    logger.info(f"  Distribution complete: {len(all_concepts)} total concepts across {len(distribution_list)} assignments")
+    logger.info(
+        f"  Distribution complete: {len(all_concepts)} total concepts across {len(distribution_list)} assignments, "
+        f"{len(distribution)}/{len(subsection_names)} subsections matched"
+    )
 
-    return distribution_list
+    return distribution, distribution_list
 
 
 def format_assigned_research(
@@ -354,6 +453,116 @@ def format_assigned_research(
     return "\n".join(parts)
 
 
+# =============================================================================
+# SUBSECTION CONTRACTS (parallel subsection mode)
+# =============================================================================
+
+async def plan_subsection_contracts(
+    section_name: str,
+    section_plan: str,
+    subsection_names: List[str],
+    language_model,
+) -> List[dict]:
+    """
+    Plan a short contract for each subsection so they can be written in parallel.
+
+    In sequential mode each subsection sees the full text of the ones before it.
+    In parallel mode that text does not exist yet, so a single cheap planning call
+    divides the section up front: what each subsection covers and what it must
+    leave to its siblings.
+
+    Returns:
+        List of contract dicts aligned with subsection_names (same length and order),
+        each with "subsection_name", "covers" and "must_not_repeat".
+        Empty list if planning failed (caller should fall back to sequential).
+    """
+    if not subsection_names:
+        return []
+
+    logger.info(f"  Planning contracts for {len(subsection_names)} parallel subsections...")
+
+    numbered_names = "\n".join(f"{i+1}. {name}" for i, name in enumerate(subsection_names))
+
+    contracts_input = SubsectionContractsInput(
+        section_name=section_name,
+        section_plan=section_plan,
+        subsection_names=numbered_names,
+    )
+
+    generator = synalinks.Generator(
+        data_model=SubsectionContracts,
+        language_model=language_model,
+        temperature=1.0,
+        instructions=f"""Divide this section between its subsections so they can be written INDEPENDENTLY and IN PARALLEL.
+
+THE SUBSECTIONS ARE:
+{numbered_names}
+
+Each writer will only see their own contract and the one-line "covers" of their siblings,
+never the siblings' text. Your contracts are the only thing preventing repetition.
+
+For EACH subsection, in the SAME ORDER as the list above:
+- subsection_name: the subsection this contract is for
+- covers: what it owns (concepts, mechanisms, its example) in 1-3 sentences
+- must_not_repeat: concepts/examples owned by OTHER subsections that it may only reference
+
+Each concept and each example belongs to exactly ONE subsection."""
+    )
+
+    try:
+        result = await generator(contracts_input)
+    except Exception as e:
+        logger.warning(f"  Subsection contract planning failed: {e}")
+        return []
+
+    if result is None:
+        logger.warning("  Subsection contract planning failed")
+        return []
+
+    contracts = result.get_json().get("contracts", [])
+    if len(contracts) != len(subsection_names):
+        logger.warning(
+            f"  Got {len(contracts)} contracts for {len(subsection_names)} subsections, "
+            f"falling back to sequential generation"
+        )
+        return []
+
+    return [
+        {
+            "subsection_name": name,
+            "covers": contract.get("covers", ""),
+            "must_not_repeat": contract.get("must_not_repeat", []),
+        }
+        for name, contract in zip(subsection_names, contracts)
+    ]
+
+
+def format_sibling_contracts(contracts: List[dict], index: int) -> str:
+    """Format the contract for subsection `index` together with its siblings' coverage."""
+    if not contracts or index >= len(contracts):
+        return ""
+
+    own = contracts[index]
+    parts = [f"YOUR SUBSECTION COVERS: {own.get('covers', '')}"]
+
+    if own.get("must_not_repeat"):
+        parts.append("")
+        parts.append("DO NOT EXPLAIN (owned by sibling subsections - reference only):")
+        for item in own["must_not_repeat"][:MAX_BANNED_CONCEPTS_DISPLAY]:
+            parts.append(f"  ✗ {item}")
+
+    siblings = [
+        f"  - {c.get('subsection_name', '')}: {c.get('covers', '')}"
+        for i, c in enumerate(contracts) if i != index
+    ]
+    if siblings:
+        parts.append("")
+        parts.append("SIBLING SUBSECTIONS (being written at the same time):")
+        parts.extend(siblings)
+
+    return "\n".join(parts)
+
+
 # =============================================================================
 # SUBSECTION GENERATION
 # =============================================================================
@@ -364,6 +573,7 @@ async def generate_subsection(
     writing_style: Optional[object] = None,
     citation_instructions: Optional[str] = None,
     research_context: Optional[str] = None,
+    sibling_contracts: Optional[str] = None,
 ) -> str:
     """
     Generate a single subsection with full planning context.
@@ -385,6 +595,8 @@ async def generate_subsection(
             When provided, the generator is CONSTRAINED to only make factual claims
             that appear in the allowed claims list and must cite them properly.
         research_context: Optional research findings to incorporate (cutting-edge content)
+        sibling_contracts: Optional contract text from plan_subsection_contracts. Used in
+            parallel mode in place of the previously written subsections.
 
     Returns:
         The subsection content
@@ -469,7 +681,25 @@ If you find yourself about to explain something that was explained above, STOP a
 
 """
 
-    instructions = f"""{style_section}{citation_section}{research_section}{previous_section}Write comprehensive content for this specific subsection/topic in WaitButWhy style (Tim Urban's blog) but with TEXTBOOK-LEVEL DEPTH AND RIGOR.
+    # Build sibling contracts section - replaces previous subsections in parallel mode
+    contracts_section = ""
+    if sibling_contracts:
+        contracts_section = f"""
+=== SUBSECTION CONTRACT (MANDATORY) ===
+
+The other subsections of this section are being written at the same time as yours.
+A planner has divided the section between them:
+
+{sibling_contracts}
+
+Stay inside your contract. If you need a sibling's concept, reference it by subsection name
+in one sentence - do NOT explain it. Pick an example that no sibling owns.
+
+=== END SUBSECTION CONTRACT ===
+
+"""
+
+    instructions = f"""{style_section}{citation_section}{research_section}{previous_section}{contracts_section}Write comprehensive content for this specific subsection/topic in WaitButWhy style (Tim Urban's blog) but with TEXTBOOK-LEVEL DEPTH AND RIGOR.
 
 You have access to the full book context: book plan, chapters overview, chapter plan, and section plan.
 Use this context to understand what depth and coverage is expected.
@@ -778,16 +1008,24 @@ async def write_section_with_subsections(
     writing_style: Optional[object] = None,
     get_citation_instructions: Optional[callable] = None,
     get_research_context: Optional[callable] = None,
+    parallel_subsections: bool = False,
 ) -> tuple:
     """
     Write a complete section by generating each subsection separately.
-    If quality check fails, regenerates subsections with feedback.
+    If quality check fails, regenerates only the subsections it flagged (all of
+    them if none could be singled out) and reuses the accepted ones.
+
+    By default subsections are generated sequentially, each seeing the full text
+    of the ones before it. With parallel_subsections=True, a planning call first
+    produces a contract per subsection and all subsections are generated at once
+    against those contracts (falls back to sequential if planning fails).
 
     Args:
         get_citation_instructions: Optional callback(chapter, section, subsection) -> str
             Returns STRICT citation instructions for each subsection.
         get_research_context: Optional callback(chapter, section) -> str
             Returns research context for cutting-edge content.
+        parallel_subsections: Generate subsections concurrently from planned contracts.
     """
     safe_section = sanitize_filename(section_name)
     section_filename = f"03_section_{section_num:03d}_{safe_section}.txt"
@@ -808,7 +1046,8 @@ async def write_section_with_subsections(
 
     # Get research context ONCE for the entire section (outside the loop)
     full_research_context = None
-    research_assignments = []  # List of assignments from planning
+    research_assignments = {}  # Subsection index -> assignment from planning
+    planned_assignments = []  # Every planned assignment, aligned or not (for banned concepts)
     if get_research_context:
         import inspect
         if inspect.iscoroutinefunction(get_research_context):
@@ -818,7 +1057,7 @@ async def write_section_with_subsections(
         if full_research_context:
             logger.info(f"  Research context for section: {len(full_research_context)} chars")
             # Plan how to distribute research across subsections (prevents repetition)
-            research_assignments = await plan_research_distribution(
+            research_assignments, planned_assignments = await plan_research_distribution(
                 section_name=section_name,
                 section_plan=section_plan_text,
                 subsection_names=subsection_names,
@@ -826,6 +1065,96 @@ async def write_section_with_subsections(
                 language_model=language_model,
             )
 
+    # Plan subsection contracts ONCE for parallel mode (empty list = sequential)
+    subsection_contracts = []
+    if parallel_subsections and len(subsection_names) > 1:
+        subsection_contracts = await plan_subsection_contracts(
+            section_name=section_name,
+            section_plan=section_plan_text,
+            subsection_names=subsection_names,
+            language_model=language_model,
+        )
+
+    async def write_subsection(
+        i: int,
+        subsection_name: str,
+        opening_approach: str,
+        augmented_plan: str,
+        previous_subsections_text: str = "",
+        sibling_contracts: Optional[str] = None,
+    ) -> str:
+        if attempt == 0:
+            logger.info(f"  Generating subsection {i+1}/{len(subsection_names)}: {subsection_name}")
+        else:
+            logger.info(f"  Regenerating subsection {i+1}/{len(subsection_names)}: {subsection_name} (attempt {attempt + 1})")
+
+        # Get subsection-specific citation instructions
+        citation_instructions = None
+        if get_citation_instructions:
+            citation_instructions = get_citation_instructions(chapter_name, section_name, subsection_name)
+
+        # Get ASSIGNED research for this subsection (aligned by index during planning)
+        research_context = None
+        if full_research_context and research_assignments:
+            assignment = research_assignments.get(i)
+            if assignment:
+                research_context = format_assigned_research(
+                    assignment,
+                    full_research_context,
+                    all_assignments=planned_assignments,
+                    current_subsection=subsection_name,
+                )
+                logger.info(f"    Assigned: {len(assignment.get('concepts', []))} concepts, domain={assignment.get('example_domain', 'N/A')}")
+            else:
+                # Fallback to full context if no assignment could be aligned
+                logger.warning(f"    No assignment matched for '{subsection_name[:40]}...', using full context")
+                research_context = full_research_context
+        elif full_research_context:
+            # No assignments planned, use full context
+            research_context = full_research_context
+
+        subsection_input = SubsectionInput(
+            topic=topic_data["topic"],
+            goal=topic_data["goal"],
+            book_name=topic_data["book_name"],
+            audience=topic_data.get("audience", "technical readers"),
+            full_outline=full_outline,
+            book_plan=format_book_plan(book_plan),
+            chapters_overview=format_chapters_overview(chapters_overview),
+            chapter_name=chapter_name,
+            chapter_plan=format_chapter_plan(chapter_plan),
+            section_name=section_name,
+            section_plan=augmented_plan,
+            subsection_name=subsection_name,
+            opening_approach=opening_approach,
+            previous_subsections=previous_subsections_text,
+        )
+
+        return await generate_subsection(
+            subsection_input=subsection_input,
+            language_model=language_model,
+            writing_style=writing_style,
+            citation_instructions=citation_instructions,
+            research_context=research_context,
+            sibling_contracts=sibling_contracts,
+        )
+
+    # Current version of each subsection, by index. Retries only rewrite the
+    # subsections the quality check flagged and reuse the rest.
+    subsection_texts: Dict[int, str] = {}
+    subsection_feedback: Dict[int, str] = {}
+    to_write = list(range(len(subsection_names)))
+    generator_calls = 0
+
+    def plan_for(i: int) -> str:
+        # Add quality feedback to the plan if this is a rewrite
+        augmented_plan = section_plan_text
+        if quality_feedback:
+            augmented_plan = f"{section_plan_text}\n\n=== QUALITY FEEDBACK (fix these issues) ===\n{quality_feedback}"
+        if i in subsection_feedback:
+            augmented_plan += f"\n\n=== ISSUES IN YOUR PREVIOUS VERSION (must fix) ===\n{subsection_feedback[i]}"
+        return augmented_plan
+
     while attempt < max_attempts:
         # Generate section introduction (only on first attempt)
         if attempt == 0:
@@ -839,95 +1168,67 @@ async def write_section_with_subsections(
                 intro_style=intro_style,
                 language_model=language_model
             )
+        else:
+            logger.info(
+                f"  Attempt {attempt + 1}: rewriting {len(to_write)}/{len(subsection_names)} subsections, "
+                f"reusing {len(subsection_names) - len(to_write)}"
+            )
 
-        # Generate each subsection with sequential awareness
-        subsection_contents = []
-        previous_subsections_text = ""  # Build up as we generate
-
-        for i, subsection_name in enumerate(subsection_names):
-            if attempt == 0:
-                logger.info(f"  Generating subsection {i+1}/{len(subsection_names)}: {subsection_name}")
-            else:
-                logger.info(f"  Regenerating subsection {i+1}/{len(subsection_names)}: {subsection_name} (attempt {attempt + 1})")
-
-            opening_approach = intro_styles[style_idx % len(intro_styles)]
+        # Allocate opening approaches up front so both modes rotate styles identically
+        opening_approaches = {}
+        for i in to_write:
+            opening_approaches[i] = intro_styles[style_idx % len(intro_styles)]
             style_idx += 1
 
-            # Add quality feedback to the plan if this is a rewrite
-            augmented_plan = section_plan_text
-            if quality_feedback:
-                augmented_plan = f"{section_plan_text}\n\n=== QUALITY FEEDBACK (fix these issues) ===\n{quality_feedback}"
-
-            # Get subsection-specific citation instructions
-            citation_instructions = None
-            if get_citation_instructions:
-                citation_instructions = get_citation_instructions(chapter_name, section_name, subsection_name)
-
-            # Get ASSIGNED research for this subsection using Decision
-            research_context = None
-            if full_research_context and research_assignments:
-                # Use synalinks.Decision to match subsection to its assignment
-                assignment = await match_subsection_to_assignment(
-                    subsection_name=subsection_name,
-                    assignments=research_assignments,
-                    language_model=language_model,
+        if subsection_contracts:
+            # Parallel mode: every subsection written at once against its contract
+            logger.info(f"  Generating {len(to_write)} subsections in parallel")
+            contents = await asyncio.gather(*[
+                write_subsection(
+                    i,
+                    subsection_names[i],
+                    opening_approaches[i],
+                    plan_for(i),
+                    sibling_contracts=format_sibling_contracts(subsection_contracts, i),
                 )
-                if assignment:
-                    research_context = format_assigned_research(
-                        assignment,
-                        full_research_context,
-                        all_assignments=research_assignments,
-                        current_subsection=subsection_name,
-                    )
-                    logger.info(f"    Assigned: {len(assignment.get('concepts', []))} concepts, domain={assignment.get('example_domain', 'N/A')}")
-                else:
-                    # Fallback to full context if Decision fails
-                    logger.warning(f"    No assignment matched for '{subsection_name[:40]}...', using full context")
-                    research_context = full_research_context
-            elif full_research_context:
-                # No assignments planned, use full context
-                research_context = full_research_context
-
-            subsection_input = SubsectionInput(
-                topic=topic_data["topic"],
-                goal=topic_data["goal"],
-                book_name=topic_data["book_name"],
-                audience=topic_data.get("audience", "technical readers"),
-                full_outline=full_outline,
-                book_plan=format_book_plan(book_plan),
-                chapters_overview=format_chapters_overview(chapters_overview),
-                chapter_name=chapter_name,
-                chapter_plan=format_chapter_plan(chapter_plan),
-                section_name=section_name,
-                section_plan=augmented_plan,
-                subsection_name=subsection_name,
-                opening_approach=opening_approach,
-                previous_subsections=previous_subsections_text,
-            )
-
-            content = await generate_subsection(
-                subsection_input=subsection_input,
-                language_model=language_model,
-                writing_style=writing_style,
-                citation_instructions=citation_instructions,
-                research_context=research_context,
-            )
+                for i in to_write
+            ])
+            for i, content in zip(to_write, contents):
+                if content:
+                    subsection_texts[i] = content
+        else:
+            # Sequential mode: each subsection sees the other subsections written so far
+            for i in to_write:
+                previous_subsections_text = "".join(
+                    f"\n### {subsection_names[j]}\n{subsection_texts[j]}\n"
+                    for j in sorted(subsection_texts) if j != i
+                )
+                content = await write_subsection(
+                    i,
+                    subsection_names[i],
+                    opening_approaches[i],
+                    plan_for(i),
+                    previous_subsections_text=previous_subsections_text,
+                )
+                if content:
+                    subsection_texts[i] = content
 
-            if content:
-                subsection_contents.append((subsection_name, content))
-                # Add to previous subsections for sequential awareness
-                previous_subsections_text += f"\n### {subsection_name}\n{content}\n"
+        generator_calls += len(to_write)
+        if attempt > 0:
+            logger.info(f"    Attempt {attempt + 1}: {len(to_write)} subsection generator calls")
 
         # Assemble section
+        subsection_contents = [(subsection_names[i], subsection_texts[i]) for i in sorted(subsection_texts)]
         section_content = _assemble_section(section_intro, subsection_contents)
 
         # Quality check
-        passed, feedback = await check_section_quality(
+        passed, feedback, flagged = await check_section_quality(
             section_content=section_content,
             section_name=section_name,
             section_plan=section_plan_text,
             audience=topic_data.get("audience", "technical readers"),
             language_model=language_model,
+            subsection_names=subsection_names,
         )
 
         if passed:
@@ -941,10 +1242,28 @@ async def write_section_with_subsections(
             logger.info(f"  Quality check: NEEDS IMPROVEMENT for {section_name} (will retry)")
             logger.info(f"    Feedback: {feedback[:200]}...")
             quality_feedback = feedback
+            subsection_feedback = flagged
+            if flagged:
+                # Subsections that came back empty are rewritten even if not flagged
+                missing = [i for i in range(len(subsection_names)) if i not in subsection_texts]
+                to_write = sorted(set(flagged) | set(missing))
+                logger.info(f"    Flagged subsections: {', '.join(subsection_names[i][:30] for i in sorted(flagged))}")
+                if missing:
+                    logger.info(f"    Missing subsections: {', '.join(subsection_names[i][:30] for i in missing)}")
+            else:
+                to_write = list(range(len(subsection_names)))
+                logger.info("    No individual subsection flagged, rewriting all")
             # Save QC feedback
             if output_dir:
                 qc_filename = f"03_qc_{section_num:03d}_{safe_section}.txt"
-                save_to_file(output_dir, qc_filename, f"Attempt {attempt}\nFeedback: {feedback}")
+                flagged_text = "\n".join(f"- {subsection_names[i]}: {issues}" for i, issues in sorted(flagged.items()))
+                save_to_file(output_dir, qc_filename, f"Attempt {attempt}\nFeedback: {feedback}\nFlagged subsections:\n{flagged_text or '(all)'}")
+
+    retries = min(attempt, max_attempts - 1)
+    logger.info(
+        f"  Section '{section_name[:40]}': {retries} retries, {generator_calls} subsection generator calls "
+        f"(full-section rewrites would have used {(retries + 1) * len(subsection_names)})"
+    )
 
     # Save the final section
     if output_dir:
@@ -973,6 +1292,7 @@ async def write_chapter_with_sections(
     get_research_context: Optional[callable] = None,
     citation_manager: Optional[object] = None,
     chapter_papers: Optional[List[dict]] = None,
+    parallel_subsections: bool = False,
 ) -> tuple:
     """
     Write a complete chapter by:
@@ -984,6 +1304,7 @@ async def write_chapter_with_sections(
         get_research_context: Optional callback(chapter, section) -> str for research context
         citation_manager: Optional CitationManager for per-chapter references (from full citation pipeline)
         chapter_papers: Optional list of paper dicts for fast chapter references (from research)
+        parallel_subsections: Generate each section's subsections concurrently from planned contracts
 
     Returns:
         Tuple of (chapter_content, new_style_idx)
@@ -1051,6 +1372,7 @@ async def write_chapter_with_sections(
             writing_style=writing_style,
             get_citation_instructions=get_citation_instructions,
             get_research_context=get_research_context,
+            parallel_subsections=parallel_subsections,
         )
 
         section_contents.append((section_name, section_content))
@@ -1165,6 +1487,18 @@ async def write_chapter_with_sections(
     return (chapter_data, style_idx)
 
 
+def _count_style_slots(chapter_sections: Dict[str, List[str]]) -> int:
+    """Number of intro styles a chapter consumes on a first-pass write.
+
+    Each non-empty section takes one style for its intro plus one per subsection.
+    """
+    return sum(
+        1 + len(subsection_names)
+        for subsection_names in chapter_sections.values()
+        if subsection_names
+    )
+
+
 async def write_all_sections_direct(
     topic_data: dict,
     hierarchy: dict,
@@ -1181,6 +1515,8 @@ async def write_all_sections_direct(
     get_research_context: Optional[callable] = None,
     citation_manager: Optional[object] = None,
     chapter_paper_assignments: Optional[Dict[str, List[dict]]] = None,
+    max_parallel_chapters: int = 1,
+    parallel_subsections: bool = False,
 ) -> List[tuple]:
     """
     Write all chapters by generating each subsection separately with full context.
@@ -1191,6 +1527,11 @@ async def write_all_sections_direct(
     - Each subsection is generated independently with full planning context
     - Sections assembled by concatenation (intro + subsections)
     - Chapters assembled by concatenation (intro + sections)
+    - Up to max_parallel_chapters chapters are written concurrently
+
+    Intro style rotation is pre-allocated per chapter (each chapter starts at the
+    offset it would reach in a sequential write), so output does not depend on
+    chapter completion order or on which chapters were loaded from disk.
 
     Args:
         writing_style: Optional WritingStyle object to apply during writing
@@ -1201,9 +1542,11 @@ async def write_all_sections_direct(
             and returns research context string for cutting-edge content.
         citation_manager: Optional CitationManager for per-chapter references (slow path)
         chapter_paper_assignments: Optional dict mapping chapter_name -> list of paper dicts (fast path)
+        max_parallel_chapters: Maximum number of chapters written concurrently (1 = sequential)
+        parallel_subsections: Generate each section's subsections concurrently from planned contracts
 
     Returns:
-        List of (chapter_name, chapter_content_dict) tuples
+        List of (chapter_name, chapter_content_dict) tuples, in outline order
     """
     from .planning import get_chapter_plan_by_index
 
@@ -1216,9 +1559,6 @@ async def write_all_sections_direct(
         for ch, sections in hierarchy.items()
     ]})
 
-    written_chapters = []
-    style_idx = 0
-
     chapter_names = list(hierarchy.keys())
     total_chapters = len(chapter_names)
 
@@ -1226,43 +1566,61 @@ async def write_all_sections_direct(
         chapter_names = chapter_names[:max_chapters]
         total_chapters = len(chapter_names)
 
-    for chapter_idx, chapter_name in enumerate(chapter_names):
-        chapter_plan = get_chapter_plan_by_index(chapter_plans, chapter_idx)
-        chapter_sections = hierarchy.get(chapter_name, {})
-        chapter_section_plans = all_section_plans.get(chapter_name, {})
-
-        # Get papers for this chapter (for fast references)
-        # Note: chapter_name has number prefix like "1. Chapter Name"
-        # but chapter_paper_assignments uses names without prefix
-        chapter_papers = None
-        if chapter_paper_assignments:
-            # Strip number prefix (e.g., "1. " or "2. ") to match assignment keys
-            import re
-            base_chapter_name = re.sub(r'^\d+\.\s*', '', chapter_name)
-            chapter_papers = chapter_paper_assignments.get(base_chapter_name, [])
-
-        chapter_data, style_idx = await write_chapter_with_sections(
-            topic_data=topic_data,
-            full_outline=full_outline,
-            book_plan=book_plan,
-            chapters_overview=chapters_overview,
-            chapter_name=chapter_name,
-            chapter_number=chapter_idx + 1,
-            total_chapters=total_chapters,
-            chapter_plan=chapter_plan,
-            chapter_section_plans=chapter_section_plans,
-            chapter_sections=chapter_sections,
-            language_model=language_model,
-            output_dir=output_dir,
-            intro_styles=intro_styles,
-            style_idx=style_idx,
-            writing_style=writing_style,
-            get_citation_instructions=get_citation_instructions,
-            get_research_context=get_research_context,
-            citation_manager=citation_manager,
-            chapter_papers=chapter_papers,
-        )
+    # Pre-allocate the starting style index for each chapter
+    chapter_style_offsets = []
+    style_offset = 0
+    for chapter_name in chapter_names:
+        chapter_style_offsets.append(style_offset)
+        style_offset += _count_style_slots(hierarchy.get(chapter_name, {}))
+
+    semaphore = asyncio.Semaphore(max(1, max_parallel_chapters))
+    if max_parallel_chapters > 1:
+        logger.info(f"Writing {total_chapters} chapters with up to {max_parallel_chapters} in parallel")
+
+    async def write_one(chapter_idx: int, chapter_name: str) -> tuple:
+        async with semaphore:
+            chapter_plan = get_chapter_plan_by_index(chapter_plans, chapter_idx)
+            chapter_sections = hierarchy.get(chapter_name, {})
+            chapter_section_plans = all_section_plans.get(chapter_name, {})
+
+            # Get papers for this chapter (for fast references)
+            # Note: chapter_name has number prefix like "1. Chapter Name"
+            # but chapter_paper_assignments uses names without prefix
+            chapter_papers = None
+            if chapter_paper_assignments:
+                # Strip number prefix (e.g., "1. " or "2. ") to match assignment keys
+                base_chapter_name = re.sub(r'^\d+\.\s*', '', chapter_name)
+                chapter_papers = chapter_paper_assignments.get(base_chapter_name, [])
+
+            chapter_data, _ = await write_chapter_with_sections(
+                topic_data=topic_data,
+                full_outline=full_outline,
+                book_plan=book_plan,
+                chapters_overview=chapters_overview,
+                chapter_name=chapter_name,
+                chapter_number=chapter_idx + 1,
+                total_chapters=total_chapters,
+                chapter_plan=chapter_plan,
+                chapter_section_plans=chapter_section_plans,
+                chapter_sections=chapter_sections,
+                language_model=language_model,
+                output_dir=output_dir,
+                intro_styles=intro_styles,
+                style_idx=chapter_style_offsets[chapter_idx],
+                writing_style=writing_style,
+                get_citation_instructions=get_citation_instructions,
+                get_research_context=get_research_context,
+                citation_manager=citation_manager,
+                chapter_papers=chapter_papers,
+                parallel_subsections=parallel_subsections,
+            )
+
+            return (chapter_name, chapter_data)
 
-        written_chapters.append((chapter_name, chapter_data))
+    # gather preserves input order, so chapters come back in outline order
+    written_chapters = await asyncio.gather(*[
+        write_one(chapter_idx, chapter_name)
+        for chapter_idx, chapter_name in enumerate(chapter_names)
+    ])
 
-    return written_chapters
+    return list(written_chapters)
@@ -6,12 +6,15 @@ the book's content, then generates the image with the configured model.
 """
 
 import os
+import asyncio
 import logging
 from typing import Optional, Literal
 
 import synalinks
 
 from .models import CoverPromptInput, CoverPromptOutput
+from .rate_limit import acquire_quota
+from .credentials import get_gemini_api_key, get_genai_client
 
 logger = logging.getLogger(__name__)
 
@@ -338,13 +341,12 @@ async def generate_cover(
         The output path if successful, None otherwise
     """
     try:
-        from google import genai
         from google.genai import types
     except ImportError:
         logger.warning("google-genai not installed. Skipping cover generation.")
         return None
 
-    api_key = os.getenv('GEMINI_API_KEY') or os.getenv('GOOGLE_API_KEY')
+    api_key = get_gemini_api_key()
     if not api_key:
         logger.warning("No API key found for cover generation. Skipping.")
         return None
@@ -375,7 +377,7 @@ async def generate_cover(
             f.write(f"Style: {style}\nModel: {image_model}\n\n{prompt}")
         logger.info(f"Cover prompt saved to: {prompt_path}")
 
-    client = genai.Client(api_key=api_key)
+    client = get_genai_client(api_key)
 
     # Extract model name (remove prefix like "gemini/")
     model_id = image_model.split("/")[-1] if "/" in image_model else image_model
@@ -387,8 +389,11 @@ async def generate_cover(
     temp_path = output_path.replace('.png', '_illustration.png')
 
     try:
+        await acquire_quota(image_model)
+
         # Use generate_content API for Gemini models
-        response = client.models.generate_content(
+        response = await asyncio.to_thread(
+            client.models.generate_content,
             model=model_id,
             contents=prompt,
             config=types.GenerateContentConfig(
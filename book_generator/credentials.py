@@ -0,0 +1,65 @@
+"""
+Per-job Gemini credentials.
+
+API jobs may bring their own Gemini key. Instead of swapping the process
+environment (which concurrent jobs would race on), the key is bound to the
+job's context with set_gemini_api_key() and every Gemini call site resolves
+it through get_gemini_api_key() / get_genai_client(). Outside a job the
+GEMINI_API_KEY / GOOGLE_API_KEY environment variables are used as before.
+"""
+
+import os
+import threading
+import contextvars
+from collections import OrderedDict
+from typing import Optional
+
+# Clients kept alive per distinct key (one per concurrent user is plenty)
+_MAX_CLIENTS = 32
+
+_job_api_key: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "gemini_api_key", default=None
+)
+
+_clients: "OrderedDict[str, object]" = OrderedDict()
+_clients_lock = threading.Lock()
+
+
+def set_gemini_api_key(api_key: Optional[str]) -> contextvars.Token:
+    """Use api_key for Gemini calls made from the current context (and tasks it spawns)."""
+    return _job_api_key.set(api_key)
+
+
+def get_job_api_key() -> Optional[str]:
+    """The key bound to the current job, or None if the job uses the environment."""
+    return _job_api_key.get()
+
+
+def get_gemini_api_key() -> Optional[str]:
+    """Gemini key for the current context: the job's own key, else the environment."""
+    return _job_api_key.get() or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+
+
+def get_genai_client(api_key: Optional[str] = None):
+    """
+    Shared google-genai Client for api_key (default: the current context's key).
+
+    Raises:
+        ValueError: If no key is configured
+    """
+    from google import genai
+
+    api_key = api_key or get_gemini_api_key()
+    if not api_key:
+        raise ValueError("GEMINI_API_KEY not configured")
+
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = genai.Client(api_key=api_key)
+            _clients[api_key] = client
+            if len(_clients) > _MAX_CLIENTS:
+                _clients.popitem(last=False)
+        else:
+            _clients.move_to_end(api_key)
+        return client
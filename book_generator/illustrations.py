@@ -10,6 +10,7 @@ This module handles:
 
 import os
 import re
+import asyncio
 import logging
 import base64
 from typing import List, Optional, Dict, Any
@@ -25,6 +26,8 @@ from .models import (
     ImagePromptOutput,
 )
 from .utils import output_exists, load_json_from_file, save_to_file, save_json_to_file, sanitize_filename
+from .rate_limit import acquire_quota
+from .credentials import get_gemini_api_key, get_genai_client
 
 logger = logging.getLogger(__name__)
 
@@ -207,18 +210,19 @@ Include style guidance like: "clean illustration style", "technical diagram aest
 
         # Generate image using the Gemini model
         try:
-            from google import genai
             from google.genai import types
 
-            api_key = os.getenv('GEMINI_API_KEY') or os.getenv('GOOGLE_API_KEY')
+            api_key = get_gemini_api_key()
             if not api_key:
                 logger.warning("No API key found for image generation")
                 return None
 
-            client = genai.Client(api_key=api_key)
+            client = get_genai_client(api_key)
             model_id = image_model.split("/")[-1] if "/" in image_model else image_model
 
-            response = client.models.generate_content(
+            await acquire_quota(image_model)
+            response = await asyncio.to_thread(
+                client.models.generate_content,
                 model=model_id,
                 contents=image_prompt,
                 config=types.GenerateContentConfig(
@@ -420,31 +424,38 @@ async def illustrate_all_chapters(
     language_model,
     output_dir: str,
     enable_images: bool = True,
-    image_model: str = "gemini/gemini-3-pro-image-preview"
+    image_model: str = "gemini/gemini-3-pro-image-preview",
+    max_parallel: int = 1,
 ) -> List[tuple]:
     """
     Add illustrations to all chapters.
 
+    Up to max_parallel chapters are illustrated at the same time; the
+    result keeps the original chapter order.
+
     Returns:
         List of (chapter_name, illustrated_content_dict) tuples
     """
-    illustrated_chapters = []
+    semaphore = asyncio.Semaphore(max(1, max_parallel))
 
-    for i, (chapter_name, chapter_data) in enumerate(chapters, 1):
+    async def illustrate_one(i: int, chapter_name: str, chapter_data: dict) -> tuple:
         content = chapter_data.get("chapter_content", "")
 
         if not content:
-            illustrated_chapters.append((chapter_name, chapter_data))
-            continue
+            return (chapter_name, chapter_data)
 
-        try:
-            illustrated_content = await illustrate_chapter(
-                content, chapter_name, i, topic, audience,
-                language_model, output_dir, enable_images, image_model
-            )
-            illustrated_chapters.append((chapter_name, {"chapter_content": illustrated_content}))
-        except Exception as e:
-            logger.warning(f"Illustration failed for chapter {i}: {e}")
-            illustrated_chapters.append((chapter_name, chapter_data))
-
-    return illustrated_chapters
+        async with semaphore:
+            try:
+                illustrated_content = await illustrate_chapter(
+                    content, chapter_name, i, topic, audience,
+                    language_model, output_dir, enable_images, image_model
+                )
+                return (chapter_name, {"chapter_content": illustrated_content})
+            except Exception as e:
+                logger.warning(f"Illustration failed for chapter {i}: {e}")
+                return (chapter_name, chapter_data)
+
+    return list(await asyncio.gather(*(
+        illustrate_one(i, chapter_name, chapter_data)
+        for i, (chapter_name, chapter_data) in enumerate(chapters, 1)
+    )))
@@ -0,0 +1,93 @@
+"""
+In-process pub/sub for job progress.
+
+JobStore publishes every change (field updates plus the new log entries)
+here as it happens; the SSE endpoint subscribes per job and forwards the
+deltas to the client. Publishers may run on any thread or event loop
+(jobs run on the executor's loop, API requests on the server's loop), so
+events are handed to each subscriber's own loop with call_soon_threadsafe.
+
+Delivery is best-effort: a slow subscriber whose queue fills up is
+dropped and falls back to re-reading SQLite, which stays the durable
+source of truth.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Events buffered per subscriber before it is considered too slow
+DEFAULT_QUEUE_SIZE = 256
+
+
+class Subscription:
+    """One subscriber's queue of events for a job. Use as an async iterator."""
+
+    def __init__(self, broker: "JobEventBroker", job_id: str, maxsize: int):
+        self.broker = broker
+        self.job_id = job_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def _put(self, event: dict) -> None:
+        # Runs on the subscriber's loop
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            logger.warning(f"Event subscriber for job {self.job_id} fell behind; dropping stream")
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """Next event, or None if timeout elapses first."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+
+class JobEventBroker:
+    """Fan-out of job events to subscribers on any event loop."""
+
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, List[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, job_id: str) -> Subscription:
+        """Start receiving events for job_id. Must be called from a running event loop."""
+        sub = Subscription(self, job_id, self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(job_id, []).append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subscribers.get(sub.job_id, [])
+            if sub in subs:
+                subs.remove(sub)
+            if not subs:
+                self._subscribers.pop(sub.job_id, None)
+
+    def publish(self, job_id: str, event: dict) -> None:
+        """Deliver event to every subscriber of job_id. Safe from any thread."""
+        with self._lock:
+            subs = list(self._subscribers.get(job_id, ()))
+        for sub in subs:
+            try:
+                sub.loop.call_soon_threadsafe(sub._put, event)
+            except RuntimeError:
+                # Subscriber's loop has closed
+                self.unsubscribe(sub)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(s) for s in self._subscribers.values())
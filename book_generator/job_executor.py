@@ -0,0 +1,131 @@
+"""
+Background executor for book generation jobs.
+
+Jobs run on a dedicated event loop in a worker thread, so long generations
+never compete with the API's own event loop for status polls. A fixed
+number of worker slots pull from a priority queue (higher priority first,
+FIFO within a priority). Each job gets a CancellationToken; cancelling a
+queued job drops it, cancelling a running job trips the token (checked
+between pipeline stages and before model calls) and cancels its task.
+"""
+
+import asyncio
+import logging
+import itertools
+import threading
+from typing import Awaitable, Callable, Dict, Optional
+
+from .cancellation import CancellationToken, set_cancellation_token
+
+logger = logging.getLogger(__name__)
+
+
+class JobExecutor:
+    """
+    Bounded pool of job workers on a private event loop.
+
+    Args:
+        run_job: Coroutine function run_job(job_id) that performs one job
+        workers: Number of jobs that may run at the same time
+    """
+
+    def __init__(self, run_job: Callable[[str], Awaitable[None]], workers: int = 2):
+        self.run_job = run_job
+        self.workers = max(1, workers)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._queued: Dict[str, int] = {}  # job_id -> priority, for jobs not yet started
+        self._running: Dict[str, tuple] = {}  # job_id -> (task, token)
+
+    def start(self) -> None:
+        """Start the worker thread and its event loop (idempotent)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run_loop, name="job-executor", daemon=True)
+            self._thread.start()
+        self._started.wait()
+        logger.info(f"Job executor started with {self.workers} worker slot(s)")
+
+    def _run_loop(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.PriorityQueue()
+        for i in range(self.workers):
+            self._loop.create_task(self._worker(i))
+        self._started.set()
+        self._loop.run_forever()
+
+    def submit(self, job_id: str, priority: int = 0) -> int:
+        """
+        Queue a job. Higher priority runs first; equal priorities run in submission order.
+
+        Returns:
+            Number of jobs queued ahead of this one
+        """
+        self.start()
+        with self._lock:
+            ahead = sum(1 for p in self._queued.values() if p >= priority)
+            self._queued[job_id] = priority
+        entry = (-priority, next(self._seq), job_id)
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, entry)
+        return ahead
+
+    def cancel(self, job_id: str) -> Optional[str]:
+        """
+        Cancel a job.
+
+        Returns:
+            "queued" if it had not started, "running" if it was signalled, None if unknown
+        """
+        with self._lock:
+            if self._queued.pop(job_id, None) is not None:
+                return "queued"
+            running = self._running.get(job_id)
+        if running is None:
+            return None
+        task, token = running
+        token.cancel()
+        self._loop.call_soon_threadsafe(task.cancel)
+        return "running"
+
+    def stats(self) -> dict:
+        """Worker slots and queue occupancy."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "running": len(self._running),
+                "queued": len(self._queued),
+            }
+
+    async def _worker(self, slot: int) -> None:
+        while True:
+            _, _, job_id = await self._queue.get()
+            with self._lock:
+                if self._queued.pop(job_id, None) is None:
+                    continue  # cancelled while queued
+                token = CancellationToken()
+                job_task = self._loop.create_task(self._run_job(job_id, token))
+                self._running[job_id] = (job_task, token)
+
+            logger.info(f"Worker {slot} starting job {job_id}")
+            try:
+                await job_task
+            except asyncio.CancelledError:
+                if not job_task.cancelled():
+                    raise  # the worker itself is being shut down
+                logger.info(f"Job {job_id} cancelled")
+            except Exception as e:
+                logger.exception(f"Job {job_id} crashed in worker {slot}: {e}")
+            finally:
+                with self._lock:
+                    self._running.pop(job_id, None)
+
+    async def _run_job(self, job_id: str, token: CancellationToken) -> None:
+        # Runs in its own task, so the token binding is scoped to this job
+        set_cancellation_token(token)
+        await self.run_job(job_id)
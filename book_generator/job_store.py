@@ -3,174 +3,291 @@ SQLite-backed job store for the book generation API.
 
 Replaces the in-memory dict so that jobs survive server restarts
 and are safe for concurrent access.
+
+Each thread keeps one open connection. Progress messages are appended to
+an indexed job_logs table instead of rewriting a JSON blob, and
+high-frequency progress updates can be coalesced in memory (reads see
+them immediately) and flushed at most once per interval per job.
+
+When given a JobEventBroker, every update is also published as a delta
+as soon as it is recorded, ahead of the coalesced write.
 """
 
+import os
 import json
+import time
+import asyncio
 import sqlite3
 import threading
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
+
+from .job_events import JobEventBroker
 
 logger = logging.getLogger(__name__)
 
 # Default location: data/jobs.db relative to project root
 _DEFAULT_DB_PATH = "data/jobs.db"
 
+# Number of most recent log entries returned with a job
+_LOG_TAIL = 50
+
+# Minimum seconds between coalesced progress flushes for one job
+DEFAULT_FLUSH_INTERVAL = 0.5
+
 
 class JobStore:
     """Persistent job storage using SQLite with WAL mode."""
 
-    def __init__(self, db_path: Optional[str] = None):
+    _UPDATABLE = {
+        "status", "progress", "current_stage", "message",
+        "book_name", "pdf_path", "error",
+    }
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        events: Optional[JobEventBroker] = None,
+    ):
         self._db_path = db_path or _DEFAULT_DB_PATH
+        self.flush_interval = flush_interval
+        self.events = events
         self._lock = threading.Lock()
+        self._local = threading.local()
+
+        # Coalesced progress not yet written: job_id -> {"fields": {...}, "logs": [...]}
+        self._pending: Dict[str, dict] = {}
+        self._pending_lock = threading.Lock()
+        self._last_flush: Dict[str, float] = {}
+
         self._init_db()
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path, timeout=10)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA busy_timeout=5000")
+        """This thread's connection, opened on first use and kept for reuse."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._db_path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
         return conn
 
     def _init_db(self):
-        """Create the jobs table if it doesn't exist."""
-        import os
+        """Create the tables if they don't exist and migrate legacy log blobs."""
         os.makedirs(os.path.dirname(self._db_path) or ".", exist_ok=True)
 
         with self._lock:
             conn = self._get_conn()
+            # WAL is persistent for the database file, so set it once here
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    progress INTEGER NOT NULL DEFAULT 0,
+                    current_stage TEXT NOT NULL DEFAULT 'Initializing',
+                    message TEXT NOT NULL DEFAULT 'Job created, waiting to start',
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    book_name TEXT,
+                    pdf_path TEXT,
+                    error TEXT,
+                    request_json TEXT NOT NULL,
+                    logs_json TEXT NOT NULL DEFAULT '[]'
+                )
+            """)
+            # Add logs_json column to existing tables (idempotent)
             try:
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS jobs (
-                        job_id TEXT PRIMARY KEY,
-                        status TEXT NOT NULL DEFAULT 'pending',
-                        progress INTEGER NOT NULL DEFAULT 0,
-                        current_stage TEXT NOT NULL DEFAULT 'Initializing',
-                        message TEXT NOT NULL DEFAULT 'Job created, waiting to start',
-                        created_at TEXT NOT NULL,
-                        updated_at TEXT NOT NULL,
-                        book_name TEXT,
-                        pdf_path TEXT,
-                        error TEXT,
-                        request_json TEXT NOT NULL,
-                        logs_json TEXT NOT NULL DEFAULT '[]'
-                    )
-                """)
-                # Add logs_json column to existing tables (idempotent)
-                try:
-                    conn.execute("ALTER TABLE jobs ADD COLUMN logs_json TEXT NOT NULL DEFAULT '[]'")
-                except sqlite3.OperationalError:
-                    pass  # column already exists
-                conn.commit()
-            finally:
-                conn.close()
+                conn.execute("ALTER TABLE jobs ADD COLUMN logs_json TEXT NOT NULL DEFAULT '[]'")
+            except sqlite3.OperationalError:
+                pass  # column already exists
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_logs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT NOT NULL,
+                    t TEXT NOT NULL,
+                    msg TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_job_logs_job ON job_logs(job_id, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)")
+
+            # Move logs stored in the old logs_json blob into job_logs (one-time)
+            legacy = conn.execute(
+                "SELECT job_id, logs_json FROM jobs WHERE logs_json != '[]'"
+            ).fetchall()
+            for row in legacy:
+                entries = json.loads(row["logs_json"] or "[]")
+                conn.executemany(
+                    "INSERT INTO job_logs (job_id, t, msg) VALUES (?, ?, ?)",
+                    [(row["job_id"], e.get("t", ""), e.get("msg", "")) for e in entries],
+                )
+                conn.execute("UPDATE jobs SET logs_json = '[]' WHERE job_id = ?", (row["job_id"],))
+            if legacy:
+                logger.info(f"Migrated logs for {len(legacy)} jobs into job_logs")
+            conn.commit()
 
     def create(self, job_id: str, request_data: dict) -> dict:
         """Insert a new job. Returns the job as a dict."""
         now = datetime.utcnow().isoformat()
         with self._lock:
             conn = self._get_conn()
-            try:
-                conn.execute(
-                    """INSERT INTO jobs
-                       (job_id, status, progress, current_stage, message,
-                        created_at, updated_at, request_json)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (job_id, "pending", 0, "Initializing",
-                     "Job created, waiting to start", now, now,
-                     json.dumps(request_data)),
-                )
-                conn.commit()
-            finally:
-                conn.close()
+            conn.execute(
+                """INSERT INTO jobs
+                   (job_id, status, progress, current_stage, message,
+                    created_at, updated_at, request_json)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (job_id, "pending", 0, "Initializing",
+                 "Job created, waiting to start", now, now,
+                 json.dumps(request_data)),
+            )
+            conn.commit()
 
         return self.get(job_id)
 
     def get(self, job_id: str) -> Optional[dict]:
-        """Fetch a single job by ID. Returns None if not found."""
+        """Fetch a single job by ID, including unflushed progress. Returns None if not found."""
         conn = self._get_conn()
-        try:
-            row = conn.execute(
-                "SELECT * FROM jobs WHERE job_id = ?", (job_id,)
-            ).fetchone()
-            if row is None:
-                return None
-            return self._row_to_dict(row)
-        finally:
-            conn.close()
-
-    def update(self, job_id: str, **fields) -> Optional[dict]:
+        row = conn.execute(
+            "SELECT * FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        logs = conn.execute(
+            "SELECT t, msg FROM job_logs WHERE job_id = ? ORDER BY id DESC LIMIT ?",
+            (job_id, _LOG_TAIL),
+        ).fetchall()
+        job = self._row_to_dict(row)
+        job["logs"] = [{"t": r["t"], "msg": r["msg"]} for r in reversed(logs)]
+
+        with self._pending_lock:
+            pending = self._pending.get(job_id)
+            if pending:
+                job.update(pending["fields"])
+                job["logs"] = (job["logs"] + pending["logs"])[-_LOG_TAIL:]
+        return job
+
+    def update(self, job_id: str, **fields) -> None:
         """
-        Update one or more fields on a job.
+        Update one or more fields on a job immediately.
 
         Accepted fields: status, progress, current_stage, message,
                          book_name, pdf_path, error.
-        """
-        allowed = {
-            "status", "progress", "current_stage", "message",
-            "book_name", "pdf_path", "error",
-        }
-        to_set = {k: v for k, v in fields.items() if k in allowed}
-        if not to_set:
-            return self.get(job_id)
 
+        Any coalesced progress for the job is written in the same
+        transaction, so this update is never overwritten by an older one.
+        """
         now = datetime.utcnow().isoformat()
-        to_set["updated_at"] = now
+        updates = {k: v for k, v in fields.items() if k in self._UPDATABLE}
+        new_logs = [{"t": now, "msg": fields["message"]}] if "message" in fields else []
+        with self._lock:
+            with self._pending_lock:
+                pending = self._pending.pop(job_id, None)
 
+            to_set = dict(pending["fields"]) if pending else {}
+            logs = list(pending["logs"]) if pending else []
+            to_set.update(updates)
+            logs.extend(new_logs)
+
+            self._write(job_id, to_set, logs, now)
+        self._publish(job_id, updates, new_logs, now)
+
+    def _write(self, job_id: str, to_set: dict, logs: List[dict], now: str) -> None:
+        """Apply field updates and append log entries in one transaction. Caller holds _lock."""
+        if not to_set and not logs:
+            return
+        to_set = dict(to_set, updated_at=now)
         set_clause = ", ".join(f"{k} = ?" for k in to_set)
         values = list(to_set.values()) + [job_id]
 
+        conn = self._get_conn()
+        conn.execute(f"UPDATE jobs SET {set_clause} WHERE job_id = ?", values)
+        if logs:
+            conn.executemany(
+                "INSERT INTO job_logs (job_id, t, msg) VALUES (?, ?, ?)",
+                [(job_id, e["t"], e["msg"]) for e in logs],
+            )
+        conn.commit()
+        self._last_flush[job_id] = time.monotonic()
+
+    async def update_progress(self, job_id: str, **fields) -> None:
+        """
+        Record a progress update, writing at most once per flush_interval per job.
+
+        Updates arriving within the interval are merged (later fields win,
+        every message is kept in the log). get() sees them immediately;
+        the write happens off the event loop.
+        """
+        now = datetime.utcnow().isoformat()
+        with self._pending_lock:
+            pending = self._pending.get(job_id)
+            schedule = pending is None
+            if pending is None:
+                pending = self._pending[job_id] = {"fields": {}, "logs": []}
+            updates = {k: v for k, v in fields.items() if k in self._UPDATABLE}
+            new_logs = [{"t": now, "msg": fields["message"]}] if "message" in fields else []
+            pending["fields"].update(updates)
+            pending["logs"].extend(new_logs)
+        self._publish(job_id, updates, new_logs, now)
+
+        if schedule:
+            elapsed = time.monotonic() - self._last_flush.get(job_id, 0.0)
+            delay = max(0.0, self.flush_interval - elapsed)
+            loop = asyncio.get_running_loop()
+            loop.call_later(delay, lambda: loop.run_in_executor(None, self.flush, job_id))
+
+    def _publish(self, job_id: str, updates: dict, logs: List[dict], now: str) -> None:
+        if self.events is None or (not updates and not logs):
+            return
+        self.events.publish(job_id, {**updates, "updated_at": now, "logs": logs})
+
+    def flush(self, job_id: Optional[str] = None) -> None:
+        """Write coalesced progress for one job (or all jobs) now."""
+        now = datetime.utcnow().isoformat()
         with self._lock:
-            conn = self._get_conn()
-            try:
-                conn.execute(
-                    f"UPDATE jobs SET {set_clause} WHERE job_id = ?",
-                    values,
-                )
-                # Append to log if message is provided
-                if "message" in fields:
-                    row = conn.execute(
-                        "SELECT logs_json FROM jobs WHERE job_id = ?", (job_id,)
-                    ).fetchone()
-                    logs = json.loads(row[0]) if row and row[0] else []
-                    logs.append({"t": now, "msg": fields["message"]})
-                    # Keep last 50 entries
-                    if len(logs) > 50:
-                        logs = logs[-50:]
-                    conn.execute(
-                        "UPDATE jobs SET logs_json = ? WHERE job_id = ?",
-                        (json.dumps(logs), job_id),
-                    )
-                conn.commit()
-            finally:
-                conn.close()
+            with self._pending_lock:
+                if job_id is None:
+                    batch = self._pending
+                    self._pending = {}
+                else:
+                    pending = self._pending.pop(job_id, None)
+                    batch = {job_id: pending} if pending else {}
 
-        return self.get(job_id)
+            for jid, pending in batch.items():
+                try:
+                    self._write(jid, pending["fields"], pending["logs"], now)
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to flush progress for job {jid}: {e}")
 
     def list_all(self) -> list[dict]:
-        """Return all jobs, most recent first."""
+        """Return all jobs, most recent first (without logs)."""
         conn = self._get_conn()
-        try:
-            rows = conn.execute(
-                "SELECT * FROM jobs ORDER BY created_at DESC"
-            ).fetchall()
-            return [self._row_to_dict(r) for r in rows]
-        finally:
-            conn.close()
+        rows = conn.execute(
+            "SELECT * FROM jobs ORDER BY created_at DESC"
+        ).fetchall()
+        return [self._row_to_dict(r) for r in rows]
+
+    def list_by_status(self, status: str) -> list[dict]:
+        """Return jobs in the given status, oldest first (without logs)."""
+        conn = self._get_conn()
+        rows = conn.execute(
+            "SELECT * FROM jobs WHERE status = ? ORDER BY created_at ASC", (status,)
+        ).fetchall()
+        return [self._row_to_dict(r) for r in rows]
 
     def count(self) -> int:
         """Return total number of jobs."""
         conn = self._get_conn()
-        try:
-            row = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
-            return row[0]
-        finally:
-            conn.close()
+        row = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
+        return row[0]
 
     @staticmethod
     def _row_to_dict(row: sqlite3.Row) -> dict:
         d = dict(row)
         d["request"] = json.loads(d.pop("request_json"))
-        d["logs"] = json.loads(d.pop("logs_json", "[]") or "[]")
+        d.pop("logs_json", None)
+        d["logs"] = []
         return d
@@ -0,0 +1,231 @@
+"""
+Persistent, content-addressed cache for language model responses.
+
+Wraps synalinks.LanguageModel so that every Generator, Decision and Branch
+call is looked up by (model, call kwargs such as temperature, full prompt
+messages, output schema) before going to the provider. Responses are stored
+in SQLite and shared across runs and API jobs in the same process, with
+size-based LRU eviction.
+
+Repeated identical calls within one run are deliberate samples (e.g. the
+four temperature-1.0 concept branches in outline.py), so the key also
+carries the call's occurrence number: the Nth identical call of a run maps
+to the Nth cached sample instead of replaying the first.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import logging
+from typing import Dict, Optional
+
+from .rate_limit import RateLimitedLanguageModel
+
+logger = logging.getLogger(__name__)
+
+# Default location: data/llm_cache.db relative to project root
+_DEFAULT_DB_PATH = "data/llm_cache.db"
+
+# Default size budget for cached responses
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Fraction of the budget to shrink to when evicting (avoids evicting on every put)
+_EVICT_TARGET_RATIO = 0.9
+
+
+class LLMResponseCache:
+    """SQLite-backed response store with LRU eviction and hit/miss counters."""
+
+    def __init__(self, db_path: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._db_path = db_path or _DEFAULT_DB_PATH
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._conn = self._connect()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self._db_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self._db_path, timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response_json TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)"
+        )
+        conn.commit()
+        return conn
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: dict,
+        schema: Optional[dict],
+        call_kwargs: dict,
+        occurrence: int = 0,
+    ) -> str:
+        """
+        Content address for a call: hash of model, kwargs, prompt and schema.
+
+        occurrence numbers repeated identical calls within a run (0 for the
+        first); it is left out of the hash for the first so those keys match
+        entries written before it existed.
+        """
+        fields = {
+            "model": model,
+            "kwargs": call_kwargs,
+            "messages": messages,
+            "schema": schema,
+        }
+        if occurrence:
+            fields["occurrence"] = occurrence
+        payload = json.dumps(
+            fields,
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached response for key (refreshing its LRU position), or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response_json FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, model: str, response: dict) -> None:
+        """Store a response and evict least-recently-used entries if over budget."""
+        response_json = json.dumps(response, ensure_ascii=False, default=str)
+        size = len(response_json.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                """INSERT OR REPLACE INTO responses
+                   (key, model, response_json, size, created_at, last_access)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (key, model, response_json, size, now, now),
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until under the target size. Caller holds the lock."""
+        target = int(self.max_bytes * _EVICT_TARGET_RATIO)
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall()
+        to_delete = []
+        for key, size in rows:
+            if self._total_bytes <= target:
+                break
+            to_delete.append((key,))
+            self._total_bytes -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", to_delete)
+        self.evictions += len(to_delete)
+        logger.info(f"LLM cache: evicted {len(to_delete)} entries ({self._total_bytes} bytes remain)")
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+# Process-wide registry so concurrent jobs share one store (and its counters) per path
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_llm_cache(db_path: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES) -> LLMResponseCache:
+    """Get the shared LLMResponseCache for db_path, creating it on first use."""
+    path = os.path.abspath(db_path or _DEFAULT_DB_PATH)
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = LLMResponseCache(path, max_bytes=max_bytes)
+            _caches[path] = cache
+            logger.info(f"LLM cache: {path} ({cache._total_bytes} bytes cached)")
+        return cache
+
+
+class CachedLanguageModel(RateLimitedLanguageModel):
+    """
+    Language model that serves byte-identical calls from an LLMResponseCache.
+
+    Cache hits skip the provider and its rate limits entirely.
+    Streaming calls and failed calls (None responses) are never cached.
+    Per-instance hit/miss counters give the savings for a single run.
+
+    One instance serves one run. It counts identical calls and adds the
+    count to the key, so the Nth identical call of a run gets the Nth
+    cached sample (sampling ensembles stay diverse, and a rerun replays
+    them in order) rather than bypassing the cache at temperature > 0.
+    """
+
+    def __init__(self, model=None, cache: Optional[LLMResponseCache] = None, **kwargs):
+        super().__init__(model=model, **kwargs)
+        self.cache = cache
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._occurrences: Dict[str, int] = {}
+
+    async def __call__(self, messages, schema=None, streaming=False, **kwargs):
+        if self.cache is None or streaming:
+            return await super().__call__(messages, schema=schema, streaming=streaming, **kwargs)
+
+        base_key = self.cache.make_key(self.model, messages.get_json(), schema, kwargs)
+        occurrence = self._occurrences.get(base_key, 0)
+        self._occurrences[base_key] = occurrence + 1
+        key = base_key if occurrence == 0 else self.cache.make_key(
+            self.model, messages.get_json(), schema, kwargs, occurrence
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+
+        self.cache_misses += 1
+        result = await super().__call__(messages, schema=schema, streaming=streaming, **kwargs)
+        if result is not None:
+            self.cache.put(key, self.model, result)
+        return result
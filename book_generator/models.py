@@ -812,6 +812,9 @@ class ResearchDistributionInput(synalinks.DataModel):
 
 class SubsectionResearchAssignment(synalinks.DataModel):
     """Research assignment for a single subsection."""
+    subsection_number: int = synalinks.Field(
+        description="Number of the subsection in the numbered input list (1-based)"
+    )
     subsection_name: str = synalinks.Field(
         description="Name/title of the subsection this assignment is for"
     )
@@ -833,6 +836,37 @@ class ResearchDistributionPlan(synalinks.DataModel):
     )
 
 
+# =============================================================================
+# Subsection Contracts (parallel subsection generation)
+# =============================================================================
+
+class SubsectionContractsInput(synalinks.DataModel):
+    """Input for planning per-subsection contracts before parallel generation."""
+    section_name: str = synalinks.Field(description="The section name")
+    section_plan: str = synalinks.Field(description="The section plan with goals")
+    subsection_names: str = synalinks.Field(description="Numbered list of subsection names, one per line")
+
+
+class SubsectionContract(synalinks.DataModel):
+    """Contract for a single subsection: what it owns and what it must leave to siblings."""
+    subsection_name: str = synalinks.Field(
+        description="Name/title of the subsection this contract is for"
+    )
+    covers: str = synalinks.Field(
+        description="What this subsection covers in 1-3 sentences - the concepts, mechanisms and example it owns"
+    )
+    must_not_repeat: list[str] = synalinks.Field(
+        description="Concepts, examples or explanations owned by sibling subsections that this subsection must only reference, never explain"
+    )
+
+
+class SubsectionContracts(synalinks.DataModel):
+    """Contracts for all subsections in a section, in outline order."""
+    contracts: list[SubsectionContract] = synalinks.Field(
+        description="One contract per subsection, in the same order as the input list - coverage should NOT overlap"
+    )
+
+
 class SectionIntroInput(synalinks.DataModel):
     """Input for generating a section introduction."""
     topic: str = synalinks.Field(description="The main topic of the book")
@@ -987,6 +1021,23 @@ class SectionQualityInput(synalinks.DataModel):
     section_content: str = synalinks.Field(description="The full generated section content including all subsections")
     section_plan: str = synalinks.Field(description="The original plan for this section")
     audience: str = synalinks.Field(description="The target audience")
+    subsection_names: str = synalinks.Field(
+        description="Numbered list of the subsections in this section (each appears as a ### header in the content)",
+        default=""
+    )
+
+
+class SubsectionVerdict(synalinks.DataModel):
+    """Quality verdict for a single subsection within a section."""
+    subsection_name: str = synalinks.Field(
+        description="Name of the subsection exactly as listed in the input"
+    )
+    verdict: str = synalinks.Field(
+        description="Either 'pass' if this subsection is acceptable, or 'needs_rewrite' if it contains significant issues"
+    )
+    issues: list[str] = synalinks.Field(
+        description="Specific issues in THIS subsection that a rewrite must fix (empty if pass)"
+    )
 
 
 class QualityAssessment(synalinks.DataModel):
@@ -1006,6 +1057,9 @@ class QualityAssessment(synalinks.DataModel):
     coverage_gaps: list[str] = synalinks.Field(
         description="List any important topics from the plan that are not adequately covered"
     )
+    subsection_verdicts: list[SubsectionVerdict] = synalinks.Field(
+        description="One verdict per subsection - only subsections that themselves contain an issue should be 'needs_rewrite'"
+    )
     verdict: str = synalinks.Field(
         description="Either 'pass' if quality is acceptable, or 'needs_rewrite' if issues found"
     )
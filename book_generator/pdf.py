@@ -8,15 +8,23 @@ styled PDF with cover page, table of contents, and proper typography.
 import os
 import re
 import base64
+import asyncio
+import hashlib
+import functools
 import logging
 import subprocess
+import shutil
 import tempfile
 import urllib.request
-from typing import Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List
 
 import markdown
+from markdown.extensions.toc import slugify as toc_slugify
 from weasyprint import HTML, CSS
 
+from .process_pool import WorkerPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -101,6 +109,84 @@ def add_toc_links(content: str) -> str:
     return before_toc + processed_toc + processed_main
 
 
+# One scan finds code spans (left untouched) and every supported math form.
+# Alternatives are tried in priority order at each position: code first,
+# then display math, inline math, (\mathbb{...}) groups, standalone
+# \mathxx{...} commands and bare symbols like \alpha.
+_MATH_SYMBOLS = (
+    r'alpha|beta|gamma|delta|epsilon|zeta|eta|theta|iota|kappa|lambda|mu|nu|xi|pi|rho|sigma|tau|upsilon|phi|chi|psi|omega|'
+    r'Alpha|Beta|Gamma|Delta|Epsilon|Theta|Lambda|Xi|Pi|Sigma|Phi|Psi|Omega|'
+    r'sum|prod|int|oint|partial|nabla|infty|pm|mp|times|div|cdot|ldots|cdots|forall|exists|neg|in|notin|subset|supset|cup|cap|emptyset|'
+    r'rightarrow|leftarrow|Rightarrow|Leftarrow|leftrightarrow|Leftrightarrow|'
+    r'leq|geq|neq|approx|equiv|sim|propto|perp|parallel'
+)
+_MATH_TOKEN_PATTERN = re.compile(
+    r'(?P<code>```[\s\S]*?```|`[^`\n]+`)'
+    # Display math: $$...$$ (allowing multiline) and \[...\]
+    r'|\$\$\s*(?P<display_dollar>[\s\S]+?)\s*\$\$'
+    r'|\\\[\s*(?P<display_bracket>[\s\S]+?)\s*\\\]'
+    # Inline math: $...$ (not $$, and not currency like $100 or $50) and \(...\)
+    r'|(?<![\\$\w])\$(?!\d)(?P<inline_dollar>[^$\n]+?)\$(?![\\$\w])'
+    r'|\\\(\s*(?P<inline_paren>.+?)\s*\\\)'
+    # (\mathbb{...}) style - common malformed LaTeX
+    r'|\(\\(?P<paren_math>math[a-z]*\{[^}]+\}[^)]*)\)'
+    # Standalone math commands outside delimiters: \mathbf{...}, \mathbb{...}, ...
+    r'|(?P<standalone>\\math(?:bf|bb|cal|rm|it|sf|tt|frak)\{[^}]+\})'
+    # Common standalone symbols: \alpha, \sum, \rightarrow, ...
+    r'|\\(?P<symbol>' + _MATH_SYMBOLS + r')(?![a-zA-Z])'
+)
+
+# Distinct (latex, display) pairs kept converted; books repeat formulas a lot
+LATEX_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=None)
+def _load_latex2mathml():
+    """Import latex2mathml once per process; None if unavailable."""
+    try:
+        import latex2mathml.converter
+        return latex2mathml.converter
+    except ImportError:
+        logger.warning("latex2mathml not installed - math formulas will show as text")
+        return None
+
+
+@functools.lru_cache(maxsize=LATEX_CACHE_SIZE)
+def latex_to_mathml(latex_code: str, display: bool = False) -> str:
+    """Convert a single LaTeX expression to MathML (memoized)."""
+    # Clean up common issues
+    latex_code = latex_code.strip()
+    if not latex_code:
+        return ""
+
+    try:
+        mathml = _load_latex2mathml().convert(latex_code)
+        if display:
+            # Wrap display math in a centered div
+            return f'<div class="math-display">{mathml}</div>'
+        else:
+            return f'<span class="math-inline">{mathml}</span>'
+    except Exception as e:
+        logger.warning(f"Failed to convert LaTeX: {latex_code[:50]}... - {e}")
+        # Return nicely formatted fallback with HTML escaping
+        escaped = latex_code.replace('<', '&lt;').replace('>', '&gt;')
+        if display:
+            return f'<div class="math-display"><code class="math-fallback">{escaped}</code></div>'
+        else:
+            return f'<code class="math-fallback">{escaped}</code>'
+
+
+def _replace_math_token(match: re.Match) -> str:
+    kind = match.lastgroup
+    if kind == "code":
+        return match.group(0)
+    if kind in ("display_dollar", "display_bracket"):
+        return latex_to_mathml(match.group(kind), display=True)
+    if kind == "symbol":
+        return latex_to_mathml('\\' + match.group(kind), display=False)
+    return latex_to_mathml(match.group(kind), display=False)
+
+
 def process_latex_math(content: str) -> str:
     r"""
     Convert LaTeX math notation to MathML for PDF rendering.
@@ -111,113 +197,16 @@ def process_latex_math(content: str) -> str:
     - Escaped parentheses with math: (\mathbb{...})
     - Common math symbols: \alpha, \beta, \sum, etc.
 
+    Code blocks and inline code are left untouched. The content is scanned
+    once, and conversions are memoized by (latex, display).
+
     Returns:
         Content with LaTeX converted to MathML
     """
-    try:
-        import latex2mathml.converter
-        has_latex2mathml = True
-    except ImportError:
-        logger.warning("latex2mathml not installed - math formulas will show as text")
-        has_latex2mathml = False
+    if _load_latex2mathml() is None:
         return content
 
-    # First, protect code blocks from LaTeX processing
-    code_blocks = []
-    code_block_pattern = re.compile(r'(```[\s\S]*?```|`[^`\n]+`)', re.MULTILINE)
-
-    def save_code_block(match):
-        code_blocks.append(match.group(0))
-        return f'<<<CODE_BLOCK_{len(code_blocks) - 1}>>>'
-
-    content = code_block_pattern.sub(save_code_block, content)
-
-    def latex_to_mathml(latex_code: str, display: bool = False) -> str:
-        """Convert a single LaTeX expression to MathML."""
-        # Clean up common issues
-        latex_code = latex_code.strip()
-        if not latex_code:
-            return ""
-
-        try:
-            mathml = latex2mathml.converter.convert(latex_code)
-            if display:
-                # Wrap display math in a centered div
-                return f'<div class="math-display">{mathml}</div>'
-            else:
-                return f'<span class="math-inline">{mathml}</span>'
-        except Exception as e:
-            logger.warning(f"Failed to convert LaTeX: {latex_code[:50]}... - {e}")
-            # Return nicely formatted fallback with HTML escaping
-            escaped = latex_code.replace('<', '&lt;').replace('>', '&gt;')
-            if display:
-                return f'<div class="math-display"><code class="math-fallback">{escaped}</code></div>'
-            else:
-                return f'<code class="math-fallback">{escaped}</code>'
-
-    # Pattern for display math: $$...$$ (allowing multiline)
-    display_pattern1 = re.compile(r'\$\$\s*([\s\S]+?)\s*\$\$')
-    # Pattern for \[...\] display math
-    display_pattern2 = re.compile(r'\\\[\s*([\s\S]+?)\s*\\\]')
-
-    # Pattern for inline math: $...$ (not $$, not in middle of words like $100)
-    # This pattern avoids matching currency like $100 or $50
-    inline_pattern1 = re.compile(r'(?<![\\$\w])\$(?!\d)([^$\n]+?)\$(?![\\$\w])')
-
-    # Pattern for \(...\) inline math
-    inline_pattern2 = re.compile(r'\\\(\s*(.+?)\s*\\\)')
-
-    # Pattern for (\mathbb{...}) style - common malformed LaTeX
-    paren_math_pattern = re.compile(r'\(\\(math[a-z]*\{[^}]+\}[^)]*)\)')
-
-    # Process display math first (to avoid conflicts with inline)
-    def replace_display(match):
-        return latex_to_mathml(match.group(1), display=True)
-
-    content = display_pattern1.sub(replace_display, content)
-    content = display_pattern2.sub(replace_display, content)
-
-    # Process inline math
-    def replace_inline(match):
-        return latex_to_mathml(match.group(1), display=False)
-
-    content = inline_pattern1.sub(replace_inline, content)
-    content = inline_pattern2.sub(replace_inline, content)
-
-    # Process parenthesized math expressions like (\mathbb{R}^d)
-    def replace_paren_math(match):
-        return latex_to_mathml(match.group(1), display=False)
-
-    content = paren_math_pattern.sub(replace_paren_math, content)
-
-    # Catch standalone math commands that might be outside delimiters
-    # \mathbf{...}, \mathbb{...}, \mathcal{...}, etc.
-    standalone_math = re.compile(r'\\(math(?:bf|bb|cal|rm|it|sf|tt|frak)\{[^}]+\})')
-
-    def replace_standalone(match):
-        return latex_to_mathml(match.group(0), display=False)
-
-    content = standalone_math.sub(replace_standalone, content)
-
-    # Also handle common standalone symbols: \alpha, \beta, \gamma, \sum, \prod, etc.
-    greek_and_symbols = re.compile(
-        r'\\(alpha|beta|gamma|delta|epsilon|zeta|eta|theta|iota|kappa|lambda|mu|nu|xi|pi|rho|sigma|tau|upsilon|phi|chi|psi|omega|'
-        r'Alpha|Beta|Gamma|Delta|Epsilon|Theta|Lambda|Xi|Pi|Sigma|Phi|Psi|Omega|'
-        r'sum|prod|int|oint|partial|nabla|infty|pm|mp|times|div|cdot|ldots|cdots|forall|exists|neg|in|notin|subset|supset|cup|cap|emptyset|'
-        r'rightarrow|leftarrow|Rightarrow|Leftarrow|leftrightarrow|Leftrightarrow|'
-        r'leq|geq|neq|approx|equiv|sim|propto|perp|parallel)(?![a-zA-Z])'
-    )
-
-    def replace_symbol(match):
-        return latex_to_mathml('\\' + match.group(1), display=False)
-
-    content = greek_and_symbols.sub(replace_symbol, content)
-
-    # Restore code blocks
-    for i, block in enumerate(code_blocks):
-        content = content.replace(f'<<<CODE_BLOCK_{i}>>>', block)
-
-    return content
+    return _MATH_TOKEN_PATTERN.sub(_replace_math_token, content)
 
 
 def render_mermaid_to_image(mermaid_code: str, output_path: str, use_cli: bool = True) -> Optional[str]:
@@ -282,7 +271,140 @@ def render_mermaid_to_image(mermaid_code: str, output_path: str, use_cli: bool =
     return None
 
 
-def process_mermaid_blocks(content: str, output_dir: str) -> str:
+# Pattern to match mermaid code blocks
+MERMAID_PATTERN = re.compile(
+    r'```mermaid\s*\n(.*?)```',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Diagrams rendered at the same time when falling back to one-by-one rendering
+MERMAID_MAX_PARALLEL = 4
+
+# Seconds allowed for one mermaid-cli session rendering a whole batch
+MERMAID_BATCH_TIMEOUT = 300
+
+
+def mermaid_image_filename(mermaid_code: str) -> str:
+    """Content-addressed image name, so identical diagrams render once."""
+    digest = hashlib.sha256(mermaid_code.strip().encode("utf-8")).hexdigest()[:16]
+    return f"mermaid_{digest}.png"
+
+
+def extract_mermaid_blocks(content: str) -> List[str]:
+    """Mermaid code of every diagram in the content, in order."""
+    return [m.group(1).strip() for m in MERMAID_PATTERN.finditer(content)]
+
+
+def _is_rendered(path: str) -> bool:
+    return os.path.exists(path) and os.path.getsize(path) > 0
+
+
+def _render_mermaid_batch_cli(codes: List[str], output_dir: str) -> set:
+    """
+    Render many diagrams in one mermaid-cli session (one browser start).
+
+    mmdc renders every mermaid block of a Markdown input file, writing
+    <name>-1.png, <name>-2.png, ... next to the output file.
+
+    Returns:
+        The codes that were rendered
+    """
+    rendered = set()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = os.path.join(tmp_dir, "diagrams.md")
+        output_path = os.path.join(tmp_dir, "rendered.md")
+        with open(input_path, "w") as f:
+            for code in codes:
+                f.write(f"```mermaid\n{code}\n```\n\n")
+
+        try:
+            result = subprocess.run(
+                ['mmdc', '-i', input_path, '-o', output_path, '-e', 'png', '-b', 'transparent'],
+                capture_output=True,
+                timeout=MERMAID_BATCH_TIMEOUT
+            )
+        except (subprocess.SubprocessError, FileNotFoundError, OSError) as e:
+            logger.debug(f"mermaid-cli batch mode not available: {e}")
+            return rendered
+
+        if result.returncode != 0:
+            logger.debug(f"mermaid-cli batch failed: {result.stderr[-500:]!r}")
+
+        for i, code in enumerate(codes, 1):
+            image_path = os.path.join(tmp_dir, f"rendered-{i}.png")
+            if _is_rendered(image_path):
+                shutil.move(image_path, os.path.join(output_dir, mermaid_image_filename(code)))
+                rendered.add(code)
+
+    return rendered
+
+
+def render_mermaid_diagrams(
+    codes: List[str],
+    output_dir: str,
+    cache_dir: Optional[str] = None,
+    max_parallel: int = MERMAID_MAX_PARALLEL,
+) -> Dict[str, Optional[str]]:
+    """
+    Make sure every diagram has a rendered image in output_dir.
+
+    Images are named by content hash, so diagrams already rendered there
+    (or in the shared cache_dir, default $MERMAID_CACHE_DIR) are reused.
+    The rest are rendered in one mermaid-cli batch session; any that fail
+    there are rendered individually, up to max_parallel at a time.
+
+    Returns:
+        Mapping of mermaid code to image filename (None if rendering failed)
+    """
+    cache_dir = cache_dir or os.environ.get("MERMAID_CACHE_DIR")
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    results: Dict[str, Optional[str]] = {}
+    todo: List[str] = []
+    cached = 0
+    for code in dict.fromkeys(codes):
+        filename = mermaid_image_filename(code)
+        if _is_rendered(os.path.join(output_dir, filename)):
+            cached += 1
+        elif cache_dir and _is_rendered(os.path.join(cache_dir, filename)):
+            shutil.copyfile(os.path.join(cache_dir, filename), os.path.join(output_dir, filename))
+            cached += 1
+        else:
+            todo.append(code)
+            continue
+        results[code] = filename
+
+    rendered = _render_mermaid_batch_cli(todo, output_dir) if len(todo) > 1 else set()
+    remaining = [c for c in todo if c not in rendered]
+
+    if remaining:
+        with ThreadPoolExecutor(max_workers=max(1, max_parallel)) as pool:
+            paths = pool.map(
+                lambda code: render_mermaid_to_image(code, os.path.join(output_dir, mermaid_image_filename(code))),
+                remaining,
+            )
+            rendered.update(code for code, path in zip(remaining, paths) if path)
+
+    for code in todo:
+        filename = mermaid_image_filename(code)
+        if code in rendered:
+            results[code] = filename
+            if cache_dir:
+                shutil.copyfile(os.path.join(output_dir, filename), os.path.join(cache_dir, filename))
+        else:
+            results[code] = None
+
+    if codes:
+        failed = sum(1 for v in results.values() if v is None)
+        logger.info(
+            f"Mermaid diagrams: {cached} cached, {len(rendered)} rendered, {failed} failed "
+            f"({len(results)} unique of {len(codes)})"
+        )
+    return results
+
+
+def process_mermaid_blocks(content: str, output_dir: str, render_missing: bool = True) -> str:
     """
     Find and render all Mermaid code blocks in the content.
 
@@ -291,15 +413,25 @@ def process_mermaid_blocks(content: str, output_dir: str) -> str:
     Args:
         content: The markdown content
         output_dir: Directory to save rendered images
+        render_missing: Render diagrams without a cached image. Pass False
+            when the diagrams were already rendered in a batch, so failed
+            ones are not retried.
 
     Returns:
         Content with Mermaid blocks replaced by images
     """
-    # Pattern to match mermaid code blocks
-    mermaid_pattern = re.compile(
-        r'```mermaid\s*\n(.*?)```',
-        re.DOTALL | re.IGNORECASE
-    )
+    codes = extract_mermaid_blocks(content)
+    if not codes:
+        return content
+
+    if render_missing:
+        images = render_mermaid_diagrams(codes, output_dir)
+    else:
+        images = {
+            code: mermaid_image_filename(code)
+            if _is_rendered(os.path.join(output_dir, mermaid_image_filename(code))) else None
+            for code in codes
+        }
 
     diagram_counter = 0
 
@@ -307,14 +439,8 @@ def process_mermaid_blocks(content: str, output_dir: str) -> str:
         nonlocal diagram_counter
         diagram_counter += 1
 
-        mermaid_code = match.group(1).strip()
-        image_filename = f"mermaid_diagram_{diagram_counter:03d}.png"
-        image_path = os.path.join(output_dir, image_filename)
-
-        # Render the diagram
-        rendered_path = render_mermaid_to_image(mermaid_code, image_path)
-
-        if rendered_path:
+        image_filename = images.get(match.group(1).strip())
+        if image_filename:
             # Return an image reference
             return f'\n\n<div class="mermaid-diagram"><img src="{image_filename}" alt="Diagram {diagram_counter}"></div>\n\n'
         else:
@@ -322,10 +448,9 @@ def process_mermaid_blocks(content: str, output_dir: str) -> str:
             logger.warning(f"Failed to render Mermaid diagram {diagram_counter} - removing from output")
             return '\n\n'  # Just remove it, don't show raw code
 
-    processed_content = mermaid_pattern.sub(replace_mermaid, content)
+    processed_content = MERMAID_PATTERN.sub(replace_mermaid, content)
 
-    if diagram_counter > 0:
-        logger.info(f"Processed {diagram_counter} Mermaid diagrams")
+    logger.info(f"Processed {diagram_counter} Mermaid diagrams")
 
     return processed_content
 
@@ -625,45 +750,117 @@ h1 + p:first-letter, h2 + p:first-letter {
 '''
 
 
-def generate_pdf(
-    book_content: str,
-    book_name: str,
-    output_path: str,
-    cover_path: Optional[str] = None,
-    base_url: Optional[str] = None
-) -> str:
-    """
-    Generate a PDF from the book content.
+# Bump when rendering changes so cached chapter HTML is not reused
+PDF_RENDER_VERSION = 3
 
-    Args:
-        book_content: The markdown content of the book
-        book_name: The book's title
-        output_path: Path to save the PDF
-        cover_path: Optional path to cover image
-        base_url: Base URL for resolving relative paths (typically the output directory)
+# Subdirectory of the output directory holding rendered chapter HTML
+RENDER_CACHE_DIRNAME = "06_render_cache"
 
-    Returns:
-        The path to the generated PDF
+# Worker processes for chapter conversion and layout
+_render_pool = WorkerPool("pdf render", max_workers=min(4, os.cpu_count() or 1))
+
+
+def split_into_chapters(content: str) -> List[str]:
     """
-    logger.info("Generating PDF...")
+    Split book markdown into independently renderable parts.
 
-    css = CSS(string=BOOK_CSS)
+    A new part starts at every top-level heading ("# ...") outside fenced
+    code blocks, together with the TOC anchor placed right before it.
+    Concatenating the parts gives back the original content.
+    """
+    parts: List[str] = []
+    current: List[str] = []
+    in_fence = False
 
-    # Add clickable TOC links
-    processed_content = add_toc_links(book_content)
+    for line in content.splitlines(keepends=True):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        if not in_fence and line.startswith("# ") and current:
+            carry = []
+            if current[-1].startswith('<a id="') and current[-1].rstrip().endswith("></a>"):
+                carry = [current.pop()]
+            if current:
+                parts.append("".join(current))
+            current = carry
+        current.append(line)
 
-    # Process LaTeX math - convert to MathML
-    processed_content = process_latex_math(processed_content)
+    if current:
+        parts.append("".join(current))
+    return parts
 
-    # Process Mermaid diagrams - render to images
+
+_REFERENCE_DEFINITION = re.compile(r'^ {0,3}\[([^\]^][^\]]*)\]:[ \t]*\S.*$')
+
+
+def share_reference_definitions(parts: List[str]) -> List[str]:
+    """
+    Copy link reference definitions ("[label]: url") into the parts that use them.
+
+    Each part is converted by its own Markdown instance, so a reference
+    whose definition sits in another part would otherwise not resolve.
+    """
+    definitions: Dict[str, str] = {}
+    for part in parts:
+        in_fence = False
+        for line in part.splitlines():
+            if line.lstrip().startswith("```"):
+                in_fence = not in_fence
+            elif not in_fence:
+                match = _REFERENCE_DEFINITION.match(line)
+                if match:
+                    definitions.setdefault(match.group(1).lower(), line.strip())
+    if not definitions:
+        return parts
+
+    shared = []
+    for part in parts:
+        lower = part.lower()
+        extra = [
+            line for label, line in definitions.items()
+            if f"[{label}]" in lower and line not in part
+        ]
+        shared.append(part + ("\n\n" + "\n".join(extra) + "\n" if extra else ""))
+    return shared
+
+
+def chapter_cache_key(chapter_markdown: str) -> str:
+    """Content hash identifying one part's rendered HTML."""
+    digest = hashlib.sha256(f"v{PDF_RENDER_VERSION}\0{chapter_markdown}".encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def render_chapter_html(chapter_markdown: str, base_url: Optional[str], mermaid_prerendered: bool = False) -> str:
+    """
+    Render one part of the book (markdown with TOC anchors) to an HTML fragment.
+
+    Runs LaTeX conversion, Mermaid rendering and Markdown conversion.
+    Top-level so it can run in a worker process.
+
+    Heading and footnote IDs generated by Markdown get a prefix derived
+    from the part's content, so they stay unique in the merged document
+    (the explicit TOC anchors from add_toc_links() are left as they are).
+    """
+    processed = process_latex_math(chapter_markdown)
     if base_url:
-        processed_content = process_mermaid_blocks(processed_content, base_url)
+        processed = process_mermaid_blocks(processed, base_url, render_missing=not mermaid_prerendered)
 
-    # Convert markdown to HTML
-    md = markdown.Markdown(extensions=['extra', 'toc', 'smarty'])
-    html_content = md.convert(processed_content)
+    prefix = "p" + hashlib.sha1(chapter_markdown.encode("utf-8")).hexdigest()[:8]
 
-    # Add cover page if cover image exists
+    def slugify_heading(value: str, separator: str) -> str:
+        return f"{prefix}{separator}{toc_slugify(value, separator)}"
+
+    md = markdown.Markdown(
+        extensions=['extra', 'toc', 'smarty'],
+        extension_configs={
+            'extra': {'footnotes': {'SEPARATOR': f":{prefix}-"}},
+            'toc': {'slugify': slugify_heading},
+        },
+    )
+    return md.convert(processed)
+
+
+def build_book_html(chapter_html: List[str], book_name: str, cover_path: Optional[str] = None) -> str:
+    """Merge rendered parts into the full HTML document, with the cover page first."""
     cover_html = ""
     if cover_path and os.path.exists(cover_path):
         cover_filename = os.path.basename(cover_path)
@@ -672,8 +869,9 @@ def generate_pdf(
 </div>
 '''
 
-    # Wrap in full HTML document
-    full_html = f'''<!DOCTYPE html>
+    html_content = "\n".join(chapter_html)
+
+    return f'''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -684,9 +882,160 @@ def generate_pdf(
 </body>
 </html>'''
 
-    # Generate PDF
+
+def write_pdf_from_html(full_html: str, output_path: str, base_url: Optional[str] = None) -> str:
+    """Lay out the HTML document with WeasyPrint and write the PDF."""
+    css = CSS(string=BOOK_CSS)
     html_doc = HTML(string=full_html, base_url=base_url)
     html_doc.write_pdf(output_path, stylesheets=[css])
+    return output_path
+
+
+class _RenderCache:
+    """Rendered chapter HTML on disk, keyed by chapter_cache_key()."""
+
+    def __init__(self, cache_dir: Optional[str]):
+        self.cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.html")
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.cache_dir or not os.path.exists(self._path(key)):
+            return None
+        with open(self._path(key), "r", encoding="utf-8") as f:
+            return f.read()
+
+    def put(self, key: str, html: str) -> None:
+        if not self.cache_dir:
+            return
+        tmp_path = self._path(key) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(html)
+        os.replace(tmp_path, self._path(key))
+
+    def prune(self, keep: set) -> None:
+        """Drop cached parts that are no longer in the book."""
+        if not self.cache_dir:
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".html") and name[:-5] not in keep:
+                os.remove(os.path.join(self.cache_dir, name))
+
+
+def _all_diagrams_rendered(part: str, images: Dict[str, Optional[str]]) -> bool:
+    """
+    False if a diagram of the part failed in render_mermaid_diagrams().
+
+    Such a part's HTML lacks the diagram, so it is not cached: the next
+    render retries the diagram instead of reusing the degraded HTML.
+    """
+    return all(images.get(code, "") is not None for code in extract_mermaid_blocks(part))
+
+
+def _prepare_parts(book_content: str, base_url: Optional[str], cache_dir: Optional[str]):
+    """Split the book into parts and look up their cached HTML."""
+    if cache_dir is None and base_url:
+        cache_dir = os.path.join(base_url, RENDER_CACHE_DIRNAME)
+    cache = _RenderCache(cache_dir)
+
+    parts = share_reference_definitions(split_into_chapters(add_toc_links(book_content)))
+    keys = [chapter_cache_key(p) for p in parts]
+    html = [cache.get(k) for k in keys]
+    return cache, parts, keys, html
+
+
+def generate_pdf(
+    book_content: str,
+    book_name: str,
+    output_path: str,
+    cover_path: Optional[str] = None,
+    base_url: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+) -> str:
+    """
+    Generate a PDF from the book content.
+
+    Each chapter is rendered to HTML separately and cached by content hash
+    (in base_url/06_render_cache unless cache_dir is given), so a re-render
+    only converts the chapters that changed before the final layout.
+    Mermaid diagrams of the changed chapters are rendered together first.
+
+    Args:
+        book_content: The markdown content of the book
+        book_name: The book's title
+        output_path: Path to save the PDF
+        cover_path: Optional path to cover image
+        base_url: Base URL for resolving relative paths (typically the output directory)
+        cache_dir: Directory for cached chapter HTML
+
+    Returns:
+        The path to the generated PDF
+    """
+    logger.info("Generating PDF...")
+
+    cache, parts, keys, html = _prepare_parts(book_content, base_url, cache_dir)
+    missing = [i for i, h in enumerate(html) if h is None]
+
+    # Render all new diagrams of the book in one batch before the chapters
+    mermaid_codes = [c for i in missing for c in extract_mermaid_blocks(parts[i])]
+    images = {}
+    if base_url and mermaid_codes:
+        images = render_mermaid_diagrams(mermaid_codes, base_url)
+
+    for i in missing:
+        html[i] = render_chapter_html(parts[i], base_url, mermaid_prerendered=True)
+        if _all_diagrams_rendered(parts[i], images):
+            cache.put(keys[i], html[i])
+    cache.prune(set(keys))
+    logger.info(f"Rendered {len(missing)}/{len(parts)} book parts ({len(parts) - len(missing)} cached)")
+
+    write_pdf_from_html(build_book_html(html, book_name, cover_path), output_path, base_url)
+
+    logger.info(f"PDF saved: {output_path}")
+    return output_path
+
+
+async def generate_pdf_async(
+    book_content: str,
+    book_name: str,
+    output_path: str,
+    cover_path: Optional[str] = None,
+    base_url: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+) -> str:
+    """
+    Like generate_pdf(), but all rendering runs in worker processes.
+
+    Uncached chapters are converted to HTML in parallel, then the merged
+    document is laid out by WeasyPrint in one more worker, so the calling
+    event loop stays responsive for the whole render.
+    """
+    logger.info("Generating PDF in worker processes...")
+    cache, parts, keys, html = await asyncio.to_thread(_prepare_parts, book_content, base_url, cache_dir)
+    missing = [i for i, h in enumerate(html) if h is None]
+
+    # Render all new diagrams of the book in one batch before the chapters
+    mermaid_codes = [c for i in missing for c in extract_mermaid_blocks(parts[i])]
+    images = {}
+    if base_url and mermaid_codes:
+        images = await _render_pool.run(render_mermaid_diagrams, mermaid_codes, base_url)
+
+    rendered = await asyncio.gather(*(
+        _render_pool.run(render_chapter_html, parts[i], base_url, True)
+        for i in missing
+    ))
+    for i, chapter_html in zip(missing, rendered):
+        html[i] = chapter_html
+        if _all_diagrams_rendered(parts[i], images):
+            cache.put(keys[i], chapter_html)
+    cache.prune(set(keys))
+    logger.info(f"Rendered {len(missing)}/{len(parts)} book parts ({len(parts) - len(missing)} cached)")
+
+    full_html = build_book_html(html, book_name, cover_path)
+    await _render_pool.run(write_pdf_from_html, full_html, output_path, base_url)
 
     logger.info(f"PDF saved: {output_path}")
     return output_path
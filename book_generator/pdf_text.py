@@ -0,0 +1,172 @@
+"""
+Shared PDF text extraction service.
+
+PDF text extraction is CPU-bound, so running it on threads serializes it
+with everything else under the GIL. Both the arXiv fetcher and the
+citation document processor hand extraction to one shared pool of
+worker processes instead, so papers are extracted in parallel across
+cores while the event loop stays responsive.
+
+Pages are extracted in small batches: callers stream pages as they are
+produced (iter_pdf_pages) or stop once they have enough text
+(extract_pdf_text), so a huge PDF never has its full text materialized
+in one piece.
+
+PyMuPDF is used when installed; pdfminer.six (installed with arxiv2text)
+is the fallback.
+"""
+
+import io
+import os
+import logging
+import urllib.request
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
+
+from .process_pool import WorkerPool
+
+logger = logging.getLogger(__name__)
+
+# Worker processes for extraction (override with PDF_EXTRACT_WORKERS)
+MAX_WORKERS = int(os.environ.get("PDF_EXTRACT_WORKERS", 0)) or min(4, os.cpu_count() or 1)
+
+# Pages extracted per worker task
+PAGE_BATCH_SIZE = 16
+
+_extract_pool = WorkerPool("pdf text", max_workers=MAX_WORKERS)
+
+
+def _iter_pages_pymupdf(pdf_path: str, start: int, stop: Optional[int]) -> Iterator[str]:
+    import fitz  # PyMuPDF
+
+    with fitz.open(pdf_path) as doc:
+        end = doc.page_count if stop is None else min(stop, doc.page_count)
+        for page_index in range(start, end):
+            yield doc[page_index].get_text()
+
+
+def _iter_pages_pdfminer(pdf_path: str, start: int, stop: Optional[int]) -> Iterator[str]:
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+
+    resource_manager = PDFResourceManager()
+    laparams = LAParams()
+    with open(pdf_path, "rb") as f:
+        for page_index, page in enumerate(PDFPage.get_pages(f)):
+            if stop is not None and page_index >= stop:
+                break
+            if page_index < start:
+                continue
+            out = io.StringIO()
+            device = TextConverter(resource_manager, out, laparams=laparams)
+            PDFPageInterpreter(resource_manager, device).process_page(page)
+            device.close()
+            yield out.getvalue()
+
+
+def _has_pymupdf() -> bool:
+    try:
+        import fitz  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _iter_pages(pdf_path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+    """Text of each page with index in [start, stop), one page at a time."""
+    if _has_pymupdf():
+        return _iter_pages_pymupdf(pdf_path, start, stop)
+    return _iter_pages_pdfminer(pdf_path, start, stop)
+
+
+def _page_count(pdf_path: str) -> int:
+    """Number of pages, without extracting any text."""
+    if _has_pymupdf():
+        import fitz
+
+        with fitz.open(pdf_path) as doc:
+            return doc.page_count
+
+    from pdfminer.pdfpage import PDFPage
+
+    with open(pdf_path, "rb") as f:
+        return sum(1 for _ in PDFPage.get_pages(f))
+
+
+def extract_page_batch(
+    pdf_path: str,
+    start: int = 0,
+    max_pages: Optional[int] = PAGE_BATCH_SIZE,
+) -> Tuple[List[dict], bool]:
+    """
+    Extract up to max_pages pages (all if None) starting at page index start.
+
+    Empty pages are skipped. Runs in a worker process.
+
+    Returns:
+        (pages, more) where pages are dicts with 'text' and 'page'
+        (1-based) keys and more is True if pages remain after the batch
+    """
+    total = _page_count(pdf_path)
+    stop = total if max_pages is None else min(total, start + max_pages)
+    pages = []
+    for offset, text in enumerate(_iter_pages(pdf_path, start, stop)):
+        if text.strip():
+            pages.append({"text": text.strip(), "page": start + offset + 1})
+    return pages, stop < total
+
+
+def extract_text_prefix(pdf_path: str, max_chars: Optional[int] = None) -> str:
+    """
+    Plain text of a PDF, stopping once max_chars characters are extracted.
+
+    Runs in a worker process; later pages are never parsed.
+    """
+    parts = []
+    total = 0
+    for text in _iter_pages(pdf_path):
+        parts.append(text)
+        total += len(text)
+        if max_chars is not None and total >= max_chars:
+            break
+    full_text = "".join(parts)
+    return full_text[:max_chars] if max_chars is not None else full_text
+
+
+async def iter_pdf_pages(pdf_path: str, batch_size: int = PAGE_BATCH_SIZE) -> AsyncIterator[dict]:
+    """
+    Yield the non-empty pages of a PDF ({'text', 'page'}) as worker batches finish.
+
+    Only one batch of pages is held in memory at a time.
+    """
+    start = 0
+    more = True
+    while more:
+        pages, more = await _extract_pool.run(extract_page_batch, pdf_path, start, batch_size)
+        start += batch_size
+        for page in pages:
+            yield page
+
+
+async def extract_pdf_text(pdf_path: str, max_chars: Optional[int] = None) -> str:
+    """Text of a PDF (first max_chars characters) extracted in a worker process."""
+    return await _extract_pool.run(extract_text_prefix, pdf_path, max_chars)
+
+
+def download_pdf(url: str, output_path: str, timeout: int = 60) -> str:
+    """Download a PDF to output_path (blocking). Returns output_path."""
+    request = urllib.request.Request(url, headers={"User-Agent": "BookGenerator/1.0"})
+    tmp_path = output_path + ".part"
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response, open(tmp_path, "wb") as f:
+            while True:
+                chunk = response.read(1 << 16)
+                if not chunk:
+                    break
+                f.write(chunk)
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return output_path
@@ -41,14 +41,19 @@ from .planning import run_hierarchical_planning
 from .vision import generate_book_vision, format_book_vision
 from .content import write_all_sections_direct
 from .cover import generate_cover
-from .pdf import generate_pdf
+from .pdf import generate_pdf_async
 from .authors import get_author_profile, generate_about_author
 from .illustrations import illustrate_all_chapters
+from .llm_cache import CachedLanguageModel, get_llm_cache
+from .rate_limit import RateLimitedLanguageModel, configure_rate_limits
+from .cancellation import check_cancelled
+from .stages import Stage, StageTimeline, run_stages
 from .citations import run_citation_pipeline, CitationManager
 from .research import (
     DeepResearchClient,
     generate_research_queries,
     parse_research,
+    IncrementalResearchParser,
     ResearchManager,
     run_stage2_research,
     Stage2MCPPipeline,
@@ -330,6 +335,11 @@ async def generate_book(config: Config, progress_callback=None) -> str:
     6. Cover generation
     7. Final assembly & PDF
 
+    Stages 1-2 run in sequence. Everything after planning is scheduled as
+    a DAG (see stages.py), so the cover, introduction and About the Author
+    are produced while the chapters are being written. Per-stage start and
+    end times are saved to 00_stage_timings.json.
+
     Args:
         config: The book generation configuration
         progress_callback: Optional async callback(stage, progress, message)
@@ -339,8 +349,13 @@ async def generate_book(config: Config, progress_callback=None) -> str:
         Path to the generated PDF
     """
     async def report_progress(stage: str, progress: int, message: str):
+        # Stage boundaries double as cancellation checkpoints for API jobs
+        check_cancelled()
         if progress_callback:
             await progress_callback(stage, progress, message)
+    timeline = StageTimeline()
+    timeline.begin("setup")
+
     # Setup output directory
     base_path = os.path.dirname(os.path.dirname(__file__))
     output_dir = config.setup_output_dir(base_path)
@@ -362,8 +377,18 @@ async def generate_book(config: Config, progress_callback=None) -> str:
         f"Topic: {topic_data['topic']}\nGoal: {topic_data['goal']}\nBook Name: {topic_data['book_name']}"
     )
 
-    # Initialize language model
-    language_model = synalinks.LanguageModel(model=config.model_name)
+    # Per-model quotas are process-wide: every job and subsystem draws from the same buckets
+    configure_rate_limits(config.rate_limits)
+
+    # Initialize language model (optionally behind the persistent response cache)
+    if config.llm_cache:
+        llm_cache = get_llm_cache(
+            os.path.join(base_path, config.llm_cache_path),
+            max_bytes=config.llm_cache_max_mb * 1024 * 1024,
+        )
+        language_model = CachedLanguageModel(model=config.model_name, cache=llm_cache)
+    else:
+        language_model = RateLimitedLanguageModel(model=config.model_name)
 
     # ==========================================================================
     # STAGE -1: DEEP RESEARCH (optional, for cutting-edge content)
@@ -371,6 +396,7 @@ async def generate_book(config: Config, progress_callback=None) -> str:
     research_manager = None
 
     if config.enable_research:
+        timeline.begin("research")
         await report_progress("researching", 2, "Researching cutting-edge papers and breakthroughs...")
         logger.info("Starting deep research phase...")
 
@@ -388,7 +414,13 @@ async def generate_book(config: Config, progress_callback=None) -> str:
             cached_data = load_json_from_file(research_dir, "field_knowledge.json")
             if cached_data:
                 field_knowledge = FieldKnowledge(**cached_data)
-                research_manager = ResearchManager(field_knowledge, language_model=language_model)
+                research_manager = ResearchManager(
+                    field_knowledge,
+                    language_model=language_model,
+                    embedding_model=config.research_embedding_model,
+                    llm_rerank=config.research_llm_rerank,
+                    cache_dir=research_dir if config.research_cache else None,
+                )
 
                 print(f"\n{'='*60}")
                 print("DEEP RESEARCH (CACHED)")
@@ -443,10 +475,20 @@ async def generate_book(config: Config, progress_callback=None) -> str:
             else:
                 logger.info("All queries cached, loading results...")
 
+            # In streaming mode each query is parsed as soon as it completes
+            streaming_parser = None
+            if config.research_streaming_parse:
+                streaming_parser = IncrementalResearchParser(
+                    language_model,
+                    cache_dir=research_dir if config.research_cache else None,
+                )
+
             client = DeepResearchClient()
-            raw_results = await client.research_all(
+            raw_results = await client.research_all_parallel(
                 queries_to_run,
                 cache_dir=research_dir if config.research_cache else None,
+                max_concurrent=config.research_max_concurrent,
+                on_result=streaming_parser.submit if streaming_parser else None,
             )
 
             # Save raw results
@@ -454,13 +496,24 @@ async def generate_book(config: Config, progress_callback=None) -> str:
 
             # Parse into structured data
             logger.info("Parsing research into structured data...")
-            field_knowledge = await parse_research(raw_results, language_model)
+            if streaming_parser:
+                field_knowledge = await streaming_parser.finalize(
+                    query_order=[f"query_{i}" for i in range(len(queries_to_run))]
+                )
+            else:
+                field_knowledge = await parse_research(raw_results, language_model)
 
             # Save parsed knowledge
             save_json_to_file(research_dir, "field_knowledge.json", field_knowledge.get_json())
 
             # Create manager with language model for LLM-based matching
-            research_manager = ResearchManager(field_knowledge, language_model=language_model)
+            research_manager = ResearchManager(
+                field_knowledge,
+                language_model=language_model,
+                embedding_model=config.research_embedding_model,
+                llm_rerank=config.research_llm_rerank,
+                cache_dir=research_dir if config.research_cache else None,
+            )
 
             print(f"\n{'='*60}")
             print("DEEP RESEARCH COMPLETE")
@@ -474,6 +527,7 @@ async def generate_book(config: Config, progress_callback=None) -> str:
     # ==========================================================================
     # STAGE 0: BOOK VISION (guides all subsequent generation)
     # ==========================================================================
+    timeline.begin("vision")
     await report_progress("generating_vision", 5, "Crafting the book's core thesis and themes...")
     logger.info("Generating book vision...")
 
@@ -504,6 +558,7 @@ async def generate_book(config: Config, progress_callback=None) -> str:
     # ==========================================================================
     # STAGE 1: OUTLINE GENERATION
     # ==========================================================================
+    timeline.begin("outline")
     await report_progress("generating_outline", 10, "Designing chapter structure for your domain...")
 
     results = None
@@ -732,6 +787,7 @@ async def generate_book(config: Config, progress_callback=None) -> str:
     # ==========================================================================
     # STAGE 2: HIERARCHICAL PLANNING
     # ==========================================================================
+    timeline.begin("planning")
     await report_progress("planning", 25, "Creating detailed plans for each chapter...")
     logger.info("Starting hierarchical planning...")
     if config.plan_critique_enabled:
@@ -746,6 +802,7 @@ async def generate_book(config: Config, progress_callback=None) -> str:
         book_vision=book_vision,
         research_manager=research_manager,
         chapter_paper_assignments=chapter_paper_assignments,
+        max_parallel_chapters=config.planning_max_parallel_chapters,
     )
 
     print(f"\n{'='*60}")
@@ -757,17 +814,36 @@ async def generate_book(config: Config, progress_callback=None) -> str:
     print(f"{'='*60}\n")
 
     # ==========================================================================
-    # STAGE 2b: CLAIM-FIRST CITATION PIPELINE (Optional)
+    # STAGES 2b-7: SCHEDULED AS A DAG
     # ==========================================================================
-    citation_manager = None
-    get_citation_instructions_callback = None
+    # Everything after planning is declared as stages with explicit inputs and
+    # run by the scheduler, so independent work overlaps: the cover, the
+    # introduction and About the Author only need the plan and outline, and
+    # the citation pipeline, Stage 2 research and chapter reference matching
+    # only need the plans and research.
+    from .planning import format_book_plan
+
+    # Get writing style if configured (applied during direct write, not as separate pass)
+    writing_style = None
+    if config.author_key:
+        writing_style = get_author_profile(config.author_key)
+        if writing_style:
+            logger.info(f"Writing with style: {writing_style.key}")
+        else:
+            logger.warning(f"Writing style not found: {config.author_key}")
+
+    _chapter_paper_assignments = chapter_paper_assignments  # Capture for closures
+
+    # --------------------------------------------------------------------------
+    # STAGE 2b: CLAIM-FIRST CITATION PIPELINE (Optional)
+    # --------------------------------------------------------------------------
+    async def citations_stage(outputs):
+        if not config.enable_citations:
+            return None
 
-    if config.enable_citations:
         logger.info("Starting claim-first citation pipeline...")
         logger.info("This will plan claims for each subsection, then verify them.")
 
-        from .planning import format_book_plan
-
         try:
             citation_manager = await run_citation_pipeline(
                 topic_data=topic_data,
@@ -781,14 +857,6 @@ async def generate_book(config: Config, progress_callback=None) -> str:
                 max_concurrent_verifications=5,
             )
 
-            # Create callback for content generation (subsection-level)
-            def get_citation_instructions_callback(chapter: str, section: str, subsection: str = None) -> str:
-                if citation_manager:
-                    if subsection:
-                        return citation_manager.get_subsection_citation_instructions(chapter, section, subsection)
-                    return citation_manager.get_citation_instructions(chapter, section)
-                return ""
-
             print(f"\n{'='*60}")
             print("CLAIM-FIRST CITATION PIPELINE COMPLETE:")
             print(f"  - Claims planned: {len(citation_manager.claims)}")
@@ -798,6 +866,7 @@ async def generate_book(config: Config, progress_callback=None) -> str:
             verification_rate = len(citation_manager.verified_citations) / len(citation_manager.claims) * 100 if citation_manager.claims else 0
             print(f"  - Verification rate: {verification_rate:.1f}%")
             print(f"{'='*60}\n")
+            return citation_manager
 
         except Exception as e:
             logger.error(f"Citation pipeline failed: {e}")
@@ -808,13 +877,15 @@ async def generate_book(config: Config, progress_callback=None) -> str:
             print(f"WARNING: Citation pipeline failed: {e}")
             print("Continuing without citation verification...")
             print(f"{'='*60}\n")
+            return None
 
-    # ==========================================================================
+    # --------------------------------------------------------------------------
     # STAGE 2c: KNOWLEDGE GRAPH RESEARCH (Optional - requires mcp-graphiti)
-    # ==========================================================================
-    stage2_pipeline = None
+    # --------------------------------------------------------------------------
+    async def stage2_research_stage(outputs):
+        if not (config.enable_stage2_research and research_manager):
+            return None
 
-    if config.enable_stage2_research and research_manager:
         logger.info("Starting Stage 2 research with knowledge graph...")
         logger.info("This requires mcp-graphiti Docker container running.")
 
@@ -837,6 +908,7 @@ async def generate_book(config: Config, progress_callback=None) -> str:
                 print("STAGE 2 RESEARCH SKIPPED:")
                 print("  mcp-graphiti not available - using arXiv data only")
                 print(f"{'='*60}\n")
+            return stage2_pipeline
 
         except Exception as e:
             logger.warning(f"Stage 2 research failed: {e}")
@@ -845,108 +917,17 @@ async def generate_book(config: Config, progress_callback=None) -> str:
             print(f"WARNING: Stage 2 research failed: {e}")
             print("Continuing with Stage 1 research only...")
             print(f"{'='*60}\n")
+            return None
 
-    # ==========================================================================
-    # QUALITY REVIEW
-    # ==========================================================================
-    await report_progress("quality_review", 35, "Reviewing plans for coherence and completeness...")
-
-    # ==========================================================================
-    # STAGE 3: CONTENT GENERATION (Direct Write with Style)
-    # ==========================================================================
-    await report_progress("writing_content", 40, "Synthesizing content tailored to your background...")
-
-    # Get writing style if configured (applied during direct write, not as separate pass)
-    writing_style = None
-    about_author = ""
-
-    if config.author_key:
-        writing_style = get_author_profile(config.author_key)
-        if writing_style:
-            logger.info(f"Writing with style: {writing_style.key}")
-        else:
-            logger.warning(f"Writing style not found: {config.author_key}")
-
-    logger.info("Writing sections directly from topic names...")
-
-    # Create research context callback for content generation
-    # Uses Stage 2 pipeline if available, otherwise falls back to ResearchManager
-    # Now also filters by chapter paper assignments
-    get_research_context_callback = None
-    _chapter_paper_assignments = chapter_paper_assignments  # Capture for closure
-
-    if stage2_pipeline and stage2_pipeline.connected:
-        logger.info("Stage 2 knowledge graph context enabled for content generation")
-        logger.info("Using LLM-generated smart queries for section context")
-        if _chapter_paper_assignments:
-            logger.info(f"Chapter paper assignments available for {len(_chapter_paper_assignments)} chapters")
-
-        # Capture context needed for smart query generation
-        _section_plans = all_section_plans
-        _book_topic = topic_data["topic"]
-        _language_model = language_model
-
-        async def get_research_context_callback(chapter: str, section: str) -> str:
-            """Get research context from Stage 2 knowledge graph using smart queries (async).
-
-            Uses Synalinks to generate targeted search queries based on section plan,
-            instead of naive keyword extraction.
-            """
-            # Look up section plan for this section
-            section_plan = ""
-            chapter_plans = _section_plans.get(chapter, {})
-            section_plan_list = chapter_plans.get("section_plans", [])
-
-            # Find matching section plan (by position or name match)
-            for plan in section_plan_list:
-                if isinstance(plan, dict):
-                    plan_section = plan.get("section_name", "")
-                    if plan_section == section or section in plan_section:
-                        from .planning import format_section_plan
-                        section_plan = format_section_plan(plan)
-                        break
-
-            try:
-                # Use smart query generation with full section context
-                context = await stage2_pipeline.get_context_for_section(
-                    chapter_name=chapter,
-                    section_name=section,
-                    section_plan=section_plan or f"Section about {section}",
-                    book_topic=_book_topic,
-                    language_model=_language_model,
-                )
-                if context:
-                    return context
-            except Exception as e:
-                logger.warning(f"Stage 2 smart context retrieval failed: {e}")
-                import traceback
-                logger.debug(f"Traceback: {traceback.format_exc()}")
-
-            # Fall back to ResearchManager with paper filtering
-            if research_manager:
-                # Strip number prefix (e.g., "1. ") from chapter name to match assignment keys
-                import re
-                base_chapter = re.sub(r'^\d+\.\s*', '', chapter)
-                assigned_papers = _chapter_paper_assignments.get(base_chapter, [])
-                return await research_manager.for_section_writing(chapter, section, assigned_papers=assigned_papers)
-            return ""
+    # --------------------------------------------------------------------------
+    # STAGE 2d: CHAPTER REFERENCE LISTS (Optional)
+    # --------------------------------------------------------------------------
+    async def chapter_references_stage(outputs):
+        # Build full paper dicts for fast chapter references (if enabled)
+        # Uses synalinks.Decision to match paper titles to full paper dicts
+        if not (config.enable_chapter_references and research_manager and _chapter_paper_assignments):
+            return None
 
-    elif research_manager:
-        logger.info("Research context enabled for content generation")
-        if _chapter_paper_assignments:
-            logger.info(f"Chapter paper assignments available for {len(_chapter_paper_assignments)} chapters")
-
-        async def get_research_context_callback(chapter: str, section: str) -> str:
-            # Strip number prefix (e.g., "1. ") from chapter name to match assignment keys
-            import re
-            base_chapter = re.sub(r'^\d+\.\s*', '', chapter)
-            assigned_papers = _chapter_paper_assignments.get(base_chapter, [])
-            return await research_manager.for_section_writing(chapter, section, assigned_papers=assigned_papers)
-
-    # Build full paper dicts for fast chapter references (if enabled)
-    # Uses synalinks.Decision to match paper titles to full paper dicts
-    chapter_paper_dicts = None
-    if config.enable_chapter_references and research_manager and _chapter_paper_assignments:
         logger.info("Building chapter reference lists using LLM matching...")
         chapter_paper_dicts = {}
         all_papers = research_manager.get_all_papers()
@@ -967,22 +948,124 @@ async def generate_book(config: Config, progress_callback=None) -> str:
                 chapter_paper_dicts[chapter_name] = matched_papers
                 logger.info(f"  {chapter_name[:40]}...: {len(matched_papers)} references")
 
-    chapters = await write_all_sections_direct(
-        topic_data, hierarchy, book_plan, chapters_overview, chapter_plans,
-        all_section_plans, language_model, output_dir, config.intro_styles,
-        max_chapters, writing_style, get_citation_instructions_callback,
-        get_research_context_callback, citation_manager, chapter_paper_dicts
-    )
+        return chapter_paper_dicts
 
-    total_sections = sum(len(sections) for sections in hierarchy.values())
-    print(f"\n{'='*60}")
-    print(f"Wrote {len(chapters)} chapters ({total_sections} sections)")
-    if writing_style:
-        print(f"(with '{writing_style.key}' style applied)")
-    print(f"{'='*60}\n")
+    # --------------------------------------------------------------------------
+    # STAGE 3: CONTENT GENERATION (Direct Write with Style)
+    # --------------------------------------------------------------------------
+    async def content_stage(outputs):
+        citation_manager = outputs["citations"]
+        stage2_pipeline = outputs["stage2_research"]
+        chapter_paper_dicts = outputs["chapter_references"]
+
+        await report_progress("writing_content", 40, "Synthesizing content tailored to your background...")
+
+        # Create callback for content generation (subsection-level)
+        get_citation_instructions_callback = None
+        if citation_manager:
+            def get_citation_instructions_callback(chapter: str, section: str, subsection: str = None) -> str:
+                if subsection:
+                    return citation_manager.get_subsection_citation_instructions(chapter, section, subsection)
+                return citation_manager.get_citation_instructions(chapter, section)
+
+        logger.info("Writing sections directly from topic names...")
+
+        # Create research context callback for content generation
+        # Uses Stage 2 pipeline if available, otherwise falls back to ResearchManager
+        # Now also filters by chapter paper assignments
+        get_research_context_callback = None
+
+        if stage2_pipeline and stage2_pipeline.connected:
+            logger.info("Stage 2 knowledge graph context enabled for content generation")
+            logger.info("Using LLM-generated smart queries for section context")
+            if _chapter_paper_assignments:
+                logger.info(f"Chapter paper assignments available for {len(_chapter_paper_assignments)} chapters")
+
+            # Capture context needed for smart query generation
+            _section_plans = all_section_plans
+            _book_topic = topic_data["topic"]
+            _language_model = language_model
+
+            async def get_research_context_callback(chapter: str, section: str) -> str:
+                """Get research context from Stage 2 knowledge graph using smart queries (async).
+
+                Uses Synalinks to generate targeted search queries based on section plan,
+                instead of naive keyword extraction.
+                """
+                # Look up section plan for this section
+                section_plan = ""
+                chapter_plans = _section_plans.get(chapter, {})
+                section_plan_list = chapter_plans.get("section_plans", [])
+
+                # Find matching section plan (by position or name match)
+                for plan in section_plan_list:
+                    if isinstance(plan, dict):
+                        plan_section = plan.get("section_name", "")
+                        if plan_section == section or section in plan_section:
+                            from .planning import format_section_plan
+                            section_plan = format_section_plan(plan)
+                            break
+
+                try:
+                    # Use smart query generation with full section context
+                    context = await stage2_pipeline.get_context_for_section(
+                        chapter_name=chapter,
+                        section_name=section,
+                        section_plan=section_plan or f"Section about {section}",
+                        book_topic=_book_topic,
+                        language_model=_language_model,
+                    )
+                    if context:
+                        return context
+                except Exception as e:
+                    logger.warning(f"Stage 2 smart context retrieval failed: {e}")
+                    import traceback
+                    logger.debug(f"Traceback: {traceback.format_exc()}")
+
+                # Fall back to ResearchManager with paper filtering
+                if research_manager:
+                    # Strip number prefix (e.g., "1. ") from chapter name to match assignment keys
+                    import re
+                    base_chapter = re.sub(r'^\d+\.\s*', '', chapter)
+                    assigned_papers = _chapter_paper_assignments.get(base_chapter, [])
+                    return await research_manager.for_section_writing(chapter, section, assigned_papers=assigned_papers)
+                return ""
 
-    # Generate About the Author section (only if style has a name)
-    if writing_style and writing_style.name:
+        elif research_manager:
+            logger.info("Research context enabled for content generation")
+            if _chapter_paper_assignments:
+                logger.info(f"Chapter paper assignments available for {len(_chapter_paper_assignments)} chapters")
+
+            async def get_research_context_callback(chapter: str, section: str) -> str:
+                # Strip number prefix (e.g., "1. ") from chapter name to match assignment keys
+                import re
+                base_chapter = re.sub(r'^\d+\.\s*', '', chapter)
+                assigned_papers = _chapter_paper_assignments.get(base_chapter, [])
+                return await research_manager.for_section_writing(chapter, section, assigned_papers=assigned_papers)
+
+        chapters = await write_all_sections_direct(
+            topic_data, hierarchy, book_plan, chapters_overview, chapter_plans,
+            all_section_plans, language_model, output_dir, config.intro_styles,
+            max_chapters, writing_style, get_citation_instructions_callback,
+            get_research_context_callback, citation_manager, chapter_paper_dicts,
+            max_parallel_chapters=config.content_max_parallel_chapters,
+            parallel_subsections=config.content_parallel_subsections,
+        )
+
+        total_sections = sum(len(sections) for sections in hierarchy.values())
+        print(f"\n{'='*60}")
+        print(f"Wrote {len(chapters)} chapters ({total_sections} sections)")
+        if writing_style:
+            print(f"(with '{writing_style.key}' style applied)")
+        print(f"{'='*60}\n")
+        return chapters
+
+    # --------------------------------------------------------------------------
+    # STAGE 4: ABOUT THE AUTHOR (only if style has a name)
+    # --------------------------------------------------------------------------
+    async def about_author_stage(outputs):
+        if not (writing_style and writing_style.name):
+            return ""
         about_author = await generate_about_author(
             writing_style,
             topic_data["book_name"],
@@ -991,81 +1074,116 @@ async def generate_book(config: Config, progress_callback=None) -> str:
             output_dir
         )
         print(f"Generated About the Author section")
+        return about_author
 
-    final_chapters = chapters
-
-    # ==========================================================================
+    # --------------------------------------------------------------------------
     # STAGE 5c: ILLUSTRATION GENERATION (Optional)
-    # ==========================================================================
-    await report_progress("generating_illustrations", 75, "Creating diagrams and visualizations...")
-    if config.enable_illustrations:
+    # --------------------------------------------------------------------------
+    async def illustrations_stage(outputs):
+        chapters = outputs["content"]
+        await report_progress("generating_illustrations", 75, "Creating diagrams and visualizations...")
+        if not config.enable_illustrations:
+            return chapters
+
         logger.info("Adding illustrations to chapters...")
 
-        final_chapters = await illustrate_all_chapters(
-            final_chapters,
+        illustrated = await illustrate_all_chapters(
+            chapters,
             topic_data["topic"],
             topic_data.get("audience", "technical readers"),
             language_model,
             output_dir,
             enable_images=config.enable_generated_images,
-            image_model=config.image_model
+            image_model=config.image_model,
+            max_parallel=config.illustrations_max_parallel_chapters,
         )
 
         print(f"\n{'='*60}")
-        print(f"Illustrated {len(final_chapters)} chapters")
+        print(f"Illustrated {len(illustrated)} chapters")
         if config.enable_generated_images:
             print(f"(with AI-generated images using {config.image_model})")
         else:
             print("(Mermaid diagrams only)")
         print(f"{'='*60}\n")
+        return illustrated
 
-    # ==========================================================================
+    # --------------------------------------------------------------------------
     # STAGE 6: INTRODUCTION GENERATION
-    # ==========================================================================
-    logger.info("Generating book introduction...")
+    # --------------------------------------------------------------------------
+    async def introduction_stage(outputs):
+        logger.info("Generating book introduction...")
 
-    introduction = await generate_introduction(
-        topic_data, book_plan, build_outline_text_short(results),
-        language_model, output_dir
-    )
+        introduction = await generate_introduction(
+            topic_data, book_plan, build_outline_text_short(results),
+            language_model, output_dir
+        )
 
-    print(f"\n{'='*60}")
-    print("Generated book introduction")
-    print(f"{'='*60}\n")
+        print(f"\n{'='*60}")
+        print("Generated book introduction")
+        print(f"{'='*60}\n")
+        return introduction
 
-    # ==========================================================================
+    # --------------------------------------------------------------------------
     # STAGE 7: COVER GENERATION
-    # ==========================================================================
-    await report_progress("generating_cover", 85, "Designing your book cover...")
-    logger.info("Generating book cover...")
+    # --------------------------------------------------------------------------
+    async def cover_stage(outputs):
+        logger.info("Generating book cover...")
 
-    # Use style's name for author display if configured
-    display_authors = config.authors
-    if writing_style and writing_style.name:
-        display_authors = writing_style.name
+        # Use style's name for author display if configured
+        display_authors = config.authors
+        if writing_style and writing_style.name:
+            display_authors = writing_style.name
 
-    # Get chapter names for cover prompt context
-    chapter_names = [c.get("concept", "") for c in results.get("concepts", [])]
-    key_concepts = "\n".join(f"- {name}" for name in chapter_names)
+        # Get chapter names for cover prompt context
+        chapter_names = [c.get("concept", "") for c in results.get("concepts", [])]
+        key_concepts = "\n".join(f"- {name}" for name in chapter_names)
 
-    cover_path = os.path.join(output_dir, "book_cover.png")
-    await generate_cover(
-        topic_data["book_name"],
-        config.subtitle,
-        display_authors,
-        cover_path,
-        style=config.cover_style,
-        topic=topic_data["topic"],
-        goal=topic_data["goal"],
-        audience=topic_data.get("audience", "technical readers"),
-        key_concepts=key_concepts,
-        language_model=language_model,
-        image_model=config.image_model
+        cover_path = os.path.join(output_dir, "book_cover.png")
+        await generate_cover(
+            topic_data["book_name"],
+            config.subtitle,
+            display_authors,
+            cover_path,
+            style=config.cover_style,
+            topic=topic_data["topic"],
+            goal=topic_data["goal"],
+            audience=topic_data.get("audience", "technical readers"),
+            key_concepts=key_concepts,
+            language_model=language_model,
+            image_model=config.image_model
+        )
+        return cover_path
+
+    # ==========================================================================
+    # QUALITY REVIEW
+    # ==========================================================================
+    await report_progress("quality_review", 35, "Reviewing plans for coherence and completeness...")
+    timeline.end()
+
+    stage_outputs = await run_stages(
+        [
+            Stage("citations", citations_stage),
+            Stage("stage2_research", stage2_research_stage),
+            Stage("chapter_references", chapter_references_stage),
+            Stage("content", content_stage, after=("citations", "stage2_research", "chapter_references")),
+            Stage("illustrations", illustrations_stage, after=("content",)),
+            Stage("about_author", about_author_stage),
+            Stage("introduction", introduction_stage),
+            Stage("cover", cover_stage),
+        ],
+        timings=timeline.timings,
     )
 
+    citation_manager = stage_outputs["citations"]
+    final_chapters = stage_outputs["illustrations"]
+    about_author = stage_outputs["about_author"]
+    introduction = stage_outputs["introduction"]
+    cover_path = stage_outputs["cover"]
+
     # ==========================================================================
     # STAGE 8: FINAL ASSEMBLY & PDF
     # ==========================================================================
+    timeline.begin("assembly")
     await report_progress("assembling_pdf", 92, "Assembling the final PDF...")
     logger.info("Assembling final book...")
 
@@ -1110,7 +1228,7 @@ async def generate_book(config: Config, progress_callback=None) -> str:
 
     # Generate PDF
     pdf_path = os.path.join(output_dir, "06_full_book.pdf")
-    generate_pdf(
+    await generate_pdf_async(
         book_content,
         topic_data["book_name"],
         pdf_path,
@@ -1118,9 +1236,18 @@ async def generate_book(config: Config, progress_callback=None) -> str:
         base_url=output_dir
     )
 
+    timeline.end()
+    save_json_to_file(output_dir, "00_stage_timings.json", timeline.to_list())
+
     logger.info("Book generation complete!")
     logger.info(f"Text version: {os.path.join(output_dir, '06_full_book.txt')}")
     logger.info(f"PDF version: {pdf_path}")
     logger.info(f"Cover image: {cover_path}")
+    if isinstance(language_model, CachedLanguageModel):
+        stats = language_model.cache.stats()
+        logger.info(
+            f"LLM cache: {language_model.cache_hits} hits, {language_model.cache_misses} misses this run "
+            f"(store: {stats['bytes'] // (1024 * 1024)}MB, {stats['evictions']} evictions)"
+        )
 
     return pdf_path
@@ -12,6 +12,8 @@ Role-aware critique:
 - Does NOT demand theoretical foundations for practitioner mode
 """
 
+import asyncio
+import inspect
 import logging
 from typing import Optional
 
@@ -953,6 +955,55 @@ Be specific about content, not generic. Reference actual concepts from the outli
     return result_dict
 
 
+async def _generate_single_chapter_plans(
+    topic_data: dict,
+    book_plan: dict,
+    chapters_overview: dict,
+    chapter_names: list,
+    outline_text: str,
+    language_model,
+    output_dir: str,
+    get_research_context: Optional[callable],
+    max_parallel_chapters: int,
+) -> list:
+    """
+    Stage 2: Generate every chapter's plan, up to max_parallel_chapters at a time.
+
+    Each plan depends only on the book plan and chapters overview, so chapters
+    are independent. Plans are returned in chapter order; per-chapter cache
+    files are still honored by generate_single_chapter_plan.
+    """
+    total_chapters = len(chapter_names)
+    semaphore = asyncio.Semaphore(max(1, max_parallel_chapters))
+
+    async def plan_one(chapter_number: int, chapter_name: str) -> dict:
+        async with semaphore:
+            # Get research context for this chapter if available
+            research_context = None
+            if get_research_context:
+                if inspect.iscoroutinefunction(get_research_context):
+                    research_context = await get_research_context(chapter_name)
+                else:
+                    research_context = get_research_context(chapter_name)
+
+            return await generate_single_chapter_plan(
+                topic_data=topic_data,
+                book_plan=book_plan,
+                chapters_overview=chapters_overview,
+                chapter_name=chapter_name,
+                chapter_number=chapter_number,
+                total_chapters=total_chapters,
+                outline_text=outline_text,
+                language_model=language_model,
+                output_dir=output_dir,
+                research_context=research_context
+            )
+
+    return list(await asyncio.gather(*(
+        plan_one(i, chapter_name) for i, chapter_name in enumerate(chapter_names, 1)
+    )))
+
+
 async def generate_chapter_plans_with_critique(
     topic_data: dict,
     outline_results: dict,
@@ -964,6 +1015,7 @@ async def generate_chapter_plans_with_critique(
     critique_max_attempts: int = 5,
     get_research_context: Optional[callable] = None,
     book_vision: dict = None,
+    max_parallel_chapters: int = 1,
 ) -> tuple:
     """
     Generate plans for all chapters with self-critique loop on overview.
@@ -974,6 +1026,7 @@ async def generate_chapter_plans_with_critique(
     Args:
         get_research_context: Optional callback(chapter_name) -> str for research context
         book_vision: Optional vision with reader_mode for mode-aware critique
+        max_parallel_chapters: How many chapter plans to generate concurrently in stage 2
 
     Returns:
         Tuple of (chapters_overview, chapter_plans_dict)
@@ -1011,31 +1064,10 @@ async def generate_chapter_plans_with_critique(
 
     logger.info(f"Generating detailed plans for {total_chapters} chapters (stage 2)...")
 
-    chapter_plans_list = []
-
-    for i, chapter_name in enumerate(chapter_names, 1):
-        # Get research context for this chapter if available
-        research_context = None
-        if get_research_context:
-            import inspect
-            if inspect.iscoroutinefunction(get_research_context):
-                research_context = await get_research_context(chapter_name)
-            else:
-                research_context = get_research_context(chapter_name)
-
-        chapter_plan = await generate_single_chapter_plan(
-            topic_data=topic_data,
-            book_plan=book_plan,
-            chapters_overview=chapters_overview,
-            chapter_name=chapter_name,
-            chapter_number=i,
-            total_chapters=total_chapters,
-            outline_text=outline_text,
-            language_model=language_model,
-            output_dir=output_dir,
-            research_context=research_context
-        )
-        chapter_plans_list.append(chapter_plan)
+    chapter_plans_list = await _generate_single_chapter_plans(
+        topic_data, book_plan, chapters_overview, chapter_names, outline_text,
+        language_model, output_dir, get_research_context, max_parallel_chapters,
+    )
 
     # Combine into the expected format
     result_dict = {"chapter_plans": chapter_plans_list}
@@ -1054,7 +1086,8 @@ async def generate_chapter_plans(
     language_model,
     output_dir: str,
     max_chapters: Optional[int] = None,
-    get_research_context: Optional[callable] = None
+    get_research_context: Optional[callable] = None,
+    max_parallel_chapters: int = 1,
 ) -> tuple:
     """
     Generate plans for all chapters using two-stage approach (no critique).
@@ -1065,6 +1098,7 @@ async def generate_chapter_plans(
     Args:
         max_chapters: If set, only plan this many chapters (for test mode)
         get_research_context: Optional callback(chapter_name) -> str for research context
+        max_parallel_chapters: How many chapter plans to generate concurrently in stage 2
 
     Returns:
         Tuple of (chapters_overview, chapter_plans_dict)
@@ -1096,31 +1130,10 @@ async def generate_chapter_plans(
 
     logger.info(f"Generating detailed plans for {total_chapters} chapters (stage 2)...")
 
-    chapter_plans_list = []
-
-    for i, chapter_name in enumerate(chapter_names, 1):
-        # Get research context for this chapter if available
-        research_context = None
-        if get_research_context:
-            import inspect
-            if inspect.iscoroutinefunction(get_research_context):
-                research_context = await get_research_context(chapter_name)
-            else:
-                research_context = get_research_context(chapter_name)
-
-        chapter_plan = await generate_single_chapter_plan(
-            topic_data=topic_data,
-            book_plan=book_plan,
-            chapters_overview=chapters_overview,
-            chapter_name=chapter_name,
-            chapter_number=i,
-            total_chapters=total_chapters,
-            outline_text=outline_text,
-            language_model=language_model,
-            output_dir=output_dir,
-            research_context=research_context
-        )
-        chapter_plans_list.append(chapter_plan)
+    chapter_plans_list = await _generate_single_chapter_plans(
+        topic_data, book_plan, chapters_overview, chapter_names, outline_text,
+        language_model, output_dir, get_research_context, max_parallel_chapters,
+    )
 
     # Combine into the expected format
     result_dict = {"chapter_plans": chapter_plans_list}
@@ -1251,6 +1264,7 @@ async def run_hierarchical_planning(
     book_vision: dict = None,
     research_manager = None,
     chapter_paper_assignments: dict = None,
+    max_parallel_chapters: int = 1,
 ) -> tuple:
     """
     Run the complete hierarchical planning process.
@@ -1266,6 +1280,7 @@ async def run_hierarchical_planning(
         book_vision: Optional book vision dict for alignment guidance
         research_manager: Optional ResearchManager for injecting research context
         chapter_paper_assignments: Optional dict mapping chapter names to assigned paper titles
+        max_parallel_chapters: How many chapters to plan concurrently (chapter and section plans)
 
     Returns:
         Tuple of (book_plan, chapters_overview, chapter_plans, all_section_plans, hierarchy)
@@ -1335,23 +1350,26 @@ async def run_hierarchical_planning(
     # Generate chapter plans (two-stage: overview + individual plans)
     chapters_overview, chapter_plans = await generate_chapter_plans_with_critique(
         topic_data, outline_results, book_plan, language_model, output_dir, max_chapters,
-        critique_enabled, critique_max_attempts, get_research_context, book_vision=book_vision
+        critique_enabled, critique_max_attempts, get_research_context, book_vision=book_vision,
+        max_parallel_chapters=max_parallel_chapters,
     )
 
     # Extract hierarchy for section planning
     hierarchy = extract_hierarchy(outline_results)
 
     # Generate section plans for each chapter
-    all_section_plans = {}
     chapter_names = get_chapter_names(outline_results)
 
     if max_chapters:
         chapter_names = chapter_names[:max_chapters]
 
-    # With two-stage planning, chapter plans are generated per-chapter in order
-    chapter_plans_list = chapter_plans.get("chapter_plans", [])
+    # Section plans only depend on their own chapter's plan, so chapters run concurrently
+    semaphore = asyncio.Semaphore(max(1, max_parallel_chapters))
+    if max_parallel_chapters > 1:
+        logger.info(f"Planning sections for {len(chapter_names)} chapters with up to "
+                    f"{max_parallel_chapters} in parallel")
 
-    for i, chapter_name in enumerate(chapter_names):
+    async def plan_sections(i: int, chapter_name: str) -> Optional[dict]:
         # Get plan by index (plans are generated in order)
         chapter_plan = get_chapter_plan_by_index(chapter_plans, i)
 
@@ -1362,8 +1380,11 @@ async def run_hierarchical_planning(
             for section, subsections in chapter_sections.items()
         }
 
-        if sections_with_subsections:
-            section_plans = await generate_section_plans(
+        if not sections_with_subsections:
+            return None
+
+        async with semaphore:
+            return await generate_section_plans(
                 topic_data,
                 book_plan,
                 chapters_overview,
@@ -1373,6 +1394,16 @@ async def run_hierarchical_planning(
                 language_model,
                 output_dir
             )
-            all_section_plans[chapter_name] = section_plans
+
+    section_plans_list = await asyncio.gather(*(
+        plan_sections(i, chapter_name) for i, chapter_name in enumerate(chapter_names)
+    ))
+
+    # Keep outline order
+    all_section_plans = {
+        chapter_name: section_plans
+        for chapter_name, section_plans in zip(chapter_names, section_plans_list)
+        if section_plans is not None
+    }
 
     return book_plan, chapters_overview, chapter_plans, all_section_plans, hierarchy
@@ -0,0 +1,66 @@
+"""
+Shared worker process pools for CPU-bound work.
+
+A ProcessPoolExecutor is unusable for good once one of its workers dies
+(WeasyPrint running out of memory, PyMuPDF crashing on a malformed PDF):
+every later submit raises BrokenProcessPool. The API server is long
+running, so WorkerPool replaces a broken executor with a fresh one and
+retries the task once instead of failing every later job.
+"""
+
+import asyncio
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerPool:
+    """
+    Lazily created, spawn-based process pool that recovers from worker deaths.
+
+    Usage:
+        pool = WorkerPool("pdf", max_workers=4)
+        result = await pool.run(render, arg)
+
+    Workers are spawned rather than forked, so the pool is safe to use
+    from threaded servers.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def executor(self) -> ProcessPoolExecutor:
+        """The current executor, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _replace(self, broken: ProcessPoolExecutor) -> None:
+        """Drop the broken executor, unless a concurrent task already replaced it."""
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run fn(*args) in a worker process, retrying once on a fresh pool if the pool broke."""
+        loop = asyncio.get_running_loop()
+        executor = self.executor()
+        try:
+            return await loop.run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            logger.warning(f"[{self.name}] worker process died; restarting the pool and retrying once")
+            self._replace(executor)
+            return await loop.run_in_executor(self.executor(), fn, *args)
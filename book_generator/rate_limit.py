@@ -0,0 +1,287 @@
+"""
+Process-wide request and token budgets per model.
+
+Every outbound model call (synalinks generators, search-grounded Gemini
+calls, image generation, deep research) first takes a grant from the
+TokenBucketLimiter for its model. Buckets are keyed by model name, refill
+continuously from requests-per-minute (RPM) and tokens-per-minute (TPM)
+quotas, and are shared by all jobs in the process. When several jobs are
+waiting, grants rotate between them round-robin so one large book cannot
+starve the others.
+
+Models without configured limits are not throttled.
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+import threading
+import contextvars
+from collections import deque
+from typing import Dict, Optional
+
+import synalinks
+
+from .cancellation import check_cancelled
+from .credentials import get_job_api_key
+
+logger = logging.getLogger(__name__)
+
+# Bucket for Google Search grounding, taken in addition to the model's own bucket
+SEARCH_GROUNDING = "google-search"
+
+DEFAULT_JOB = "default"
+
+# How often waiters that are not at the head of the queue re-check their turn
+_POLL_INTERVAL = 0.05
+
+# Rough characters-per-token ratio used to estimate request sizes
+_CHARS_PER_TOKEN = 4
+
+_current_job = contextvars.ContextVar("rate_limit_job", default=DEFAULT_JOB)
+
+
+def set_rate_limit_job(job_id: str) -> contextvars.Token:
+    """Attribute model calls made from the current context (and tasks it spawns) to job_id."""
+    return _current_job.set(job_id)
+
+
+def model_key(model: str) -> str:
+    """Bucket key for a model name ("gemini/gemini-3-flash-preview" -> "gemini-3-flash-preview")."""
+    return model.split("/")[-1]
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for budgeting before the provider reports usage."""
+    return len(text) // _CHARS_PER_TOKEN + 1
+
+
+class TokenBucketLimiter:
+    """
+    RPM + TPM token buckets for one model, with round-robin fairness across jobs.
+
+    Both buckets start full, hold at most one minute of quota and refill
+    continuously. acquire() reserves one request and an estimated number of
+    tokens; adjust_tokens() settles the difference once the provider
+    reports actual usage (the bucket may go negative, delaying later calls).
+
+    State is guarded by a threading lock and waiting uses asyncio.sleep, so
+    one limiter can be shared by calls running on different event loops.
+
+    Args:
+        name: Bucket key (model name)
+        rpm: Requests per minute, or None for no request limit
+        tpm: Tokens per minute, or None for no token limit
+    """
+
+    def __init__(self, name: str, rpm: Optional[int] = None, tpm: Optional[int] = None):
+        self.name = name
+        self.rpm = rpm
+        self.tpm = tpm
+        self._lock = threading.Lock()
+        self._requests = float(rpm or 0)
+        self._tokens = float(tpm or 0)
+        self._last_refill = time.monotonic()
+        self._queues: Dict[str, deque] = {}
+        self._turns: deque = deque()  # job ids with waiters, next grant goes to the front
+        self._next_grant_at = 0.0
+
+        self.granted: Dict[str, int] = {}
+        self.total_wait = 0.0
+
+    @property
+    def unlimited(self) -> bool:
+        return not self.rpm and not self.tpm
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.rpm:
+            self._requests = min(float(self.rpm), self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(float(self.tpm), self._tokens + elapsed * self.tpm / 60)
+
+    def _wait_for(self, tokens: int) -> float:
+        """Seconds until the buckets hold one request and `tokens` tokens. Caller holds the lock."""
+        wait = 0.0
+        if self.rpm and self._requests < 1:
+            wait = max(wait, (1 - self._requests) * 60 / self.rpm)
+        if self.tpm and self._tokens < tokens:
+            wait = max(wait, (tokens - self._tokens) * 60 / self.tpm)
+        return wait
+
+    async def acquire(self, tokens: int = 0, job: Optional[str] = None) -> None:
+        """Wait until this job's turn comes and the budgets allow one call of ~tokens tokens."""
+        if self.unlimited:
+            return
+        job = job or _current_job.get()
+        if self.tpm:
+            tokens = min(tokens, self.tpm)
+        ticket = object()
+        start = time.monotonic()
+
+        with self._lock:
+            queue = self._queues.setdefault(job, deque())
+            if not queue:
+                self._turns.append(job)
+            queue.append(ticket)
+
+        try:
+            while True:
+                with self._lock:
+                    self._refill()
+                    now = time.monotonic()
+                    if self._turns[0] == job and self._queues[job][0] is ticket:
+                        wait = self._wait_for(tokens)
+                        if wait <= 0:
+                            self._grant(job, tokens)
+                            break
+                        self._next_grant_at = now + wait
+                    else:
+                        wait = max(_POLL_INTERVAL, self._next_grant_at - now)
+                await asyncio.sleep(wait)
+        except BaseException:
+            with self._lock:
+                self._withdraw(job, ticket)
+            raise
+
+        waited = time.monotonic() - start
+        self.total_wait += waited
+        if waited > 5:
+            logger.info(f"[rate-limit] {self.name}: job {job} waited {waited:.1f}s for quota")
+
+    def _grant(self, job: str, tokens: int) -> None:
+        """Consume budget for the head ticket and rotate the job to the back. Caller holds the lock."""
+        if self.rpm:
+            self._requests -= 1
+        if self.tpm:
+            self._tokens -= tokens
+        queue = self._queues[job]
+        queue.popleft()
+        self._turns.popleft()
+        if queue:
+            self._turns.append(job)
+        else:
+            del self._queues[job]
+        self.granted[job] = self.granted.get(job, 0) + 1
+
+    def _withdraw(self, job: str, ticket: object) -> None:
+        """Remove a cancelled ticket that was never granted. Caller holds the lock."""
+        queue = self._queues.get(job)
+        if not queue or ticket not in queue:
+            return
+        queue.remove(ticket)
+        if not queue:
+            del self._queues[job]
+            self._turns.remove(job)
+
+    def adjust_tokens(self, delta: int) -> None:
+        """Charge (positive) or refund (negative) tokens after actual usage is known."""
+        if not self.tpm or not delta:
+            return
+        with self._lock:
+            self._refill()
+            self._tokens = min(float(self.tpm), self._tokens - delta)
+
+    def stats(self) -> dict:
+        """Grants per job, cumulative wait and remaining budget."""
+        with self._lock:
+            self._refill()
+            return {
+                "rpm": self.rpm,
+                "tpm": self.tpm,
+                "granted": dict(self.granted),
+                "total_wait": self.total_wait,
+                "requests_available": self._requests if self.rpm else None,
+                "tokens_available": self._tokens if self.tpm else None,
+            }
+
+
+# Process-wide registry: one limiter per model, shared by every job and subsystem
+_limits: Dict[str, dict] = {}
+_limiters: Dict[str, TokenBucketLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def configure_rate_limits(limits: Optional[Dict[str, dict]]) -> None:
+    """
+    Set RPM/TPM quotas per model, e.g. {"gemini-3-flash-preview": {"rpm": 1000, "tpm": 1000000}}.
+
+    Keys may include a provider prefix. Existing limiters for the listed
+    models are replaced, so later calls see the new quota.
+    """
+    if not limits:
+        return
+    with _registry_lock:
+        for model, quota in limits.items():
+            key = model_key(model)
+            quota = {"rpm": quota.get("rpm"), "tpm": quota.get("tpm")}
+            if _limits.get(key) == quota:
+                continue
+            _limits[key] = quota
+            _limiters.pop(key, None)
+            logger.info(f"[rate-limit] {key}: rpm={quota['rpm']}, tpm={quota['tpm']}")
+
+
+def load_rate_limits_from_env(var: str = "RATE_LIMITS") -> None:
+    """Configure quotas from a JSON object in an environment variable, if set."""
+    raw = os.environ.get(var)
+    if not raw:
+        return
+    try:
+        configure_rate_limits(json.loads(raw))
+    except (json.JSONDecodeError, AttributeError) as e:
+        logger.warning(f"Ignoring invalid {var}: {e}")
+
+
+def get_rate_limiter(model: str) -> TokenBucketLimiter:
+    """Get the shared limiter for a model, creating it on first use."""
+    key = model_key(model)
+    with _registry_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            quota = _limits.get(key, {})
+            limiter = TokenBucketLimiter(key, rpm=quota.get("rpm"), tpm=quota.get("tpm"))
+            _limiters[key] = limiter
+        return limiter
+
+
+async def acquire_quota(model: str, tokens: int = 0, search_grounding: bool = False) -> TokenBucketLimiter:
+    """
+    Take one request (and ~tokens tokens) from the model's budget.
+
+    Search-grounded calls also take one request from the SEARCH_GROUNDING
+    bucket. Returns the model's limiter so the caller can settle actual
+    usage with adjust_tokens(). Raises JobCancelledError instead if the
+    current job has been cancelled, so no further quota is spent on it.
+    """
+    check_cancelled()
+    limiter = get_rate_limiter(model)
+    await limiter.acquire(tokens)
+    if search_grounding:
+        await get_rate_limiter(SEARCH_GROUNDING).acquire()
+    return limiter
+
+
+class RateLimitedLanguageModel(synalinks.LanguageModel):
+    """
+    synalinks.LanguageModel whose calls draw from the process-wide budget for its model.
+
+    The prompt size is estimated before the call; the response size is
+    charged afterwards, since synalinks does not surface provider usage.
+    Gemini calls made inside a job that brought its own key use that key.
+    """
+
+    async def __call__(self, messages, schema=None, streaming=False, **kwargs):
+        prompt_tokens = estimate_tokens(json.dumps(messages.get_json(), default=str))
+        limiter = await acquire_quota(self.model, prompt_tokens)
+        job_api_key = get_job_api_key()
+        if job_api_key and self.model.startswith("gemini"):
+            kwargs["api_key"] = job_api_key
+        result = await super().__call__(messages, schema=schema, streaming=streaming, **kwargs)
+        if result is not None and not streaming:
+            limiter.adjust_tokens(estimate_tokens(json.dumps(result, default=str)))
+        return result
@@ -20,7 +20,7 @@ from .models import (
 )
 from .gemini_client import DeepResearchClient
 from .query_generator import generate_research_queries
-from .parser import parse_research
+from .parser import parse_research, IncrementalResearchParser
 from .manager import ResearchManager
 
 # Stage 2: arXiv fetcher
@@ -28,6 +28,8 @@ from .arxiv_fetcher import (
     ArxivPaper,
     search_arxiv,
     search_arxiv_by_id,
+    fetch_arxiv_papers_by_ids,
+    find_cached_paper_by_title,
     search_arxiv_with_gemini,
     batch_search_arxiv_with_gemini,
     download_and_extract_pdf,
@@ -55,11 +57,14 @@ __all__ = [
     "DeepResearchClient",
     "generate_research_queries",
     "parse_research",
+    "IncrementalResearchParser",
     "ResearchManager",
     # Stage 2: arXiv
     "ArxivPaper",
     "search_arxiv",
     "search_arxiv_by_id",
+    "fetch_arxiv_papers_by_ids",
+    "find_cached_paper_by_title",
     "search_arxiv_with_gemini",
     "batch_search_arxiv_with_gemini",
     "download_and_extract_pdf",
@@ -0,0 +1,252 @@
+"""
+Persistent arXiv metadata and title resolution caches.
+
+Paper metadata (title, authors, abstract, dates, PDF URL) fetched from the
+arXiv API is stored in SQLite keyed by the version-less arXiv ID, so books
+on the same field resolve already-seen papers without any API round trip.
+Entries can also be found by normalized title, which lets title lookups
+skip the arXiv search for papers seen before.
+
+A second table remembers which arXiv ID a (normalized) paper title was
+resolved to by the search-grounded Gemini lookup, including titles that
+have no arXiv version. Negative results expire after a TTL so papers
+that appear on arXiv later are picked up again.
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import threading
+import logging
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default location: data/arxiv_cache.db relative to project root
+_DEFAULT_DB_PATH = os.environ.get("ARXIV_CACHE_DB", "data/arxiv_cache.db")
+
+# Seconds a "not on arXiv" title result is trusted before asking again
+DEFAULT_NEGATIVE_TTL = 7 * 24 * 3600
+
+_ID_PREFIX = re.compile(r'^(?:https?://arxiv\.org/(?:abs|pdf)/|arxiv:)', re.IGNORECASE)
+_ID_VERSION = re.compile(r'v\d+$')
+
+
+def normalize_arxiv_id(arxiv_id: str) -> str:
+    """Canonical cache key: "arXiv:1706.03762v7" / ".../abs/1706.03762" -> "1706.03762"."""
+    arxiv_id = _ID_PREFIX.sub("", arxiv_id.strip())
+    if arxiv_id.endswith(".pdf"):
+        arxiv_id = arxiv_id[:-4]
+    return _ID_VERSION.sub("", arxiv_id)
+
+
+def normalize_title(title: str) -> str:
+    """Case- and punctuation-insensitive title key."""
+    return re.sub(r'[^a-z0-9]+', ' ', title.lower()).strip()
+
+
+class ArxivMetadataCache:
+    """SQLite-backed store of arXiv paper metadata keyed by arXiv ID."""
+
+    def __init__(self, db_path: Optional[str] = None):
+        self._db_path = db_path or _DEFAULT_DB_PATH
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self._db_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self._db_path, timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS papers (
+                arxiv_id TEXT PRIMARY KEY,
+                title_key TEXT NOT NULL,
+                metadata_json TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_papers_title ON papers(title_key)")
+        conn.commit()
+        return conn
+
+    def get_many(self, arxiv_ids: Iterable[str]) -> Dict[str, dict]:
+        """Cached metadata for the given IDs, keyed by normalized ID (misses are absent)."""
+        keys = list(dict.fromkeys(normalize_arxiv_id(i) for i in arxiv_ids))
+        found: Dict[str, dict] = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT arxiv_id, metadata_json FROM papers "
+                    f"WHERE arxiv_id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                found.update((row[0], json.loads(row[1])) for row in rows)
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def get_by_title(self, title: str) -> Optional[dict]:
+        """Cached metadata for a paper with this (normalized) title, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT metadata_json FROM papers WHERE title_key = ? ORDER BY fetched_at DESC LIMIT 1",
+                (normalize_title(title),),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put_many(self, papers: List[dict]) -> None:
+        """Store metadata dicts (each with at least arxiv_id and title)."""
+        now = time.time()
+        rows = [
+            (
+                normalize_arxiv_id(p["arxiv_id"]),
+                normalize_title(p.get("title", "")),
+                json.dumps(p, ensure_ascii=False),
+                now,
+            )
+            for p in papers if p.get("arxiv_id")
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                """INSERT OR REPLACE INTO papers (arxiv_id, title_key, metadata_json, fetched_at)
+                   VALUES (?, ?, ?, ?)""",
+                rows,
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+        return {"entries": entries, "hits": self.hits, "misses": self.misses}
+
+
+class ArxivTitleCache:
+    """
+    SQLite-backed map of normalized paper title -> arXiv ID (or "not found").
+
+    Positive results are kept indefinitely; negative results are only
+    returned while younger than negative_ttl seconds.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, negative_ttl: float = DEFAULT_NEGATIVE_TTL):
+        self._db_path = db_path or _DEFAULT_DB_PATH
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self._db_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self._db_path, timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS title_ids (
+                title_key TEXT PRIMARY KEY,
+                arxiv_id TEXT,
+                resolved_at REAL NOT NULL
+            )
+        """)
+        conn.commit()
+        return conn
+
+    def get_many(self, titles: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Cached resolutions for the given titles.
+
+        Returns:
+            Dict of title -> arXiv ID, or None for a fresh "not on arXiv"
+            result. Titles with no (fresh) entry are absent.
+        """
+        titles = list(dict.fromkeys(titles))
+        keys = {title: normalize_title(title) for title in titles}
+        cutoff = time.time() - self.negative_ttl
+        rows = {}
+        with self._lock:
+            unique_keys = list(set(keys.values()))
+            for start in range(0, len(unique_keys), 500):
+                chunk = unique_keys[start:start + 500]
+                rows.update(
+                    (row[0], (row[1], row[2]))
+                    for row in self._conn.execute(
+                        f"SELECT title_key, arxiv_id, resolved_at FROM title_ids "
+                        f"WHERE title_key IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                )
+
+            found: Dict[str, Optional[str]] = {}
+            for title, key in keys.items():
+                entry = rows.get(key)
+                if entry is None or (entry[0] is None and entry[1] < cutoff):
+                    self.misses += 1
+                    continue
+                found[title] = entry[0]
+                if entry[0] is None:
+                    self.negative_hits += 1
+                else:
+                    self.hits += 1
+        return found
+
+    def put_many(self, resolved: Dict[str, Optional[str]]) -> None:
+        """Record title -> arXiv ID results (None = confirmed not on arXiv)."""
+        now = time.time()
+        rows = [(normalize_title(t), i, now) for t, i in resolved.items() if normalize_title(t)]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO title_ids (title_key, arxiv_id, resolved_at) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+        }
+
+
+_caches: Dict[str, ArxivMetadataCache] = {}
+_title_caches: Dict[str, ArxivTitleCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_arxiv_metadata_cache(db_path: Optional[str] = None) -> ArxivMetadataCache:
+    """Get the shared ArxivMetadataCache for db_path, creating it on first use."""
+    path = os.path.abspath(db_path or _DEFAULT_DB_PATH)
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = ArxivMetadataCache(path)
+            _caches[path] = cache
+        return cache
+
+
+def get_arxiv_title_cache(db_path: Optional[str] = None) -> ArxivTitleCache:
+    """Get the shared ArxivTitleCache for db_path, creating it on first use."""
+    path = os.path.abspath(db_path or _DEFAULT_DB_PATH)
+    with _caches_lock:
+        cache = _title_caches.get(path)
+        if cache is None:
+            cache = ArxivTitleCache(path)
+            _title_caches[path] = cache
+        return cache
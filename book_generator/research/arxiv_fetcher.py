@@ -3,22 +3,36 @@ arXiv paper fetcher with full PDF text extraction.
 
 This module provides functionality to:
 - Search arXiv using Gemini with Google Search grounding (primary method)
-- Fallback to arxiv library for direct ID lookups
-- Extract full text using arxiv2text (simpler than PyMuPDF)
+- Fallback to arxiv library for direct ID lookups (batched id_list queries
+  through one shared, rate-limited client, backed by a persistent metadata cache)
+- Extract full text in the shared PDF extraction worker processes
 - Parse common paper sections (abstract, introduction, method, results, conclusion)
 """
 
 import os
 import re
 import json
+import time
 import logging
 import asyncio
-from dataclasses import dataclass, field
+import tempfile
+import threading
+import weakref
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional
 
 import arxiv
 import litellm
-from arxiv2text import arxiv_to_text
+
+from ..concurrency import AdaptiveLimiter, is_overload_error
+from ..rate_limit import acquire_quota, estimate_tokens
+from ..credentials import get_job_api_key
+from ..pdf_text import download_pdf, extract_pdf_text
+from .arxiv_cache import (
+    get_arxiv_metadata_cache, get_arxiv_title_cache, normalize_arxiv_id, normalize_title,
+)
+from .arxiv_text_cache import get_arxiv_text_cache
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +45,7 @@ async def search_arxiv_with_gemini(
     paper_title: str,
     model: str = "gemini/gemini-3-flash-preview",
     max_retries: int = 2,
+    limiter: Optional[AdaptiveLimiter] = None,
 ) -> Optional[str]:
     """
     Use Gemini with Google Search grounding to find arXiv ID for a paper.
@@ -42,10 +57,29 @@ async def search_arxiv_with_gemini(
         paper_title: The paper title to search for
         model: Gemini model to use (must support Google Search)
         max_retries: Number of retry attempts
+        limiter: Optional adaptive limiter that each Gemini call runs under
 
     Returns:
         arXiv ID (e.g., "1706.03762") or None if not found
     """
+    arxiv_id, _ = await _resolve_arxiv_id_with_gemini(paper_title, model, max_retries, limiter)
+    return arxiv_id
+
+
+async def _resolve_arxiv_id_with_gemini(
+    paper_title: str,
+    model: str,
+    max_retries: int,
+    limiter: Optional[AdaptiveLimiter],
+) -> tuple:
+    """
+    Gemini lookup behind search_arxiv_with_gemini().
+
+    Returns:
+        (arxiv_id or None, answered) where answered is True only for an
+        ID or an explicit NOT_FOUND reply; failed calls and unparseable
+        replies give (None, False) and must not be cached as "not found"
+    """
     prompt = f"""Find the arXiv paper ID for this academic paper:
 
 Title: "{paper_title}"
@@ -56,22 +90,31 @@ If you cannot find this exact paper on arXiv, respond with "NOT_FOUND".
 
 Important: Only return an arXiv ID if you are confident it matches the paper title."""
 
+    estimated_tokens = estimate_tokens(prompt) + 100
+
     for attempt in range(max_retries):
         try:
-            response = await litellm.acompletion(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=1.0,  # Required for Gemini 3 models
-                max_tokens=100,
-                tools=[{"googleSearch": {}}],  # Google Search grounding (camelCase)
-            )
+            quota = await acquire_quota(model, estimated_tokens, search_grounding=True)
+            async with (limiter.slot() if limiter else nullcontext()):
+                response = await litellm.acompletion(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=1.0,  # Required for Gemini 3 models
+                    max_tokens=100,
+                    tools=[{"googleSearch": {}}],  # Google Search grounding (camelCase)
+                    api_key=get_job_api_key(),  # None falls back to GEMINI_API_KEY
+                )
+
+            usage = getattr(response, "usage", None)
+            if usage and getattr(usage, "total_tokens", None):
+                quota.adjust_tokens(usage.total_tokens - estimated_tokens)
 
             result = response.choices[0].message.content.strip()
             logger.debug(f"[arXiv-Gemini] Response for '{paper_title[:40]}...': {result}")
 
             # Check if not found
             if "NOT_FOUND" in result.upper() or "not found" in result.lower():
-                return None
+                return None, True
 
             # Extract arXiv ID pattern (e.g., 1706.03762, 2301.00001, cs/0001001)
             arxiv_patterns = [
@@ -86,61 +129,84 @@ Important: Only return an arXiv ID if you are confident it matches the paper tit
                     # Remove version suffix if present
                     arxiv_id = re.sub(r'v\d+$', '', arxiv_id)
                     logger.info(f"[arXiv-Gemini] Found: {arxiv_id} for '{paper_title[:40]}...'")
-                    return arxiv_id
+                    return arxiv_id, True
 
+            # Empty, cut-off or unparseable reply: not a definitive "not on arXiv"
             logger.debug(f"[arXiv-Gemini] No arXiv ID pattern in response: {result}")
-            return None
+            return None, False
 
         except Exception as e:
             logger.warning(f"[arXiv-Gemini] Error (attempt {attempt + 1}/{max_retries}): {e}")
             if attempt < max_retries - 1:
                 await asyncio.sleep(1)
 
-    return None
+    return None, False
 
 
 async def batch_search_arxiv_with_gemini(
     paper_titles: List[str],
     model: str = "gemini/gemini-3-flash-preview",
     batch_size: int = 5,
+    use_cache: bool = True,
 ) -> Dict[str, Optional[str]]:
     """
     Batch search for multiple papers using Gemini with Google Search.
 
-    Processes papers in batches to avoid rate limiting.
+    Titles resolved in earlier runs (including fresh "not on arXiv"
+    results) come from the persistent title cache without a Gemini call.
+    The rest run under an adaptive concurrency window that starts at
+    batch_size, grows while Gemini keeps up and shrinks on rate-limit
+    responses; their answers are added to the cache.
 
     Args:
         paper_titles: List of paper titles to search
         model: Gemini model to use
-        batch_size: Number of papers to search in parallel
+        batch_size: Initial number of papers searched in parallel
+        use_cache: Whether to consult the title cache first
 
     Returns:
         Dict mapping paper titles to arXiv IDs (or None if not found)
     """
-    results = {}
-
-    for i in range(0, len(paper_titles), batch_size):
-        batch = paper_titles[i:i + batch_size]
-        logger.info(f"[arXiv-Gemini] Batch {i//batch_size + 1}: searching {len(batch)} papers...")
-
-        # Search in parallel within batch
-        tasks = [search_arxiv_with_gemini(title, model) for title in batch]
-        batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for title, result in zip(batch, batch_results):
-            if isinstance(result, Exception):
-                logger.warning(f"[arXiv-Gemini] Exception for '{title[:40]}...': {result}")
-                results[title] = None
-            else:
-                results[title] = result
-
-        # Small delay between batches to avoid rate limiting
-        if i + batch_size < len(paper_titles):
-            await asyncio.sleep(0.5)
-
+    title_cache = get_arxiv_title_cache()
+    results = title_cache.get_many(paper_titles) if use_cache else {}
+    # One Gemini call per normalized title; variants share its answer
+    variants: Dict[str, List[str]] = {}
+    for title in dict.fromkeys(paper_titles):
+        if title not in results:
+            variants.setdefault(normalize_title(title), []).append(title)
+    to_search = [titles[0] for titles in variants.values()]
+    cached = len(results)
+    negative = sum(1 for v in results.values() if v is None)
+
+    limiter = AdaptiveLimiter("arXiv-Gemini", initial=batch_size, max_limit=batch_size * 4)
+    logger.info(f"[arXiv-Gemini] Searching {len(to_search)} papers "
+                f"({cached} cached, initial window {batch_size})...")
+
+    tasks = [_resolve_arxiv_id_with_gemini(title, model, 2, limiter) for title in to_search]
+    search_results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    answered = {}
+    for title, result in zip(to_search, search_results):
+        arxiv_id = None
+        if isinstance(result, Exception):
+            logger.warning(f"[arXiv-Gemini] Exception for '{title[:40]}...': {result}")
+        else:
+            arxiv_id, is_answer = result
+            if is_answer:
+                answered[title] = arxiv_id
+        for variant in variants[normalize_title(title)]:
+            results[variant] = arxiv_id
+    title_cache.put_many(answered)
+
+    unique = len(results)
     found = sum(1 for v in results.values() if v is not None)
-    logger.info(f"[arXiv-Gemini] Found {found}/{len(paper_titles)} papers on arXiv")
-    return results
+    logger.info(f"[arXiv-Gemini] Found {found}/{unique} papers on arXiv "
+                f"(final window {limiter.limit})")
+    if unique:
+        logger.info(f"[arXiv-Gemini] Title cache: {cached}/{unique} hits "
+                    f"({cached - negative} IDs, {negative} known not on arXiv), "
+                    f"hit rate {cached / unique:.0%}")
+    return {title: results[title] for title in paper_titles}
 
 
 @dataclass
@@ -172,6 +238,116 @@ def _convert_arxiv_result(result: arxiv.Result) -> ArxivPaper:
     )
 
 
+def _paper_metadata(paper: ArxivPaper) -> dict:
+    """Metadata fields of a paper (no extracted text), as stored in the cache."""
+    data = asdict(paper)
+    data.pop("full_text", None)
+    data.pop("sections", None)
+    return data
+
+
+def _paper_from_metadata(data: dict) -> ArxivPaper:
+    return ArxivPaper(
+        arxiv_id=data["arxiv_id"],
+        title=data.get("title", ""),
+        authors=list(data.get("authors", [])),
+        abstract=data.get("abstract", ""),
+        published=data.get("published", ""),
+        pdf_url=data.get("pdf_url", ""),
+    )
+
+
+# =============================================================================
+# Shared arXiv API client
+# =============================================================================
+
+# IDs resolved per id_list query (arXiv API page size limit is generous; keep URLs short)
+ARXIV_ID_BATCH_SIZE = 100
+
+# arXiv asks for at least 3 seconds between API requests
+ARXIV_DELAY_SECONDS = 3.0
+
+_arxiv_client: Optional[arxiv.Client] = None
+_arxiv_client_lock = threading.Lock()
+
+# arXiv PDF downloads in flight at once across all jobs, and seconds between their starts
+ARXIV_PDF_MAX_CONCURRENT = 2
+ARXIV_PDF_MIN_INTERVAL = 1.0
+
+_pdf_gate_lock = threading.Lock()
+_pdf_downloads_in_flight = 0
+_pdf_next_start = 0.0
+
+# Per event loop: callers queue here, not in executor threads
+_arxiv_loop_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_arxiv_client() -> arxiv.Client:
+    """The process-wide arxiv.Client (created on first use)."""
+    global _arxiv_client
+    if _arxiv_client is None:
+        _arxiv_client = arxiv.Client(
+            page_size=ARXIV_ID_BATCH_SIZE,
+            delay_seconds=ARXIV_DELAY_SECONDS,
+            num_retries=3,
+        )
+    return _arxiv_client
+
+
+def _run_arxiv_search(search: arxiv.Search) -> List[arxiv.Result]:
+    """
+    Run a search on the shared client.
+
+    Requests are serialized through one client, so its built-in delay
+    keeps the whole process within arXiv's rate limit.
+    """
+    with _arxiv_client_lock:
+        return list(_get_arxiv_client().results(search))
+
+
+async def _arxiv_search(search: arxiv.Search) -> List[arxiv.Result]:
+    """
+    Run a search on the shared client from async code.
+
+    Waiters queue on an asyncio.Lock, so at most one executor thread per
+    event loop is tied up in the client (and its 3 s delays) at a time;
+    the thread lock inside only matters across event loops.
+    """
+    loop = asyncio.get_running_loop()
+    lock = _arxiv_loop_locks.get(loop)
+    if lock is None:
+        lock = _arxiv_loop_locks[loop] = asyncio.Lock()
+    async with lock:
+        return await asyncio.to_thread(_run_arxiv_search, search)
+
+
+@asynccontextmanager
+async def _pdf_download_slot():
+    """
+    Hold one process-wide arXiv PDF download slot.
+
+    State is guarded by a threading lock and waiting uses asyncio.sleep,
+    so the cap and the pacing hold across jobs on different event loops.
+    """
+    global _pdf_downloads_in_flight, _pdf_next_start
+    while True:
+        with _pdf_gate_lock:
+            now = time.monotonic()
+            if _pdf_downloads_in_flight < ARXIV_PDF_MAX_CONCURRENT and now >= _pdf_next_start:
+                _pdf_downloads_in_flight += 1
+                _pdf_next_start = now + ARXIV_PDF_MIN_INTERVAL
+                break
+            wait = max(_pdf_next_start - now, 0.05)
+        await asyncio.sleep(wait)
+    try:
+        yield
+    finally:
+        with _pdf_gate_lock:
+            _pdf_downloads_in_flight -= 1
+
+
 async def search_arxiv(
     query: str,
     max_results: int = 20,
@@ -180,6 +356,9 @@ async def search_arxiv(
     """
     Search arXiv by title/query.
 
+    Results are added to the metadata cache, so later ID lookups of the
+    same papers are free.
+
     Args:
         query: Search query (title search by default)
         max_results: Maximum number of results to return
@@ -188,22 +367,21 @@ async def search_arxiv(
     Returns:
         List of ArxivPaper objects with metadata (no full text yet)
     """
-    def _search_sync():
-        # Use all-field search for better recall (not just title)
-        # arXiv's ti: search is too restrictive for fuzzy title matching
-        search = arxiv.Search(
-            query=query,  # Search all fields, not just title
-            max_results=max_results,
-            sort_by=arxiv.SortCriterion.Relevance,
-        )
-        client = arxiv.Client()
-        return list(client.results(search))
+    # Use all-field search for better recall (not just title)
+    # arXiv's ti: search is too restrictive for fuzzy title matching
+    search = arxiv.Search(
+        query=query,  # Search all fields, not just title
+        max_results=max_results,
+        sort_by=arxiv.SortCriterion.Relevance,
+    )
 
     for attempt in range(max_retries):
         try:
             # Run synchronous arxiv library in thread pool
-            results = await asyncio.to_thread(_search_sync)
-            return [_convert_arxiv_result(r) for r in results]
+            results = await _arxiv_search(search)
+            papers = [_convert_arxiv_result(r) for r in results]
+            get_arxiv_metadata_cache().put_many([_paper_metadata(p) for p in papers])
+            return papers
 
         except arxiv.HTTPError as e:
             if "429" in str(e) or "rate" in str(e).lower():
@@ -221,6 +399,71 @@ async def search_arxiv(
     return []
 
 
+async def fetch_arxiv_papers_by_ids(
+    arxiv_ids: List[str],
+    use_cache: bool = True,
+) -> Dict[str, Optional[ArxivPaper]]:
+    """
+    Resolve many arXiv IDs at once.
+
+    Cached IDs are served from the metadata cache; the rest are fetched
+    with one id_list query per ARXIV_ID_BATCH_SIZE IDs and cached.
+
+    Args:
+        arxiv_ids: arXiv IDs (with or without version / "arXiv:" prefix)
+        use_cache: Whether to read the metadata cache (results are always stored)
+
+    Returns:
+        Dict mapping each requested ID to an ArxivPaper, or None if not found
+    """
+    cache = get_arxiv_metadata_cache()
+    keys = {arxiv_id: normalize_arxiv_id(arxiv_id) for arxiv_id in arxiv_ids}
+    found: Dict[str, ArxivPaper] = {}
+
+    if use_cache:
+        for key, data in cache.get_many(keys.values()).items():
+            found[key] = _paper_from_metadata(data)
+
+    missing = [k for k in dict.fromkeys(keys.values()) if k not in found]
+    queries = 0
+    failed: List[str] = []
+
+    async def fetch_batch(batch: List[str]) -> None:
+        nonlocal queries
+        queries += 1
+        search = arxiv.Search(id_list=batch, max_results=len(batch))
+        try:
+            results = await _arxiv_search(search)
+        except Exception as e:
+            # One malformed ID makes arXiv reject the whole id_list: split the
+            # batch to isolate it. Rate limits / network errors are not split.
+            if len(batch) > 1 and isinstance(e, arxiv.HTTPError) and not is_overload_error(e):
+                logger.info(f"[arXiv] ID batch of {len(batch)} rejected ({e}); splitting")
+                middle = len(batch) // 2
+                await fetch_batch(batch[:middle])
+                await fetch_batch(batch[middle:])
+            else:
+                logger.warning(f"Failed to fetch {len(batch)} arXiv papers by ID: {e}")
+                failed.extend(batch)
+            return
+        papers = [_convert_arxiv_result(r) for r in results]
+        cache.put_many([_paper_metadata(p) for p in papers])
+        for paper in papers:
+            found[normalize_arxiv_id(paper.arxiv_id)] = paper
+
+    for start in range(0, len(missing), ARXIV_ID_BATCH_SIZE):
+        await fetch_batch(missing[start:start + ARXIV_ID_BATCH_SIZE])
+
+    if failed:
+        logger.warning(f"[arXiv] Could not fetch IDs: {', '.join(failed)}")
+    if arxiv_ids:
+        logger.info(
+            f"[arXiv] Resolved {sum(1 for k in set(keys.values()) if k in found)}/{len(set(keys.values()))} IDs "
+            f"({len(set(keys.values())) - len(missing)} from cache, {queries} API queries)"
+        )
+    return {arxiv_id: found.get(key) for arxiv_id, key in keys.items()}
+
+
 async def search_arxiv_by_id(arxiv_id: str) -> Optional[ArxivPaper]:
     """
     Fetch a specific paper by arXiv ID.
@@ -231,33 +474,38 @@ async def search_arxiv_by_id(arxiv_id: str) -> Optional[ArxivPaper]:
     Returns:
         ArxivPaper object or None if not found
     """
-    def _search_by_id_sync():
-        search = arxiv.Search(id_list=[arxiv_id])
-        client = arxiv.Client()
-        return list(client.results(search))
-
     try:
-        results = await asyncio.to_thread(_search_by_id_sync)
-        if results:
-            return _convert_arxiv_result(results[0])
-        return None
+        results = await fetch_arxiv_papers_by_ids([arxiv_id])
+        return results.get(arxiv_id)
 
     except Exception as e:
         logger.warning(f"Failed to fetch arXiv paper {arxiv_id}: {e}")
         return None
 
 
+def find_cached_paper_by_title(title: str) -> Optional[ArxivPaper]:
+    """A previously fetched paper with this title (ignoring case and punctuation), or None."""
+    data = get_arxiv_metadata_cache().get_by_title(title)
+    return _paper_from_metadata(data) if data else None
+
+
 async def download_and_extract_pdf(
     paper: ArxivPaper,
-    cache_dir: str,
+    cache_dir: Optional[str] = None,
     max_chars: int = 100000,
 ) -> ArxivPaper:
     """
-    Extract full text from arXiv paper using arxiv2text.
+    Download an arXiv paper's PDF and extract its full text.
+
+    Extraction runs in the shared PDF worker processes and stops once
+    max_chars characters have been read. Texts are kept in the compressed
+    arXiv text cache; a cached text is used when it covers max_chars, and
+    only its first max_chars characters are read back.
 
     Args:
         paper: ArxivPaper with pdf_url
-        cache_dir: Directory to cache extracted text
+        cache_dir: arXiv text cache directory (default: data/arxiv_text,
+            or ARXIV_TEXT_CACHE_DIR)
         max_chars: Maximum characters to extract (to limit memory)
 
     Returns:
@@ -267,41 +515,42 @@ async def download_and_extract_pdf(
         logger.warning(f"No PDF URL for paper: {paper.title[:50]}...")
         return paper
 
-    os.makedirs(cache_dir, exist_ok=True)
-
-    # Sanitize arxiv_id for filename
-    safe_id = paper.arxiv_id.replace("/", "_").replace(":", "_")
-    text_path = os.path.join(cache_dir, f"{safe_id}.txt")
+    text_cache = get_arxiv_text_cache(cache_dir)
+    cache_key = normalize_arxiv_id(paper.arxiv_id)
 
     # Check text cache first
-    if os.path.exists(text_path):
+    info = text_cache.info(cache_key)
+    if info and (not info["truncated"] or info["text_chars"] >= max_chars):
         try:
-            with open(text_path, 'r', encoding='utf-8') as f:
-                paper.full_text = f.read()
-            paper.sections = _extract_sections(paper.full_text)
-            logger.debug(f"Loaded cached text for {paper.arxiv_id}")
-            return paper
+            full_text = text_cache.read_text(cache_key, 0, max_chars)
+            if full_text is not None:
+                paper.full_text = full_text
+                # Stored sections describe the stored text; recompute for a shorter prefix
+                if info["text_chars"] <= max_chars:
+                    paper.sections = text_cache.read_sections(cache_key) or {}
+                else:
+                    paper.sections = _extract_sections(full_text)
+                logger.debug(f"Loaded cached text for {paper.arxiv_id}")
+                return paper
         except Exception as e:
             logger.warning(f"Failed to load cached text: {e}")
 
-    # Extract text using arxiv2text (handles download + extraction)
+    fd, pdf_path = tempfile.mkstemp(dir=text_cache.cache_dir, suffix=".pdf")
+    os.close(fd)
     try:
-        def _extract_sync():
-            return arxiv_to_text(paper.pdf_url)
-
-        full_text = await asyncio.to_thread(_extract_sync)
+        async with _pdf_download_slot():
+            await asyncio.to_thread(download_pdf, paper.pdf_url, pdf_path)
+        full_text = await extract_pdf_text(pdf_path, max_chars)
 
         if full_text:
-            # Limit text size
-            if len(full_text) > max_chars:
-                full_text = full_text[:max_chars]
-
             paper.full_text = full_text
             paper.sections = _extract_sections(full_text)
 
             # Cache extracted text
-            with open(text_path, 'w', encoding='utf-8') as f:
-                f.write(full_text)
+            await asyncio.to_thread(
+                text_cache.put, cache_key, full_text, paper.sections,
+                truncated=len(full_text) >= max_chars,
+            )
 
             logger.info(f"Extracted {len(full_text)} chars from {paper.arxiv_id}")
         else:
@@ -309,6 +558,10 @@ async def download_and_extract_pdf(
 
     except Exception as e:
         logger.warning(f"Failed to extract text from {paper.arxiv_id}: {e}")
+    finally:
+        # Only the extracted text is kept
+        if os.path.exists(pdf_path):
+            os.remove(pdf_path)
 
     return paper
 
@@ -367,7 +620,7 @@ def _extract_sections(text: str) -> Dict[str, str]:
 
 async def fetch_papers_for_chapter(
     paper_titles: List[str],
-    cache_dir: str,
+    cache_dir: Optional[str] = None,
     download_pdfs: bool = False,
 ) -> List[ArxivPaper]:
     """
@@ -375,7 +628,7 @@ async def fetch_papers_for_chapter(
 
     Args:
         paper_titles: List of paper titles to search for
-        cache_dir: Directory to cache PDFs
+        cache_dir: arXiv text cache directory (default: shared cache)
         download_pdfs: Whether to download and extract full PDFs
 
     Returns:
@@ -384,15 +637,19 @@ async def fetch_papers_for_chapter(
     papers = []
 
     for title in paper_titles:
-        # Search by title (get best match)
-        search_results = await search_arxiv(title, max_results=3)
+        # Papers seen in earlier runs are matched by title without an API call
+        paper = find_cached_paper_by_title(title)
 
-        if not search_results:
-            logger.debug(f"No arXiv results for: {title[:50]}...")
-            continue
+        if paper is None:
+            # Search by title (get best match)
+            search_results = await search_arxiv(title, max_results=3)
+
+            if not search_results:
+                logger.debug(f"No arXiv results for: {title[:50]}...")
+                continue
 
-        # Take the first (most relevant) result
-        paper = search_results[0]
+            # Take the first (most relevant) result
+            paper = search_results[0]
 
         if download_pdfs:
             paper = await download_and_extract_pdf(paper, cache_dir)
@@ -0,0 +1,316 @@
+"""
+Compressed, size-capped store for extracted arXiv full texts.
+
+Each paper's text is split into fixed-size character chunks that are
+compressed independently (zstd when the zstandard package is installed,
+gzip otherwise) and written back to back into one file. An SQLite index
+records every entry's chunk offsets, compressed size and last access, so:
+
+- a prefix or any character range is read by decompressing only the
+  chunks that cover it, never the whole text;
+- the sections found by _extract_sections() are stored separately and
+  can be read without touching the text at all;
+- least-recently-used entries are evicted once the store exceeds its
+  byte budget.
+"""
+
+import os
+import json
+import time
+import gzip
+import sqlite3
+import tempfile
+import threading
+import logging
+from typing import Dict, List, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Default location: data/arxiv_text relative to project root
+_DEFAULT_CACHE_DIR = os.environ.get("ARXIV_TEXT_CACHE_DIR", "data/arxiv_text")
+
+# Default size budget for compressed entries (override with ARXIV_TEXT_CACHE_MAX_BYTES)
+DEFAULT_MAX_BYTES = int(os.environ.get("ARXIV_TEXT_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+# Characters per independently compressed chunk (granularity of range reads)
+CHUNK_CHARS = 16384
+
+# Fraction of the budget to shrink to when evicting (avoids evicting on every put)
+_EVICT_TARGET_RATIO = 0.9
+
+_INDEX_FILENAME = "index.db"
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def _codec_available(codec: str) -> bool:
+    return codec == "gzip" or (codec == "zstd" and zstandard is not None)
+
+
+class ArxivTextCache:
+    """Chunk-compressed full texts on disk, indexed in SQLite, with LRU eviction."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or _DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.codec = "zstd" if zstandard is not None else "gzip"
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._conn = self._connect()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM texts"
+        ).fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            os.path.join(self.cache_dir, _INDEX_FILENAME), timeout=10, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS texts (
+                arxiv_id TEXT PRIMARY KEY,
+                filename TEXT NOT NULL,
+                codec TEXT NOT NULL,
+                chunk_chars INTEGER NOT NULL,
+                offsets_json TEXT NOT NULL,
+                text_chars INTEGER NOT NULL,
+                truncated INTEGER NOT NULL,
+                sections BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_texts_last_access ON texts(last_access)")
+        conn.commit()
+        return conn
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.cache_dir, filename)
+
+    def _lookup(self, arxiv_id: str, columns: str) -> Optional[sqlite3.Row]:
+        """Index row for arxiv_id (refreshing its LRU position), counting hit/miss. Caller holds the lock."""
+        row = self._conn.execute(
+            f"SELECT codec, {columns} FROM texts WHERE arxiv_id = ?", (arxiv_id,)
+        ).fetchone()
+        if row is None or not _codec_available(row[0]):
+            self.misses += 1
+            return None
+        self._conn.execute(
+            "UPDATE texts SET last_access = ? WHERE arxiv_id = ?", (time.time(), arxiv_id)
+        )
+        self._conn.commit()
+        self.hits += 1
+        return row
+
+    def info(self, arxiv_id: str) -> Optional[dict]:
+        """
+        Length of a cached text and whether extraction cut it off, or None.
+
+        Does not count as an access.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT codec, text_chars, truncated FROM texts WHERE arxiv_id = ?", (arxiv_id,)
+            ).fetchone()
+        if row is None or not _codec_available(row[0]):
+            return None
+        return {"text_chars": row[1], "truncated": bool(row[2])}
+
+    def read_text(self, arxiv_id: str, start: int = 0, end: Optional[int] = None) -> Optional[str]:
+        """
+        Characters [start:end] of a cached text, or None if not cached.
+
+        Only the chunks overlapping the range are read and decompressed.
+        """
+        with self._lock:
+            row = self._lookup(arxiv_id, "filename, chunk_chars, offsets_json, text_chars")
+            if row is None:
+                return None
+            codec, filename, chunk_chars, offsets_json, text_chars = row
+            end = text_chars if end is None else min(end, text_chars)
+            if start >= end:
+                return ""
+
+            offsets = json.loads(offsets_json)
+            first, last = start // chunk_chars, (end - 1) // chunk_chars
+            try:
+                with open(self._path(filename), "rb") as f:
+                    f.seek(offsets[first])
+                    data = f.read(offsets[last + 1] - offsets[first])
+            except OSError as e:
+                logger.warning(f"arXiv text cache: dropping unreadable entry {arxiv_id}: {e}")
+                self._drop(arxiv_id)
+                return None
+
+        parts = []
+        for i in range(first, last + 1):
+            chunk = data[offsets[i] - offsets[first]:offsets[i + 1] - offsets[first]]
+            parts.append(_decompress(chunk, codec).decode("utf-8"))
+        base = first * chunk_chars
+        return "".join(parts)[start - base:end - base]
+
+    def read_sections(self, arxiv_id: str) -> Optional[Dict[str, str]]:
+        """Sections stored with a cached text, or None if not cached. The text itself is not read."""
+        with self._lock:
+            row = self._lookup(arxiv_id, "sections")
+        if row is None:
+            return None
+        codec, sections = row
+        return json.loads(_decompress(sections, codec).decode("utf-8"))
+
+    def put(
+        self,
+        arxiv_id: str,
+        text: str,
+        sections: Dict[str, str],
+        truncated: bool = False,
+    ) -> None:
+        """
+        Store a text and its sections, evicting least-recently-used entries if over budget.
+
+        Args:
+            arxiv_id: Paper ID
+            text: Extracted text
+            sections: Output of _extract_sections() for the text
+            truncated: True if extraction stopped at a character limit
+        """
+        offsets: List[int] = [0]
+        safe_id = arxiv_id.replace("/", "_").replace(":", "_")
+        filename = f"{safe_id}.{self.codec}"
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for i in range(0, len(text), CHUNK_CHARS):
+                    chunk = _compress(text[i:i + CHUNK_CHARS].encode("utf-8"), self.codec)
+                    f.write(chunk)
+                    offsets.append(offsets[-1] + len(chunk))
+            packed_sections = _compress(
+                json.dumps(sections, ensure_ascii=False).encode("utf-8"), self.codec
+            )
+            size = offsets[-1] + len(packed_sections)
+            # Larger entries would be evicted by the very put that stores them
+            if size > int(self.max_bytes * _EVICT_TARGET_RATIO):
+                logger.info(f"arXiv text cache: {arxiv_id} ({size} bytes) exceeds the budget; not cached")
+                return
+
+            now = time.time()
+            with self._lock:
+                os.replace(tmp_path, self._path(filename))
+                old = self._conn.execute(
+                    "SELECT size, filename FROM texts WHERE arxiv_id = ?", (arxiv_id,)
+                ).fetchone()
+                if old and old[1] != filename:
+                    self._remove_file(old[1])
+                self._conn.execute(
+                    """INSERT OR REPLACE INTO texts
+                       (arxiv_id, filename, codec, chunk_chars, offsets_json, text_chars,
+                        truncated, sections, size, created_at, last_access)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (arxiv_id, filename, self.codec, CHUNK_CHARS, json.dumps(offsets),
+                     len(text), int(truncated), packed_sections, size, now, now),
+                )
+                self._total_bytes += size - (old[0] if old else 0)
+                if self._total_bytes > self.max_bytes:
+                    self._evict(keep=arxiv_id)
+                self._conn.commit()
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def delete(self, arxiv_id: str) -> None:
+        """Drop one entry and its file."""
+        with self._lock:
+            self._drop(arxiv_id)
+
+    def _drop(self, arxiv_id: str) -> None:
+        """Caller holds the lock."""
+        row = self._conn.execute(
+            "SELECT filename, size FROM texts WHERE arxiv_id = ?", (arxiv_id,)
+        ).fetchone()
+        if row is None:
+            return
+        self._conn.execute("DELETE FROM texts WHERE arxiv_id = ?", (arxiv_id,))
+        self._conn.commit()
+        self._total_bytes -= row[1]
+        self._remove_file(row[0])
+
+    def _remove_file(self, filename: str) -> None:
+        try:
+            os.remove(self._path(filename))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """
+        Drop least-recently-used entries until under the target size.
+
+        The entry keep (the one just stored) is never evicted. Caller holds the lock.
+        """
+        target = int(self.max_bytes * _EVICT_TARGET_RATIO)
+        rows = self._conn.execute(
+            "SELECT arxiv_id, filename, size FROM texts WHERE arxiv_id != ? ORDER BY last_access ASC",
+            (keep,),
+        ).fetchall()
+        evicted = []
+        for arxiv_id, filename, size in rows:
+            if self._total_bytes <= target:
+                break
+            evicted.append((arxiv_id,))
+            self._total_bytes -= size
+            self._remove_file(filename)
+        self._conn.executemany("DELETE FROM texts WHERE arxiv_id = ?", evicted)
+        self.evictions += len(evicted)
+        logger.info(f"arXiv text cache: evicted {len(evicted)} entries ({self._total_bytes} bytes remain)")
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        total = self.hits + self.misses
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM texts").fetchone()[0]
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "codec": self.codec,
+        }
+
+
+# Process-wide registry so concurrent jobs share one store (and its counters) per directory
+_caches: Dict[str, ArxivTextCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_arxiv_text_cache(cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES) -> ArxivTextCache:
+    """Get the shared ArxivTextCache for cache_dir, creating it on first use."""
+    path = os.path.abspath(cache_dir or _DEFAULT_CACHE_DIR)
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = ArxivTextCache(path, max_bytes=max_bytes)
+            _caches[path] = cache
+            logger.info(f"arXiv text cache: {path} ({cache._total_bytes} bytes, {cache.codec})")
+        return cache
@@ -5,15 +5,15 @@ This is the only part that doesn't use Synalinks - it uses
 the native Gemini Interactions API for deep research.
 """
 
-import os
 import time
 import json
 import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from pathlib import Path
 
-from google import genai
+from ..rate_limit import acquire_quota
+from ..credentials import get_gemini_api_key, get_genai_client
 
 logger = logging.getLogger(__name__)
 
@@ -28,35 +28,46 @@ class DeepResearchClient:
         Initialize the client.
 
         Args:
-            api_key: Gemini API key. If not provided, uses GEMINI_API_KEY env var.
+            api_key: Gemini API key. If not provided, uses the current job's key
+                or the GEMINI_API_KEY env var.
         """
-        self.api_key = api_key or os.getenv("GEMINI_API_KEY")
+        self.api_key = api_key or get_gemini_api_key()
         if not self.api_key:
             raise ValueError(
                 "Gemini API key required. Set GEMINI_API_KEY env var or pass api_key."
             )
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = get_genai_client(self.api_key)
 
     async def research(
         self,
         query: str,
         timeout: int = 1800,
-        poll_interval: int = 10,
+        poll_interval: float = 5,
+        max_poll_interval: float = 60,
+        backoff: float = 1.5,
     ) -> str:
         """
         Run a deep research query and return the result.
 
+        The blocking SDK calls run in worker threads so the event loop (and the
+        API server) stays responsive. Polling starts at poll_interval and backs
+        off by `backoff` up to max_poll_interval, since research jobs take minutes.
+
         Args:
             query: The research question
             timeout: Maximum time to wait in seconds (default 30 min)
-            poll_interval: Seconds between status checks
+            poll_interval: Initial seconds between status checks
+            max_poll_interval: Upper bound on seconds between status checks
+            backoff: Multiplier applied to the interval after each poll
 
         Returns:
             The research output text
         """
         logger.info(f"Starting deep research: {query[:100]}...")
 
-        interaction = self.client.interactions.create(
+        await acquire_quota(self.AGENT)
+        interaction = await asyncio.to_thread(
+            self.client.interactions.create,
             input=query,
             agent=self.AGENT,
             background=True,
@@ -65,9 +76,10 @@ class DeepResearchClient:
         logger.info(f"Research job created: {interaction.id}")
 
         start_time = time.time()
+        interval = poll_interval
 
         while True:
-            interaction = self.client.interactions.get(interaction.id)
+            interaction = await asyncio.to_thread(self.client.interactions.get, interaction.id)
             elapsed = time.time() - start_time
 
             if interaction.status == "completed":
@@ -85,8 +97,9 @@ class DeepResearchClient:
                 logger.error(f"Research timed out after {timeout}s")
                 raise Exception(f"Deep research timed out after {timeout}s")
 
-            logger.debug(f"Status: {interaction.status} ({elapsed:.0f}s)")
-            await asyncio.sleep(poll_interval)
+            logger.debug(f"Status: {interaction.status} ({elapsed:.0f}s, next poll in {interval:.0f}s)")
+            await asyncio.sleep(min(interval, max(timeout - elapsed, 1)))
+            interval = min(interval * backoff, max_poll_interval)
 
     async def research_all(
         self,
@@ -136,6 +149,7 @@ class DeepResearchClient:
         queries: List[str],
         cache_dir: Optional[str] = None,
         max_concurrent: int = 3,
+        on_result: Optional[Callable[[str, str], None]] = None,
     ) -> Dict[str, str]:
         """
         Run multiple research queries in parallel.
@@ -144,6 +158,9 @@ class DeepResearchClient:
             queries: List of research questions
             cache_dir: Optional directory to cache results
             max_concurrent: Maximum concurrent requests
+            on_result: Optional callback invoked with (query key, result text)
+                as soon as each query finishes, so callers can start
+                processing it while the remaining queries are still running
 
         Returns:
             Dict mapping query index to result text
@@ -151,6 +168,12 @@ class DeepResearchClient:
         semaphore = asyncio.Semaphore(max_concurrent)
 
         async def run_with_semaphore(i: int, query: str) -> tuple:
+            key, result = await run_query(i, query)
+            if on_result:
+                on_result(key, result)
+            return key, result
+
+        async def run_query(i: int, query: str) -> tuple:
             async with semaphore:
                 cache_file = None
                 if cache_dir:
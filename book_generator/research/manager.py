@@ -2,24 +2,40 @@
 Research manager for providing context to pipeline stages.
 """
 
+import re
+import json
+import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
 
 import synalinks
 
+from ..utils import load_json_from_file, save_json_to_file
 from .models import FieldKnowledge
+from .retrieval import RetrievalIndex
 
 logger = logging.getLogger(__name__)
 
+# Memoized chapter/section contexts, stored in the run's research directory
+CONTEXT_CACHE_FILENAME = "research_contexts.json"
+
 
 class PaperQueryInput(synalinks.DataModel):
     """Input for paper relevance query."""
     query: str = synalinks.Field(description="The search query")
 
 
-class FrameworkQueryInput(synalinks.DataModel):
-    """Input for framework relevance query."""
+class RerankInput(synalinks.DataModel):
+    """Input for reranking retrieved candidates."""
     query: str = synalinks.Field(description="The search query")
+    candidates: str = synalinks.Field(description="Numbered list of candidate items")
+
+
+class RerankSelection(synalinks.DataModel):
+    """Output of a rerank call."""
+    selected_numbers: list[int] = synalinks.Field(
+        description="Numbers of the relevant candidates, most relevant first"
+    )
 
 
 class ChapterClassificationInput(synalinks.DataModel):
@@ -28,6 +44,11 @@ class ChapterClassificationInput(synalinks.DataModel):
     num_relevant_papers: int = synalinks.Field(description="Number of relevant papers found")
 
 
+def _normalize_title(title: str) -> str:
+    """Lowercase a title and collapse punctuation/whitespace for exact matching."""
+    return re.sub(r'[^a-z0-9]+', ' ', (title or "").lower()).strip()
+
+
 class ResearchManager:
     """
     Manages research data and provides context for pipeline stages.
@@ -36,24 +57,38 @@ class ResearchManager:
     and provides methods to retrieve relevant context for each stage
     of the book generation pipeline.
 
-    Uses synalinks.Decision for ALL matching operations. No keyword matching.
+    Paper and framework retrieval uses an in-memory BM25 index (optionally
+    blended with local embeddings) built once at construction, with an
+    optional single LLM rerank call. Title matching and chapter
+    classification use synalinks.Decision.
     """
 
-    def __init__(self, field_knowledge: FieldKnowledge, language_model: "synalinks.LanguageModel"):
+    def __init__(
+        self,
+        field_knowledge: FieldKnowledge,
+        language_model: "synalinks.LanguageModel",
+        embedding_model: Optional[str] = None,
+        llm_rerank: bool = False,
+        cache_dir: Optional[str] = None,
+    ):
         """
         Initialize the manager with parsed research.
 
         Args:
             field_knowledge: Structured research data (or dict)
             language_model: Language model for LLM-based matching (REQUIRED).
-                           All matching uses synalinks.Decision.
+            embedding_model: Optional sentence-transformers model name to blend
+                             embedding similarity into retrieval.
+            llm_rerank: Rerank retrieved candidates with one LLM call per query.
+            cache_dir: Optional directory (the run's research dir) to persist
+                       memoized chapter/section contexts for resumed runs.
 
         Raises:
             ValueError: If language_model is not provided.
         """
         if language_model is None:
             raise ValueError("ResearchManager requires a language_model for LLM-based matching. "
-                           "All matching operations use synalinks.Decision.")
+                           "Title matching and chapter classification use synalinks.Decision.")
 
         # Handle both FieldKnowledge objects and raw dicts
         if isinstance(field_knowledge, dict):
@@ -69,6 +104,24 @@ class ResearchManager:
         self.frameworks = self._data.get("frameworks", [])
 
         self.language_model = language_model
+        self.llm_rerank = llm_rerank
+
+        # Retrieval indexes (title/name weighted double)
+        self._paper_index = RetrievalIndex(
+            self.papers, ("title", "title", "problem", "method"), embedding_model=embedding_model
+        )
+        self._framework_index = RetrievalIndex(
+            self.frameworks, ("name", "name", "description", "approach", "use_cases"), embedding_model=embedding_model
+        )
+
+        # Memoized context builders: key -> context, plus in-flight builds shared by concurrent callers
+        self._cache_dir = cache_dir
+        self._context_cache: Dict[str, str] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        if cache_dir:
+            self._context_cache = load_json_from_file(cache_dir, CONTEXT_CACHE_FILENAME) or {}
+            if self._context_cache:
+                logger.info(f"Loaded {len(self._context_cache)} memoized research contexts")
 
     def for_vision(self) -> str:
         """
@@ -97,9 +150,39 @@ Key themes that should be covered in the book:
 Open problems and future directions to address:
 {open_problems}"""
 
+    async def _memoized(self, key: list, build: Callable[[], Awaitable[str]]) -> str:
+        """
+        Return the memoized context for key, building it at most once.
+
+        Concurrent callers with the same key await the same in-flight build.
+        Failed builds are not cached so the next caller retries.
+        """
+        cache_key = json.dumps(key, ensure_ascii=False)
+        if cache_key in self._context_cache:
+            return self._context_cache[cache_key]
+        if cache_key in self._inflight:
+            return await asyncio.shield(self._inflight[cache_key])
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            context = await build()
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        else:
+            future.set_result(context)
+            self._context_cache[cache_key] = context
+            if self._cache_dir:
+                save_json_to_file(self._cache_dir, CONTEXT_CACHE_FILENAME, self._context_cache)
+            return context
+        finally:
+            self._inflight.pop(cache_key, None)
+
     async def for_chapter_planning(self, chapter_title: str) -> str:
         """
-        Get context for planning a specific chapter.
+        Get context for planning a specific chapter (memoized per chapter).
 
         Args:
             chapter_title: The chapter title/topic
@@ -107,6 +190,12 @@ Open problems and future directions to address:
         Returns:
             Relevant paper briefs for this chapter
         """
+        return await self._memoized(
+            ["chapter_planning", chapter_title],
+            lambda: self._build_chapter_planning_context(chapter_title),
+        )
+
+    async def _build_chapter_planning_context(self, chapter_title: str) -> str:
         relevant_papers = await self._find_relevant_papers(chapter_title, top_k=10)
         relevant_frameworks = await self._find_relevant_frameworks(chapter_title, top_k=5)
 
@@ -129,7 +218,7 @@ Open problems and future directions to address:
 
     async def for_section_writing(self, chapter: str, section: str, assigned_papers: List[str] = None) -> str:
         """
-        Get context for writing a specific section.
+        Get context for writing a specific section (memoized per chapter, section and assigned papers).
 
         Args:
             chapter: The chapter title
@@ -140,6 +229,12 @@ Open problems and future directions to address:
         Returns:
             Full paper details for relevant papers
         """
+        return await self._memoized(
+            ["section_writing", chapter, section, list(assigned_papers or [])],
+            lambda: self._build_section_writing_context(chapter, section, assigned_papers),
+        )
+
+    async def _build_section_writing_context(self, chapter: str, section: str, assigned_papers: Optional[List[str]]) -> str:
         query = f"{chapter} {section}"
 
         if assigned_papers:
@@ -147,7 +242,7 @@ Open problems and future directions to address:
             relevant_papers = await self._filter_papers_by_titles(assigned_papers)
             logger.debug(f"Using {len(relevant_papers)} assigned papers for {chapter}")
         else:
-            # Find relevant papers using LLM
+            # Find relevant papers using the retrieval index
             relevant_papers = await self._find_relevant_papers(query, top_k=4)
 
         relevant_frameworks = await self._find_relevant_frameworks(query, top_k=3)
@@ -176,84 +271,35 @@ Open problems and future directions to address:
 
     async def _find_relevant_papers(self, query: str, top_k: int = 5) -> List[dict]:
         """
-        Find papers relevant to a query using synalinks.Decision.
+        Find papers relevant to a query using the retrieval index.
 
         Args:
             query: Search query
             top_k: Maximum papers to return
 
         Returns:
-            List of relevant papers (as dicts)
+            List of relevant papers (as dicts), most relevant first
         """
         if not self.papers:
             return []
 
-        # Build paper descriptions for Decision
-        paper_labels = []
-        paper_descriptions = []
-        for i, p in enumerate(self.papers):
-            title = p.get('title', f'Paper {i+1}')
-            paper_labels.append(title)
-            paper_descriptions.append(
-                f"{title} ({p.get('year', 'N/A')}): {p.get('problem', 'N/A')[:100]}"
-            )
-
-        papers_text = "\n".join(f"  {i+1}. {desc}" for i, desc in enumerate(paper_descriptions))
-
-        # Use Decision to select relevant papers (multi-select simulation via multiple calls)
-        selected_papers = []
-        remaining_papers = list(self.papers)
-        remaining_labels = list(paper_labels)
+        candidates = self._paper_index.search(query, top_k * 2 if self.llm_rerank else top_k)
+        if self.llm_rerank and len(candidates) > top_k:
+            descriptions = [
+                f"{self.papers[i].get('title', 'Unknown')} ({self.papers[i].get('year', 'N/A')}): "
+                f"{str(self.papers[i].get('problem', 'N/A'))[:100]}"
+                for i in candidates
+            ]
+            candidates = await self._rerank(query, candidates, descriptions, top_k)
 
-        for _ in range(min(top_k, len(self.papers))):
-            if not remaining_labels:
-                break
-
-            papers_list = "\n".join(
-                f"  {i+1}. {remaining_labels[i]} ({remaining_papers[i].get('year', 'N/A')})"
-                for i in range(len(remaining_labels))
-            )
-
-            try:
-                query_input = PaperQueryInput(query=query)
-                decision = await synalinks.Decision(
-                    question=f"""Which paper is MOST relevant to this query?
-
-QUERY: "{query}"
-
-AVAILABLE PAPERS:
-{papers_list}
-
-Select the single most relevant paper, or select "None relevant" if no papers match.""",
-                    labels=remaining_labels + ["None relevant"],
-                    language_model=self.language_model,
-                    temperature=1.0,
-                )(query_input)
-
-                if decision is None:
-                    break
-
-                selected_label = decision.get_json().get("label")
-                if selected_label and selected_label != "None relevant":
-                    # Find and add the selected paper
-                    for i, label in enumerate(remaining_labels):
-                        if label == selected_label:
-                            selected_papers.append(remaining_papers[i])
-                            # Remove from remaining
-                            remaining_labels.pop(i)
-                            remaining_papers.pop(i)
-                            break
-                else:
-                    break  # No more relevant papers
-            except Exception as e:
-                logger.warning(f"Paper selection failed: {e}")
-                break
-
-        return selected_papers
+        return [self.papers[i] for i in candidates[:top_k]]
 
     async def _filter_papers_by_titles(self, paper_titles: List[str]) -> List[dict]:
         """
-        Filter papers to only those matching the given titles using synalinks.Decision.
+        Filter papers to only those matching the given titles.
+
+        Exact (case/punctuation-insensitive) title matches are resolved locally;
+        synalinks.Decision is only used for titles that don't match exactly.
 
         Args:
             paper_titles: List of paper titles to filter by
@@ -266,8 +312,16 @@ Select the single most relevant paper, or select "None relevant" if no papers ma
 
         result = []
         all_paper_titles = [p.get('title', '') for p in self.papers]
+        normalized_titles = {_normalize_title(title): i for i, title in enumerate(all_paper_titles)}
 
         for query_title in paper_titles:
+            # Outline titles may carry a year suffix like "(2024)"
+            local_idx = normalized_titles.get(_normalize_title(re.sub(r'\(\d{4}\)\s*$', '', query_title)))
+            if local_idx is not None:
+                if self.papers[local_idx] not in result:
+                    result.append(self.papers[local_idx])
+                continue
+
             # Use Decision to find the best match
             papers_text = "\n".join(
                 f"  {i+1}. {title} ({self.papers[i].get('year', 'N/A')})"
@@ -306,71 +360,57 @@ Select the paper that best matches the query title. The query may include a year
 
     async def _find_relevant_frameworks(self, query: str, top_k: int = 3) -> List[dict]:
         """
-        Find frameworks relevant to a query using synalinks.Decision.
+        Find frameworks relevant to a query using the retrieval index.
 
         Args:
             query: Search query
             top_k: Maximum frameworks to return
 
         Returns:
-            List of relevant frameworks (as dicts)
+            List of relevant frameworks (as dicts), most relevant first
         """
         if not self.frameworks:
             return []
 
-        fw_labels = [fw.get('name', f'Framework {i+1}') for i, fw in enumerate(self.frameworks)]
-        fw_text = "\n".join(
-            f"  {i+1}. {fw.get('name', 'Unknown')}: {fw.get('description', 'N/A')[:80]}"
-            for i, fw in enumerate(self.frameworks)
-        )
-
-        selected_frameworks = []
-        remaining_fws = list(self.frameworks)
-        remaining_labels = list(fw_labels)
-
-        for _ in range(min(top_k, len(self.frameworks))):
-            if not remaining_labels:
-                break
-
-            fws_list = "\n".join(
-                f"  {i+1}. {remaining_labels[i]}: {remaining_fws[i].get('description', 'N/A')[:60]}"
-                for i in range(len(remaining_labels))
-            )
-
-            try:
-                query_input = FrameworkQueryInput(query=query)
-                decision = await synalinks.Decision(
-                    question=f"""Which framework/tool is MOST relevant to this query?
+        candidates = self._framework_index.search(query, top_k * 2 if self.llm_rerank else top_k)
+        if self.llm_rerank and len(candidates) > top_k:
+            descriptions = [
+                f"{self.frameworks[i].get('name', 'Unknown')}: "
+                f"{str(self.frameworks[i].get('description', 'N/A'))[:80]}"
+                for i in candidates
+            ]
+            candidates = await self._rerank(query, candidates, descriptions, top_k)
 
-QUERY: "{query}"
+        return [self.frameworks[i] for i in candidates[:top_k]]
 
-AVAILABLE FRAMEWORKS:
-{fws_list}
-
-Select the single most relevant framework, or select "None relevant" if none match.""",
-                    labels=remaining_labels + ["None relevant"],
-                    language_model=self.language_model,
-                    temperature=1.0,
-                )(query_input)
-
-                if decision is None:
-                    break
+    async def _rerank(self, query: str, candidates: List[int], descriptions: List[str], top_k: int) -> List[int]:
+        """
+        Rerank retrieved candidates with a single LLM call.
 
-                selected_label = decision.get_json().get("label")
-                if selected_label and selected_label != "None relevant":
-                    for i, label in enumerate(remaining_labels):
-                        if label == selected_label:
-                            selected_frameworks.append(remaining_fws[i])
-                            remaining_labels.pop(i)
-                            remaining_fws.pop(i)
-                            break
-                else:
-                    break
-            except Exception as e:
-                logger.warning(f"Framework selection failed: {e}")
-                break
+        Falls back to the retrieval order if the call fails or selects nothing valid.
+        """
+        candidates_text = "\n".join(f"  {i+1}. {desc}" for i, desc in enumerate(descriptions))
 
-        return selected_frameworks
+        try:
+            generator = synalinks.Generator(
+                data_model=RerankSelection,
+                language_model=self.language_model,
+                temperature=1.0,
+                instructions=f"""Select up to {top_k} candidates that are relevant to the query, most relevant first.
+Leave out candidates that are not relevant. Answer with candidate numbers only.""",
+            )
+            result = await generator(RerankInput(query=query, candidates=candidates_text))
+            if result is None:
+                return candidates
+
+            selected = []
+            for number in result.get_json().get("selected_numbers", []):
+                if isinstance(number, int) and 1 <= number <= len(candidates) and candidates[number - 1] not in selected:
+                    selected.append(candidates[number - 1])
+            return selected[:top_k] or candidates
+        except Exception as e:
+            logger.warning(f"Rerank failed, using retrieval order: {e}")
+            return candidates
 
     async def classify_chapter(self, chapter_title: str) -> str:
         """
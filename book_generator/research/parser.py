@@ -5,12 +5,14 @@ Uses Synalinks patterns (Branch, Generator, DataModel) for all logic.
 No regex, no keyword matching, no dirty hacks.
 """
 
+import asyncio
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import synalinks
 
 from .models import RawResearch, FieldKnowledge, Paper
+from ..utils import load_json_from_file, save_json_to_file
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +51,18 @@ class PaperCountEstimate(synalinks.DataModel):
     )
 
 
+class SummariesInput(synalinks.DataModel):
+    """Input for merging per-query research summaries."""
+    summaries: str = synalinks.Field(description="Summaries of the individual research queries")
+
+
+class MergedSummary(synalinks.DataModel):
+    """Single field summary synthesized from per-query summaries."""
+    summary: str = synalinks.Field(
+        description="2-3 paragraph overview of the current state of the field"
+    )
+
+
 class MissingPapersInput(synalinks.DataModel):
     """Input for extracting missing papers."""
     original_text: str = synalinks.Field(description="The original research text")
@@ -126,6 +140,15 @@ Find and extract papers that:
 Only extract NEW papers not in the already-extracted list."""
 
 
+MERGE_SUMMARY_INSTRUCTIONS = """Merge these research summaries into ONE overview of the field.
+
+Each summary covers the results of a different research query on the same field.
+- Write 2-3 paragraphs capturing the current state of the field
+- Focus on what's new, what's changing, and where things are heading
+- Keep the important specifics from every summary, drop repetition
+- Make it useful for someone writing a book about this topic"""
+
+
 ESTIMATE_INSTRUCTIONS = """Estimate how many distinct papers are mentioned in this research text.
 
 Count carefully:
@@ -481,6 +504,188 @@ async def parse_research(
     return FieldKnowledge(**final_data)
 
 
+# =============================================================================
+# Streaming Parsing
+# =============================================================================
+
+def _dedupe_strings(items: List[str]) -> List[str]:
+    """Drop exact (case-insensitive) repeats, keeping first-seen order."""
+    seen = set()
+    result = []
+    for item in items:
+        key = item.lower().strip()
+        if key and key not in seen:
+            seen.add(key)
+            result.append(item)
+    return result
+
+
+def _dedupe_records(records: List[dict], key_field: str) -> List[dict]:
+    """Drop records whose key_field exactly repeats an earlier one (case-insensitive)."""
+    seen = set()
+    result = []
+    for record in records:
+        key = (record.get(key_field) or '').lower().strip()
+        if key and key in seen:
+            continue
+        seen.add(key)
+        result.append(record)
+    return result
+
+
+async def parse_single_research(
+    name: str,
+    text: str,
+    language_model: synalinks.LanguageModel,
+) -> Optional[dict]:
+    """
+    Parse the output of one research query into partial FieldKnowledge data.
+
+    Runs the same overview extraction and paper quality loop as
+    parse_research, scoped to a single query's text. Author enrichment
+    is left to the final merge.
+
+    Returns:
+        FieldKnowledge-shaped dict, or None if the overview extraction failed
+    """
+    logger.info(f"[QA] Parsing {name} ({len(text)} chars)...")
+    overview_program = await build_overview_program(language_model)
+    overview_result, papers = await asyncio.gather(
+        overview_program(RawResearch(research_text=f"=== {name} ===\n\n{text}")),
+        extract_papers_with_quality_loop(text, language_model),
+    )
+
+    if overview_result is None:
+        logger.error(f"[QA] Overview extraction failed for {name}")
+        return None
+
+    overview_data = overview_result.get_json()
+    logger.info(f"[QA] {name}: {len(papers)} papers, "
+                f"{len(overview_data.get('themes', []))} themes, "
+                f"{len(overview_data.get('frameworks', []))} frameworks")
+
+    return {
+        'summary': overview_data.get('summary', ''),
+        'themes': overview_data.get('themes', []),
+        'papers': papers,
+        'frameworks': overview_data.get('frameworks', []),
+        'open_problems': overview_data.get('open_problems', []),
+    }
+
+
+class IncrementalResearchParser:
+    """
+    Parses deep research results as they arrive and merges them at the end.
+
+    Pass submit() as the on_result callback of
+    DeepResearchClient.research_all_parallel: each query's text starts
+    parsing immediately, overlapping with the queries still running.
+    finalize() waits for the outstanding parses and merges the partial
+    knowledge in query order, so the result does not depend on which
+    query finished first.
+
+    Args:
+        language_model: The language model to use
+        cache_dir: Optional directory for per-query parse results
+            (parsed_query_<key>.json), reused on later runs
+    """
+
+    def __init__(self, language_model: synalinks.LanguageModel, cache_dir: Optional[str] = None):
+        self.language_model = language_model
+        self.cache_dir = cache_dir
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def submit(self, name: str, text: str) -> None:
+        """Start parsing one query result in the background."""
+        if text.startswith("ERROR:") or name in self._tasks:
+            return
+        self._tasks[name] = asyncio.create_task(self._parse(name, text))
+
+    async def _parse(self, name: str, text: str) -> Optional[dict]:
+        filename = f"parsed_{name}.json"
+        if self.cache_dir:
+            cached = load_json_from_file(self.cache_dir, filename)
+            if cached:
+                logger.info(f"[QA] Loaded cached parse for {name}")
+                return cached
+
+        try:
+            partial = await parse_single_research(name, text, self.language_model)
+        except Exception as e:
+            logger.error(f"[QA] Parsing {name} failed: {e}")
+            return None
+
+        if partial and self.cache_dir:
+            save_json_to_file(self.cache_dir, filename, partial)
+        return partial
+
+    async def finalize(self, query_order: Optional[List[str]] = None) -> FieldKnowledge:
+        """
+        Wait for all submitted parses and merge them into one FieldKnowledge.
+
+        Args:
+            query_order: Query keys in merge order (defaults to submission order)
+
+        Returns:
+            Merged FieldKnowledge
+        """
+        names = [n for n in (query_order or list(self._tasks)) if n in self._tasks]
+        partials = await asyncio.gather(*(self._tasks[n] for n in names))
+        partials = [p for p in partials if p]
+
+        if not partials:
+            logger.error("[QA] No research results could be parsed")
+            return FieldKnowledge(
+                summary="Research parsing failed.",
+                themes=[],
+                papers=[],
+                frameworks=[],
+                open_problems=[],
+            )
+
+        summaries = [p['summary'] for p in partials if p.get('summary')]
+        summary = summaries[0] if summaries else ''
+        if len(summaries) > 1:
+            summary = await self._merge_summaries(summaries) or "\n\n".join(summaries)
+
+        papers = _dedupe_records([paper for p in partials for paper in p.get('papers', [])], 'title')
+        final_data = {
+            'summary': summary,
+            'themes': _dedupe_strings([t for p in partials for t in p.get('themes', [])]),
+            'papers': papers,
+            'frameworks': _dedupe_records([f for p in partials for f in p.get('frameworks', [])], 'name'),
+            'open_problems': _dedupe_strings([o for p in partials for o in p.get('open_problems', [])]),
+        }
+
+        logger.info(f"[QA] ═══════════════════════════════════════════════════")
+        logger.info(f"[QA] STREAMING PARSE MERGED ({len(partials)} queries)")
+        logger.info(f"[QA]   Papers: {len(final_data['papers'])}")
+        logger.info(f"[QA]   Themes: {len(final_data['themes'])}")
+        logger.info(f"[QA]   Frameworks: {len(final_data['frameworks'])}")
+        logger.info(f"[QA]   Open Problems: {len(final_data['open_problems'])}")
+        logger.info(f"[QA] ═══════════════════════════════════════════════════")
+
+        logger.info("[QA] Enriching papers with missing authors from arXiv...")
+        final_data['papers'] = await enrich_paper_authors(papers)
+
+        return FieldKnowledge(**final_data)
+
+    async def _merge_summaries(self, summaries: List[str]) -> Optional[str]:
+        generator = synalinks.Generator(
+            data_model=MergedSummary,
+            language_model=self.language_model,
+            instructions=MERGE_SUMMARY_INSTRUCTIONS,
+            temperature=1.0,
+        )
+        result = await generator(SummariesInput(
+            summaries="\n\n---\n\n".join(summaries),
+        ))
+        if result is None:
+            logger.warning("[QA] Summary merge failed, concatenating summaries")
+            return None
+        return result.get_json().get('summary')
+
+
 async def enrich_paper_authors(papers: List[dict]) -> List[dict]:
     """
     Enrich papers that have missing authors by looking them up on arXiv.
@@ -494,7 +699,7 @@ async def enrich_paper_authors(papers: List[dict]) -> List[dict]:
     Returns:
         Papers with enriched author information
     """
-    from .arxiv_fetcher import search_arxiv
+    from .arxiv_fetcher import search_arxiv, find_cached_paper_by_title
 
     BAD_AUTHORS = {"not specified", "unknown", "n/a", "none", ""}
 
@@ -511,8 +716,9 @@ async def enrich_paper_authors(papers: List[dict]) -> List[dict]:
             logger.debug(f"[arXiv] Looking up authors for: {title[:50]}...")
 
             try:
-                # Search arXiv by title
-                results = await search_arxiv(title, max_results=3)
+                # Search arXiv by title (papers seen before come from the metadata cache)
+                cached = find_cached_paper_by_title(title)
+                results = [cached] if cached else await search_arxiv(title, max_results=3)
 
                 if results:
                     # Use the first (most relevant) result
@@ -0,0 +1,124 @@
+"""
+In-memory retrieval over research papers and frameworks.
+
+BM25 over selected text fields, optionally blended with local sentence
+embeddings (sentence-transformers). Built once per ResearchManager and
+answers top-k queries in milliseconds without any LLM calls.
+"""
+
+import re
+import math
+import logging
+from collections import Counter
+from typing import List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how",
+    "in", "into", "is", "it", "its", "of", "on", "or", "that", "the", "this",
+    "to", "via", "what", "when", "which", "with", "without",
+}
+
+# Weight of the embedding similarity when blended with normalized BM25
+_EMBEDDING_WEIGHT = 0.5
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, without stopwords and bare numbers."""
+    return [
+        t for t in _TOKEN_RE.findall((text or "").lower())
+        if t not in _STOPWORDS and not t.isdigit()
+    ]
+
+
+class BM25Index:
+    """Okapi BM25 over a fixed list of documents."""
+
+    def __init__(self, documents: List[str], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.doc_terms = [Counter(tokenize(doc)) for doc in documents]
+        self.doc_lens = [sum(terms.values()) for terms in self.doc_terms]
+        self.avg_len = (sum(self.doc_lens) / len(self.doc_lens)) if self.doc_lens else 0.0
+
+        doc_freq = Counter()
+        for terms in self.doc_terms:
+            doc_freq.update(terms.keys())
+        n_docs = len(self.doc_terms)
+        self.idf = {
+            term: math.log(1 + (n_docs - freq + 0.5) / (freq + 0.5))
+            for term, freq in doc_freq.items()
+        }
+
+    def scores(self, query: str) -> List[float]:
+        """BM25 score of every document for the query (0.0 = no shared terms)."""
+        query_terms = set(tokenize(query))
+        results = []
+        for terms, doc_len in zip(self.doc_terms, self.doc_lens):
+            score = 0.0
+            norm = self.k1 * (1 - self.b + self.b * doc_len / self.avg_len) if self.avg_len else self.k1
+            for term in query_terms:
+                tf = terms.get(term)
+                if tf:
+                    score += self.idf[term] * tf * (self.k1 + 1) / (tf + norm)
+            results.append(score)
+        return results
+
+
+class RetrievalIndex:
+    """
+    Top-k retrieval over a list of dicts (papers or frameworks).
+
+    Args:
+        items: The records to index
+        fields: Keys whose text is indexed. Repeat a key to weight it higher
+            (e.g. ("title", "title", "problem", "method")).
+        embedding_model: Optional sentence-transformers model name. When set
+            and the library is installed, cosine similarity is blended with BM25.
+    """
+
+    def __init__(self, items: List[dict], fields: Sequence[str], embedding_model: Optional[str] = None):
+        self.items = items
+        texts = [" ".join(str(item.get(f) or "") for f in fields) for item in items]
+        self.bm25 = BM25Index(texts)
+        self._encoder = None
+        self._embeddings = None
+
+        if embedding_model and items:
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._encoder = SentenceTransformer(embedding_model)
+                self._embeddings = self._encoder.encode(texts, normalize_embeddings=True)
+                logger.info(f"Embedded {len(items)} research records with {embedding_model}")
+            except ImportError:
+                logger.warning("sentence-transformers not installed - using BM25 only")
+            except Exception as e:
+                logger.warning(f"Embedding index failed ({e}) - using BM25 only")
+
+    def search(self, query: str, top_k: int) -> List[int]:
+        """Indices of the top_k most relevant items, best first. Items with no relevance are dropped."""
+        if not self.items or top_k <= 0:
+            return []
+
+        scores = self.bm25.scores(query)
+        best = max(scores) if scores else 0.0
+        if best > 0:
+            scores = [s / best for s in scores]
+
+        if self._embeddings is not None:
+            query_vec = self._encoder.encode([query], normalize_embeddings=True)[0]
+            similarities = self._embeddings @ query_vec
+            scores = [
+                (1 - _EMBEDDING_WEIGHT) * s + _EMBEDDING_WEIGHT * max(float(sim), 0.0)
+                for s, sim in zip(scores, similarities)
+            ]
+
+        ranked = sorted(
+            (i for i, s in enumerate(scores) if s > 0),
+            key=lambda i: scores[i],
+            reverse=True,
+        )
+        return ranked[:top_k]
@@ -15,6 +15,7 @@ mcp-graphiti MCP Tools (actual names with graphiti_ prefix):
 - graphiti_get_episodes: Retrieve recent episodes
 """
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -903,7 +904,7 @@ class Stage2MCPPipeline:
         self,
         papers: List[dict],
         wait_for_facts: bool = True,
-        cache_dir: str = "/tmp/arxiv_cache",
+        cache_dir: Optional[str] = None,
         download_pdfs: bool = True,
         gemini_model: str = "gemini/gemini-3-flash-preview",
     ) -> dict:
@@ -921,7 +922,7 @@ class Stage2MCPPipeline:
         Args:
             papers: List of paper dicts from ResearchManager (Stage 1)
             wait_for_facts: Whether to wait for Graphiti to extract facts
-            cache_dir: Directory to cache arXiv PDFs
+            cache_dir: arXiv text cache directory (default: shared cache in data/arxiv_text)
             download_pdfs: Whether to download and extract full text (recommended)
             gemini_model: Gemini model for Google Search grounding
 
@@ -931,7 +932,7 @@ class Stage2MCPPipeline:
         from .arxiv_fetcher import (
             search_arxiv_with_gemini,
             batch_search_arxiv_with_gemini,
-            search_arxiv_by_id,
+            fetch_arxiv_papers_by_ids,
             download_and_extract_pdf,
         )
 
@@ -954,6 +955,27 @@ class Stage2MCPPipeline:
 
         logger.info(f"[KG] Step 2: Fetching paper details and full text from arXiv")
 
+        # Resolve all found IDs together (metadata cache, then batched id_list queries)
+        arxiv_papers = await fetch_arxiv_papers_by_ids(
+            [arxiv_id for arxiv_id in arxiv_id_map.values() if arxiv_id]
+        )
+
+        # Extract all full texts concurrently; extraction runs in worker
+        # processes, so this scales with cores instead of paper count
+        full_texts = {}
+        if download_pdfs:
+            # Downloads are paced process-wide inside download_and_extract_pdf
+            found_papers = [p for p in arxiv_papers.values() if p]
+            extracted = await asyncio.gather(
+                *(download_and_extract_pdf(p, cache_dir, max_chars=50000) for p in found_papers),
+                return_exceptions=True,
+            )
+            for arxiv_paper, result in zip(found_papers, extracted):
+                if isinstance(result, Exception):
+                    logger.warning(f"[KG]   PDF extraction failed for {arxiv_paper.arxiv_id}: {result}")
+                else:
+                    full_texts[arxiv_paper.arxiv_id] = result.full_text
+
         processed = 0
         failed = 0
         arxiv_found = 0
@@ -973,8 +995,8 @@ class Stage2MCPPipeline:
                 if arxiv_id:
                     logger.info(f"[KG]   → arXiv ID: {arxiv_id}")
 
-                    # Fetch paper details by ID
-                    arxiv_paper = await search_arxiv_by_id(arxiv_id)
+                    # Paper details fetched in the batch above
+                    arxiv_paper = arxiv_papers.get(arxiv_id)
 
                     if arxiv_paper:
                         arxiv_found += 1
@@ -988,18 +1010,10 @@ class Stage2MCPPipeline:
                         paper['venue'] = f"arXiv:{arxiv_paper.arxiv_id}"
                         paper['abstract'] = arxiv_paper.abstract
 
-                        # Download and extract full text if requested
-                        full_text = ""
-                        if download_pdfs:
-                            try:
-                                arxiv_paper = await download_and_extract_pdf(
-                                    arxiv_paper, cache_dir, max_chars=50000
-                                )
-                                full_text = arxiv_paper.full_text
-                                if full_text:
-                                    logger.info(f"[KG]   ✓ Extracted {len(full_text)} chars from PDF")
-                            except Exception as e:
-                                logger.warning(f"[KG]   PDF extraction failed: {e}")
+                        # Full text extracted above (if requested)
+                        full_text = full_texts.get(arxiv_paper.arxiv_id, "")
+                        if full_text:
+                            logger.info(f"[KG]   ✓ Extracted {len(full_text)} chars from PDF")
 
                         # Add to Graphiti WITH full text
                         result = await self.add_paper(paper, full_text=full_text)
@@ -1187,16 +1201,16 @@ class Stage2ArxivFallback:
     Provides the same interface as Stage2MCPPipeline for compatibility.
     """
 
-    def __init__(self, research_manager=None, cache_dir: str = None):
+    def __init__(self, research_manager=None, cache_dir: Optional[str] = None):
         """
         Initialize the fallback.
 
         Args:
             research_manager: ResearchManager with Stage 1 papers
-            cache_dir: Directory for arXiv cache
+            cache_dir: arXiv text cache directory (default: shared cache)
         """
         self.research_manager = research_manager
-        self.cache_dir = cache_dir or "/tmp/arxiv_cache"
+        self.cache_dir = cache_dir
         self.connected = True  # Always "connected" for interface compatibility
         self._arxiv_papers: Dict[str, dict] = {}
         logger.info("[KG-Fallback] Using arXiv fallback (no knowledge graph)")
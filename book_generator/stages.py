@@ -0,0 +1,183 @@
+"""
+Stage-level DAG scheduler for the generation pipeline.
+
+Pipeline stages are declared with the names of the stages whose outputs
+they consume. The scheduler starts every stage as soon as all of its
+inputs are available, so independent stages (e.g. the cover, the
+introduction and the chapter text) run concurrently instead of
+back-to-back. Each stage receives the outputs of all finished stages
+and its return value becomes its own output.
+
+Start and end times of every stage are recorded for profiling.
+"""
+
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Stage:
+    """
+    One node of the pipeline DAG.
+
+    Args:
+        name: Unique stage name; its return value is stored under this key
+        run: Coroutine function run(outputs) -> output, where outputs maps
+            finished stage names to their results
+        after: Names of the stages whose outputs this stage needs
+    """
+    name: str
+    run: Callable[[Dict[str, Any]], Awaitable[Any]]
+    after: Sequence[str] = field(default_factory=tuple)
+
+
+@dataclass
+class StageTiming:
+    """Wall-clock span of one stage run."""
+    name: str
+    started_at: str
+    ended_at: str
+    seconds: float
+    status: str  # "ok", "failed" or "cancelled"
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
+            "seconds": round(self.seconds, 3),
+            "status": self.status,
+        }
+
+
+class StageTimeline:
+    """
+    Timings for stages run in sequence outside the scheduler.
+
+    begin(name) closes the previous stage (if any) and opens the next one;
+    end() closes the current stage. Pass .timings to run_stages() to
+    collect scheduled stages in the same list.
+    """
+
+    def __init__(self):
+        self.timings: List[StageTiming] = []
+        self._current = None
+
+    def begin(self, name: str) -> None:
+        self.end()
+        self._current = (name, time.monotonic(), datetime.now().isoformat())
+
+    def end(self, status: str = "ok") -> None:
+        if self._current is None:
+            return
+        name, start, started_at = self._current
+        self._current = None
+        self.timings.append(StageTiming(
+            name, started_at, datetime.now().isoformat(), time.monotonic() - start, status,
+        ))
+
+    def to_list(self) -> List[dict]:
+        return [t.to_dict() for t in self.timings]
+
+
+def validate_stages(stages: Sequence[Stage], available: Sequence[str] = ()) -> None:
+    """
+    Check that stage names are unique, every input is declared and there are no cycles.
+
+    Raises:
+        ValueError: If the graph is not a valid DAG
+    """
+    names = [s.name for s in stages]
+    duplicates = {n for n in names if names.count(n) > 1}
+    if duplicates:
+        raise ValueError(f"Duplicate stage names: {sorted(duplicates)}")
+
+    known = set(names) | set(available)
+    for stage in stages:
+        missing = [d for d in stage.after if d not in known]
+        if missing:
+            raise ValueError(f"Stage '{stage.name}' depends on unknown stage(s): {missing}")
+
+    # Kahn's algorithm: anything left unvisited is on a cycle
+    remaining = {s.name: set(s.after) - set(available) for s in stages}
+    while True:
+        ready = [n for n, deps in remaining.items() if not deps]
+        if not ready:
+            break
+        for n in ready:
+            del remaining[n]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    if remaining:
+        raise ValueError(f"Stage dependency cycle among: {sorted(remaining)}")
+
+
+async def run_stages(
+    stages: Sequence[Stage],
+    outputs: Dict[str, Any] = None,
+    timings: List[StageTiming] = None,
+) -> Dict[str, Any]:
+    """
+    Run stages as their inputs become ready.
+
+    Args:
+        stages: The stages to run
+        outputs: Results already available (e.g. from earlier pipeline steps);
+            stages may depend on these names. Updated in place.
+        timings: Optional list that receives one StageTiming per stage run
+
+    Returns:
+        The outputs dict, including every stage's result
+
+    If a stage raises, the stages still running are cancelled and the
+    exception propagates.
+    """
+    outputs = {} if outputs is None else outputs
+    validate_stages(stages, available=list(outputs))
+
+    pending = {s.name: s for s in stages}
+    running: Dict[asyncio.Task, Stage] = {}
+
+    async def timed(stage: Stage):
+        start = time.monotonic()
+        started_at = datetime.now().isoformat()
+        logger.info(f"[stage] {stage.name} started")
+        status = "failed"
+        try:
+            result = await stage.run(outputs)
+            status = "ok"
+            return result
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        finally:
+            elapsed = time.monotonic() - start
+            if timings is not None:
+                timings.append(StageTiming(
+                    stage.name, started_at, datetime.now().isoformat(), elapsed, status,
+                ))
+            logger.info(f"[stage] {stage.name} {'finished' if status == 'ok' else status} in {elapsed:.1f}s")
+
+    try:
+        while pending or running:
+            for name in [n for n, s in pending.items() if all(d in outputs for d in s.after)]:
+                stage = pending.pop(name)
+                running[asyncio.create_task(timed(stage))] = stage
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                stage = running.pop(task)
+                outputs[stage.name] = task.result()  # re-raises a stage failure
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    return outputs
@@ -12,7 +12,6 @@ export interface JobStatusResponse {
     | "planning"
     | "writing_content"
     | "generating_illustrations"
-    | "generating_cover"
     | "assembling_pdf"
     | "completed"
     | "failed";
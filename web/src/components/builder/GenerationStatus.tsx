@@ -150,7 +150,7 @@ function InProgressState({
       </div>
 
       {/* Stage indicators */}
-      <div className="grid grid-cols-9 gap-1 text-xs text-slate-400">
+      <div className="grid grid-cols-8 gap-1 text-xs text-slate-400">
         {PIPELINE_STAGES.map((stage) => {
           const currentIdx = STAGE_ORDER.indexOf(jobStatus?.status || "");
           const stageIdx = STAGE_ORDER.indexOf(stage.key);
@@ -94,7 +94,6 @@ export const STATUS_MESSAGES: Record<string, { stage: string; description: strin
   quality_review: { stage: "Quality Review", description: "Reviewing plans for coherence and completeness..." },
   writing_content: { stage: "Writing", description: "Synthesizing content tailored to your background..." },
   generating_illustrations: { stage: "Illustrating", description: "Creating diagrams and visualizations..." },
-  generating_cover: { stage: "Cover", description: "Designing your book cover..." },
   assembling_pdf: { stage: "Assembly", description: "Assembling the final PDF..." },
   completed: { stage: "Complete", description: "Your book is ready!" },
   failed: { stage: "Failed", description: "Something went wrong." },
@@ -108,14 +107,13 @@ export const PIPELINE_STAGES = [
   { key: "quality_review", label: "QA" },
   { key: "writing_content", label: "Writing" },
   { key: "generating_illustrations", label: "Illustrate" },
-  { key: "generating_cover", label: "Cover" },
   { key: "assembling_pdf", label: "Assembly" },
 ];
 
 export const STAGE_ORDER = [
   "pending", "researching", "generating_vision", "generating_outline",
   "planning", "quality_review", "writing_content",
-  "generating_illustrations", "generating_cover", "assembling_pdf",
+  "generating_illustrations", "assembling_pdf",
 ];
 
 export const STEP_INFO = [